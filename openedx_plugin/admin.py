@@ -8,7 +8,7 @@ date:           dec-2022
 usage:          register the custom Django models in LMS Django Admin
 """
 from django.contrib import admin
-from .models import Configuration, Locale, MarketingSites
+from .models import Configuration, EventOutbox, Locale, MarketingSites
 
 
 class MarketingSitesAdmin(admin.ModelAdmin):
@@ -23,6 +23,13 @@ class ConfigurationAdmin(admin.ModelAdmin):
     list_display = [f.name for f in Configuration._meta.get_fields()]
 
 
+class EventOutboxAdmin(admin.ModelAdmin):
+    list_display = ["id", "event_type", "created", "attempts", "delivered_at", "last_error"]
+    list_filter = ["event_type"]
+    ordering = ["-id"]
+
+
 admin.site.register(MarketingSites, MarketingSitesAdmin)
 admin.site.register(Locale, LocaleAdmin)
 admin.site.register(Configuration, ConfigurationAdmin)
+admin.site.register(EventOutbox, EventOutboxAdmin)
@@ -10,11 +10,10 @@ usage:      implements a simple REST API using Django RestFramework
 from rest_framework.routers import DefaultRouter
 from openedx_plugin.api.views import ConfigurationViewSet
 
+from openedx_plugin_common.switch_cache import gate_urlpatterns
 from ..waffle import waffle_switches, SIMPLE_REST_API
 
-urlpatterns = []
+router = DefaultRouter(trailing_slash=False)
+router.register("api/v1/configuration", ConfigurationViewSet)
 
-if waffle_switches[SIMPLE_REST_API]:
-    router = DefaultRouter(trailing_slash=False)
-    router.register("api/v1/configuration", ConfigurationViewSet)
-    urlpatterns += router.urls
+urlpatterns = gate_urlpatterns(router.urls, waffle_switches, SIMPLE_REST_API)
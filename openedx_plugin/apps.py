@@ -139,8 +139,14 @@ class CustomPluginConfig(AppConfig):
             return
 
         from . import signals  # pylint: disable=unused-import
+        from .outbox import tasks  # pylint: disable=unused-import
+        from .dashboard import tasks as dashboard_tasks  # pylint: disable=unused-import
         from .__about__ import __version__
-        from .waffle import waffle_init
+        from .waffle import waffle_switches, WAFFLE_NAMESPACE
+        from django.core import checks
+        from openedx_plugin_common.switch_cache import connect_switch_invalidation, switch_check
+        from .locale.cache import connect_locale_invalidation
+        from .dashboard.utils import connect_language_preference_invalidation
         from .utils import PluginJSONEncoder
 
         log.info("{label} {version} is ready.".format(label=self.label, version=__version__))
@@ -150,5 +156,8 @@ class CustomPluginConfig(AppConfig):
                 signals=json.dumps(OPENEDX_SIGNALS, cls=PluginJSONEncoder, indent=4),
             )
         )
-        waffle_init()
+        connect_switch_invalidation()
+        connect_locale_invalidation()
+        connect_language_preference_invalidation()
+        checks.register(switch_check(waffle_switches, WAFFLE_NAMESPACE, "lms"))
         IS_READY = True
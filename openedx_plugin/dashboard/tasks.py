@@ -0,0 +1,69 @@
+# coding=utf-8
+"""
+written by: Lawrence McDaniel
+            https://lawrencemcdaniel.com
+
+date:       jul-2023
+
+usage:      enrollment for the student_dashboard entry point, either inline
+            or queued to Celery.
+"""
+import logging
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+try:
+    # mcdaniel aug-2022: deprecated sometime after Lilac.
+    # see: https://docs.celeryq.dev/en/stable/internals/deprecation.html
+    from celery.task import task
+except ImportError:
+    from celery import shared_task as task
+
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.student.models import CourseEnrollment
+
+log = logging.getLogger(__name__)
+User = get_user_model()
+
+# a CTA link that is clicked twice, or a login redirect that replays the
+# request, should only attempt the enrollment once.
+ENROLLMENT_LOCK_TTL = 60
+ENROLLMENT_LOCK_CACHE_KEY = "openedx_plugin.dashboard.enroll.{user_id}.{course_key}"
+
+
+def enrollment_lock_key(user_id: int, course_key) -> str:
+    return ENROLLMENT_LOCK_CACHE_KEY.format(user_id=user_id, course_key=course_key)
+
+
+def enroll(user, course_key: CourseKey) -> bool:
+    """
+    enroll user in course_key unless they are already enrolled. returns
+    True if a new enrollment was created.
+    """
+    if CourseEnrollment.is_enrolled(user, course_key=course_key):
+        log.info(
+            "student_dashboard() user {username} is already enrolled in course {course_key}.".format(
+                username=user.username, course_key=course_key
+            )
+        )
+        return False
+
+    CourseEnrollment.enroll(user, course_key=course_key)
+    return True
+
+
+@task(name="openedx_plugin.dashboard.tasks.enroll_user", ignore_result=True)
+def enroll_user(user_id: int, course_id: str) -> None:
+    """
+    queued version of enroll(), for OPENEDX_PLUGIN_DASHBOARD["QUEUED_ENROLLMENT"]
+    """
+    try:
+        user = User.objects.get(id=user_id)
+        enroll(user, CourseKey.from_string(course_id))
+    except User.DoesNotExist:
+        log.warning("enroll_user() user_id {user_id} does not exist.".format(user_id=user_id))
+    except Exception:  # noqa: B902
+        # release the lock so that the user can retry straight away.
+        cache.delete(enrollment_lock_key(user_id, course_id))
+        raise
@@ -10,97 +10,129 @@ usage:      enables http request parameters
             - enroll: an escaped Open edX CourseKey string representation
 """
 import logging
-from django.conf import settings
 from urllib.parse import urlparse
 
-from openedx.core.djangoapps.lang_pref.api import (
-    get_closest_released_language,
-    released_languages,
-)
+from django.core.cache import cache
+
 from openedx.core.djangoapps.lang_pref import LANGUAGE_KEY
 from openedx.core.djangoapps.user_api.preferences.api import (
     get_user_preference,
     set_user_preference,
 )
 
+from openedx_plugin.locale.cache import closest_released_language
+
 log = logging.getLogger(__name__)
 
+# each user's saved language preference, "" for none, shared by all
+# processes. invalidated whenever the preference is saved or deleted.
+LANGUAGE_PREFERENCE_CACHE_TTL = 60 * 60
+LANGUAGE_PREFERENCE_CACHE_KEY = "openedx_plugin.dashboard.language_preference.{user_id}"
 
-def set_language_preference(request):
+
+def requested_language(request):
     """
-    Preemptively set a language code preference based on
+    the released language implied by the request, if any:
     1.) a language param that might be passed in the http request
-    2.) the 2-character subdomain of the referer. example example.org == 'mx'
+    2.) the 2-character subdomain of the referer. example mx.example.org == 'mx'
     """
-    if not request.user or not request.user.is_authenticated:
-        log.info("set_language_preference() - anonymous user, exiting.")
-        return None
-
     language_param = request.GET.get("language")
     if language_param:
-        log.info(
-            "set_language_preference() found language url param of            "
-            " {language_param} in the request object".format(language_param=language_param)
-        )
-
-    preferred_language = get_user_preference(request.user, LANGUAGE_KEY)
-    if preferred_language:
-        log.info(
-            "set_language_preference() found an existing saved language            "
-            " preference for user {username} of {preferred_language}.            "
-            " Ignoring url param.".format(username=request.user.username, preferred_language=preferred_language)
-        )
-        return None
-    else:
-        log.info(
-            "set_language_preference() no language preference set for user            "
-            " {username}".format(username=request.user.username)
-        )
-
-    languages = released_languages()
-    log.info("set_language_preference() available languages are: {languages}".format(languages=languages))
-
-    # 2.) language code might be passed in as a parameter
-    if language_param:
-        closest_lang = get_closest_released_language(language_param)
-        if not closest_lang:
-            log.info("set_language_preference() no available language, exiting.")
-            return None
-        log.info(
-            "openedx_plugin.utils.set_language_preference() (2) detected            "
-            " language param={language_param}. closest installed={closest_lang}".format(
+        closest_lang = closest_released_language(language_param)
+        log.debug(
+            "requested_language() detected language param={language_param}. closest installed={closest_lang}".format(
                 language_param=language_param, closest_lang=closest_lang
             )
         )
-        set_user_preference(request.user, LANGUAGE_KEY, closest_lang)
-        return None
-    else:
-        log.info(
-            "set_language_preference() no language param found in the request          "
-            "   header for user {username}".format(username=request.user.username)
-        )
+        return closest_lang
 
-    # 3.) try infer a language preference from the referring host
-    referer = urlparse(request.META.get("HTTP_REFERER", "Direct"))
-    referer_domain = referer.netloc
-    log.info(
-        "set_language_preference() analyzing http referer {referer} with         domain"
-        " {domain}".format(referer=referer, domain=referer_domain)
-    )
+    referer_domain = urlparse(request.META.get("HTTP_REFERER", "Direct")).netloc
     if referer_domain and referer_domain[:2].lower() == "mx":
-        closest_lang = get_closest_released_language("es_MX")
-        if not closest_lang:
-            log.info("set_language_preference() no available language, quitting.")
-            return None
-        log.info(
-            "openedx_plugin.utils.set_language_preference() (3) detected            "
-            " referer_domain={referer_domain}. closest installed={closest_lang}".format(
+        closest_lang = closest_released_language("es_MX")
+        log.debug(
+            "requested_language() detected referer_domain={referer_domain}. closest installed={closest_lang}".format(
                 referer_domain=referer_domain, closest_lang=closest_lang
             )
         )
-        set_user_preference(request.user, LANGUAGE_KEY, closest_lang)
-        return None
+        return closest_lang
 
-    # 4.) defer to the language preference from openedx cookie
+    # 3.) defer to the language preference from openedx cookie
     # this case is taken care of by openedx.core.djangoapps.lang_pref.middleware.LanguagePreferenceMiddleware
     # cookie_lang_pref = request.COOKIES.get(settings.LANGUAGE_COOKIE, None)
+    return None
+
+
+def cached_language_preference(user) -> str:
+    """
+    the user's saved language preference, or "" if they have none, from the
+    cache when possible.
+    """
+    cache_key = LANGUAGE_PREFERENCE_CACHE_KEY.format(user_id=user.id)
+    preferred_language = cache.get(cache_key)
+    if preferred_language is None:
+        preferred_language = get_user_preference(user, LANGUAGE_KEY) or ""
+        cache.set(cache_key, preferred_language, LANGUAGE_PREFERENCE_CACHE_TTL)
+    return preferred_language
+
+
+def invalidate_language_preference(sender, instance, **kwargs):
+    """
+    post_save and post_delete receiver for UserPreference.
+    """
+    if instance.key == LANGUAGE_KEY:
+        cache.delete(LANGUAGE_PREFERENCE_CACHE_KEY.format(user_id=instance.user_id))
+
+
+def connect_language_preference_invalidation() -> None:
+    """
+    connect the invalidation receivers. Called from apps.ready().
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    from openedx.core.djangoapps.user_api.models import UserPreference
+
+    post_save.connect(
+        invalidate_language_preference,
+        sender=UserPreference,
+        dispatch_uid="openedx_plugin_language_preference_cache_save",
+    )
+    post_delete.connect(
+        invalidate_language_preference,
+        sender=UserPreference,
+        dispatch_uid="openedx_plugin_language_preference_cache_delete",
+    )
+
+
+def set_language_preference(request):
+    """
+    Preemptively set a language code preference, unless the user already
+    has one, based on requested_language().
+
+    Requests that don't imply a language cost nothing, and the saved
+    preference is read from the cache. The preference is only written for
+    users who have none, with set_user_preference() so that it is
+    validated and the preference changed signal is sent.
+    """
+    if not request.user or not request.user.is_authenticated:
+        log.debug("set_language_preference() - anonymous user, exiting.")
+        return None
+
+    closest_lang = requested_language(request)
+    if not closest_lang:
+        return None
+
+    preferred_language = cached_language_preference(request.user)
+    if preferred_language:
+        log.debug(
+            "set_language_preference() user {username} already has a language preference of {language}."
+            " Ignoring request.".format(username=request.user.username, language=preferred_language)
+        )
+        return None
+
+    set_user_preference(request.user, LANGUAGE_KEY, closest_lang)
+    log.info(
+        "set_language_preference() saved language preference {closest_lang} for user {username}".format(
+            closest_lang=closest_lang, username=request.user.username
+        )
+    )
+    return None
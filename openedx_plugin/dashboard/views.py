@@ -15,6 +15,8 @@ import logging
 from urllib.parse import urlparse
 
 # django stuff
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.contrib.auth.decorators import login_required
@@ -22,20 +24,57 @@ from django.views.decorators.csrf import ensure_csrf_cookie
 
 # open edx stuff
 from opaque_keys.edx.keys import CourseKey
-from common.djangoapps.student.models import CourseEnrollment
-
-try:
-    # for olive and later
-    from xmodule.modulestore.django import modulestore
-except ImportError:
-    # for backward compatibility with nutmeg and earlier
-    from common.lib.xmodule.xmodule.modulestore.django import modulestore
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 
 # our stuff
+from .tasks import ENROLLMENT_LOCK_TTL, enroll, enroll_user, enrollment_lock_key
 from .utils import set_language_preference
 
 log = logging.getLogger(__name__)
 
+DEFAULT_DASHBOARD_SETTINGS = {
+    # enroll from a Celery task and redirect immediately, rather than
+    # enrolling inline before the redirect.
+    "QUEUED_ENROLLMENT": False,
+}
+
+
+def dashboard_setting(name: str):
+    return getattr(settings, "OPENEDX_PLUGIN_DASHBOARD", {}).get(name, DEFAULT_DASHBOARD_SETTINGS[name])
+
+
+def request_enrollment(user, course_key: CourseKey) -> None:
+    """
+    enroll user in course_key, inline or queued, at most once per
+    ENROLLMENT_LOCK_TTL seconds per user and course. the lock is released
+    if the enrollment fails, so that the user can retry straight away.
+    """
+    lock_key = enrollment_lock_key(user.id, course_key)
+    # cache.add fails if the key already exists
+    if not cache.add(lock_key, True, ENROLLMENT_LOCK_TTL):
+        log.info(
+            "student_dashboard() enrollment of user {username} in {course_key} is already in progress.".format(
+                username=user.username, course_key=course_key
+            )
+        )
+        return
+
+    if dashboard_setting("QUEUED_ENROLLMENT"):
+        try:
+            enroll_user.delay(user.id, str(course_key))
+            return
+        except Exception as e:  # noqa: B902
+            log.warning(
+                "student_dashboard() could not queue the enrollment of user {username} in {course_key}."
+                " Enrolling inline. Exception: {e}".format(username=user.username, course_key=course_key, e=e)
+            )
+
+    try:
+        enroll(user, course_key)
+    except Exception:  # noqa: B902
+        cache.delete(lock_key)
+        raise
+
 
 @login_required
 @ensure_csrf_cookie
@@ -94,7 +133,6 @@ def student_dashboard(request):
         log.info("student_dashboard() received enroll param of {enroll_in}".format(enroll_in=enroll_in))
 
         course_key = None
-        course = None
 
         try:
             course_key = CourseKey.from_string(enroll_in)
@@ -107,22 +145,10 @@ def student_dashboard(request):
 
         if course_key:
             try:
-                course = modulestore().get_course(course_key)
-            except Exception as e:  # noqa: B902
-                log.warning(
-                    "student_dashboard() encountered a handled exception               "
-                    "          while attempting to initialize course object for        "
-                    "                 course key {enroll_in}. Exception: {e}".format(enroll_in=enroll_in, e=e)
-                )
-
-            try:
-                if not CourseEnrollment.is_enrolled(request.user, course_key=course_key):
-                    CourseEnrollment.enroll(request.user, course_key=course_key)
-                else:
-                    log.info(
-                        "student_dashboard() user {username} is already enrolled in"
-                        " course {enroll_in}.".format(username=request.user.username, enroll_in=enroll_in)
-                    )
+                # CourseOverview is cached by the platform, and is all we need
+                # for the start date. It also confirms that the course exists.
+                course = CourseOverview.get_from_id(course_key)
+                request_enrollment(request.user, course_key)
 
                 if course.has_started():
                     return redirect(
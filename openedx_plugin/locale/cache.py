@@ -0,0 +1,212 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Jul-2023
+
+Process-local lookup tables for Locale and MarketingSites.
+
+Each table is built with one query and is then served from memory. A
+version stamp in the Django cache is shared by all processes: saving or
+deleting a record replaces the stamp, and each process compares its own
+stamp against the shared one at most once every
+OPENEDX_PLUGIN_LOCALE_CACHE_TTL seconds, rebuilding its table when the
+stamps differ. Mako footers can therefore resolve every link on a page
+without querying the database.
+"""
+import logging
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LOCALE_CACHE_TTL = 5
+DEFAULT_RELEASED_LANGUAGE_CACHE_TTL = 60
+DEFAULT_LANGUAGE = "en"
+
+# language codes come from url params, so bound the memo.
+MAX_CLOSEST_RELEASED_LANGUAGES = 1000
+_closest_released_languages = {}
+
+
+def locale_cache_ttl() -> float:
+    return getattr(settings, "OPENEDX_PLUGIN_LOCALE_CACHE_TTL", DEFAULT_LOCALE_CACHE_TTL)
+
+
+def released_language_cache_ttl() -> float:
+    return getattr(settings, "OPENEDX_PLUGIN_RELEASED_LANGUAGE_CACHE_TTL", DEFAULT_RELEASED_LANGUAGE_CACHE_TTL)
+
+
+def closest_released_language(language: str) -> str:
+    """
+    get_closest_released_language(language), memoized per process for
+    OPENEDX_PLUGIN_RELEASED_LANGUAGE_CACHE_TTL seconds. The released
+    languages are configured in Django Admin (DarkLangConfig) and rarely
+    change.
+    """
+    from openedx.core.djangoapps.lang_pref.api import get_closest_released_language
+
+    now = time.monotonic()
+    cached = _closest_released_languages.get(language)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    closest = get_closest_released_language(language)
+    if len(_closest_released_languages) >= MAX_CLOSEST_RELEASED_LANGUAGES:
+        _closest_released_languages.clear()
+    _closest_released_languages[language] = (now + released_language_cache_ttl(), closest)
+    return closest
+
+
+@lru_cache(maxsize=256)
+def fallback_languages(language: str) -> Tuple[str, ...]:
+    """
+    the languages to try, in order, for language. example:
+        es-419 -> ("es-419", "es", "en")
+    """
+    chain = (language or DEFAULT_LANGUAGE, (language or DEFAULT_LANGUAGE)[:2], DEFAULT_LANGUAGE)
+    return tuple(dict.fromkeys(chain))
+
+
+class VersionedTable:
+    """
+    a process-local table built by build(), and rebuilt whenever the version
+    stamp shared by all processes changes. resolve() and group() memoize the
+    fallback-resolved views of the table per language, for as long as the
+    table itself is current.
+    """
+
+    def __init__(self, name: str, build: Callable[[], Dict]):
+        self.name = name
+        self.build = build
+        self._table = None
+        self._resolved = {}
+        self._groups = {}
+        self._version = None
+        self._checked_at = 0.0
+
+    @property
+    def version_key(self) -> str:
+        return "openedx_plugin.locale.{name}.version".format(name=self.name)
+
+    def shared_version(self) -> str:
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+    def table(self) -> Dict:
+        now = time.monotonic()
+        if self._table is None or now >= self._checked_at + locale_cache_ttl():
+            version = self.shared_version()
+            if self._table is None or version != self._version:
+                self._table = self.build()
+                self._resolved = {}
+                self._groups = {}
+                self._version = version
+                log.debug("openedx_plugin.locale.cache rebuilt {name} table".format(name=self.name))
+            self._checked_at = now
+        return self._table
+
+    def resolve(self, language: str) -> Dict:
+        """
+        the table entries for language, with each key taken from the first
+        language of fallback_languages(language) that has one.
+        """
+        table = self.table()
+        resolved = self._resolved.get(language)
+        if resolved is None:
+            resolved = {}
+            for fallback in reversed(fallback_languages(language)):
+                resolved.update(table.get(fallback, {}))
+            self._resolved[language] = resolved
+        return resolved
+
+    def group(self, language: str, prefix: str) -> Dict:
+        """
+        the entries of resolve(language) whose keys start with prefix.
+        """
+        resolved = self.resolve(language)
+        key = (language, prefix)
+        group = self._groups.get(key)
+        if group is None:
+            group = {name: entry for name, entry in resolved.items() if name.startswith(prefix)}
+            self._groups[key] = group
+        return group
+
+    def invalidate(self) -> None:
+        """
+        replace the shared version stamp so that every process rebuilds.
+        """
+        cache.set(self.version_key, uuid4().hex, None)
+        self._table = None
+        self._resolved = {}
+        self._groups = {}
+
+
+def build_locale_table() -> Dict[str, Dict[str, Dict[str, str]]]:
+    """
+    {language: {element_id: {"url": url, "value": value}}}
+    """
+    from openedx_plugin.models import Locale
+
+    retval = {}
+    for element_id, language, url, value in Locale.objects.values_list("element_id", "language", "url", "value"):
+        retval.setdefault(language, {})[element_id] = {"url": url, "value": value}
+    return retval
+
+
+def build_marketing_site_table() -> Dict[str, Dict[str, str]]:
+    """
+    {language: {"site_url": site_url}}. where a language has several
+    provinces, the first record registered for the language wins.
+    """
+    from openedx_plugin.models import MarketingSites
+
+    retval = {}
+    for language, site_url in MarketingSites.objects.order_by("id").values_list("language", "site_url"):
+        retval.setdefault(language, {}).setdefault("site_url", site_url)
+    return retval
+
+
+locale_table = VersionedTable("Locale", build_locale_table)
+marketing_site_table = VersionedTable("MarketingSites", build_marketing_site_table)
+
+
+def invalidate_locale_table(**kwargs) -> None:
+    """
+    post_save and post_delete receiver for Locale.
+    """
+    locale_table.invalidate()
+
+
+def invalidate_marketing_site_table(**kwargs) -> None:
+    """
+    post_save and post_delete receiver for MarketingSites.
+    """
+    marketing_site_table.invalidate()
+
+
+def connect_locale_invalidation() -> None:
+    """
+    connect the invalidation receivers. Called from apps.ready().
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    from openedx_plugin.models import Locale, MarketingSites
+
+    post_save.connect(invalidate_locale_table, sender=Locale, dispatch_uid="openedx_plugin_locale_cache_save")
+    post_delete.connect(invalidate_locale_table, sender=Locale, dispatch_uid="openedx_plugin_locale_cache_delete")
+    post_save.connect(
+        invalidate_marketing_site_table, sender=MarketingSites, dispatch_uid="openedx_plugin_marketing_site_cache_save"
+    )
+    post_delete.connect(
+        invalidate_marketing_site_table,
+        sender=MarketingSites,
+        dispatch_uid="openedx_plugin_marketing_site_cache_delete",
+    )
@@ -8,15 +8,19 @@ example theming utility functions
 
 import logging
 from ast import Str
+from typing import Dict, Iterable
+
+from django.conf import settings
 
 from openedx.core.djangoapps.lang_pref import LANGUAGE_KEY
 from openedx.core.djangoapps.user_api.preferences.api import get_user_preference
-from openedx.core.djangoapps.lang_pref.api import get_closest_released_language
 
-from openedx_plugin.models import Locale, MarketingSites
+from openedx_plugin.locale.cache import closest_released_language, locale_table, marketing_site_table
 
 log = logging.getLogger(__name__)
 
+REQUEST_LANGUAGE_ATTR = "_openedx_plugin_language"
+
 
 def get_marketing_site(request):
     """
@@ -29,11 +33,15 @@ def get_marketing_site(request):
     Then, map the language code to a marketing site url based on data we've
     persisted to MarketingSites.
 
+    Language codes fall back to their two character base language,
+    and then to English. The LMS root url is returned if MarketingSites has
+    no match.
+
     example return value: https://example.org/
     """
     language = language_from_request(request)
-    marketing_site = MarketingSites.objects.filter(language=language).first()
-    return marketing_site.site_url
+    marketing_site = marketing_site_table.resolve(language)
+    return marketing_site.get("site_url") or settings.LMS_ROOT_URL
 
 
 def language_from_request(request):
@@ -41,7 +49,21 @@ def language_from_request(request):
     A robust effort to determine the most appropriate language code to use
     for purposes of determining the user's geographic region.
 
-    This gets called a lot. Try to keep this a non-cached, order-1 operation!!
+    This gets called a lot, often several times per page from different
+    template fragments. The result is therefore resolved once per request
+    and memoized on the request object.
+    """
+    if hasattr(request, REQUEST_LANGUAGE_ATTR):
+        return getattr(request, REQUEST_LANGUAGE_ATTR)
+
+    language = resolve_language(request)
+    setattr(request, REQUEST_LANGUAGE_ATTR, language)
+    return language
+
+
+def resolve_language(request):
+    """
+    the uncached implementation of language_from_request().
     """
     preferred_language = None
 
@@ -50,7 +72,7 @@ def language_from_request(request):
     try:
         if request.user and request.user.is_authenticated:
             preferred_language = get_user_preference(request.user, LANGUAGE_KEY)
-            log.info(
+            log.debug(
                 "language_from_request() found an existing language preference         "
                 "        of {preferred_language} for username {username}".format(
                     preferred_language=preferred_language,
@@ -69,16 +91,16 @@ def language_from_request(request):
         preferred_language = request.GET.get("language")
         if preferred_language:
             # if necessary, reduce the language setting to the most closely installed language
-            closest_released_language = get_closest_released_language(preferred_language)
-            log.info(
+            closest_language = closest_released_language(preferred_language)
+            log.debug(
                 "language_from_request() found language param of                "
                 " {preferred_language} in the request params. Closest released         "
-                "        language is {closest_released_language}".format(
+                "        language is {closest_language}".format(
                     preferred_language=preferred_language,
-                    closest_released_language=closest_released_language,
+                    closest_language=closest_language,
                 )
             )
-            return closest_released_language
+            return closest_language
 
     # 3.) Try to grab the language code from Django middleware, if its installed
     # see: https://stackoverflow.com/questions/3356964/how-can-i-get-the-current-language-in-django
@@ -134,19 +156,38 @@ def anchor(element_id: Str, prefered_language="en"):
 
     returns the URL and anchor element value based on the user's
     example
-    """
 
-    locale = Locale.objects.filter(element_id=element_id, language=prefered_language).first()
+    falls back to the two character base language, and then to English.
+    Lookups are served from the process-local Locale table in
+    openedx_plugin.locale.cache and do not query the database.
+    """
+    locale = locale_table.resolve(prefered_language).get(element_id)
     if not locale:
-        # try a simpler variation of the language code.
-        prefered_language = prefered_language[:2]
-        locale = Locale.objects.filter(element_id=element_id, language=prefered_language).first()
+        return {}
 
-    if not locale:
-        # try to grab the element in English.
-        locale = Locale.objects.filter(element_id=element_id, language="en").first()
+    return dict(locale)
 
-    if not locale:
-        return {}
 
-    return {"url": locale.url, "value": locale.value}
+def anchors(element_ids: Iterable[str], prefered_language="en") -> Dict[str, Dict]:
+    """
+    batch version of anchor(). returns {element_id: {"url": ..., "value": ...}}
+    for each of element_ids, with {} for ids that have no Locale record.
+    """
+    resolved = locale_table.resolve(prefered_language)
+    return {element_id: dict(resolved.get(element_id) or {}) for element_id in element_ids}
+
+
+def anchor_group(prefix: str, prefered_language="en") -> Dict[str, Dict]:
+    """
+    every anchor whose element id starts with prefix, resolved for
+    prefered_language. intended to be called once per page render from a
+    Mako template, for example for all of the footer links:
+
+        <%! from openedx_plugin.locale.utils import anchor_group %>
+        <% footer = anchor_group("example-footer-", LANGUAGE_CODE) %>
+        <a href="${footer.get('example-footer-about', {}).get('url', '')}">...</a>
+
+    The returned dict is shared by all callers for the same prefix and
+    language; treat it as read-only.
+    """
+    return locale_table.group(prefered_language, prefix)
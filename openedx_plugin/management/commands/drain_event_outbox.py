@@ -0,0 +1,28 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          deliver pending openedx-events outbox records to the configured
+                sinks. Useful from cron as a safety net for the Celery task,
+                and to retry deliveries that failed.
+
+                ./manage.py lms drain_event_outbox --batch-size 1000
+"""
+from django.core.management.base import BaseCommand
+
+from ...outbox.api import drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver pending openedx-events outbox records to the configured event sinks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, dest="batch_size")
+        parser.add_argument("--max-batches", type=int, default=None, dest="max_batches")
+
+    def handle(self, *args, **options):
+        delivered = drain_outbox(batch_size=options["batch_size"], max_batches=options["max_batches"])
+        self.stdout.write("Delivered {delivered} events".format(delivered=delivered))
@@ -0,0 +1,106 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          measure the cold-start cost of the plugin apps. Each sample
+                runs in a fresh Python process that inherits this process's
+                settings module, and times django.setup() (which includes the
+                ready() method of every installed app) followed by the import
+                of one plugin URLconf.
+
+                ./manage.py lms plugin_startup_benchmark
+                ./manage.py cms plugin_startup_benchmark --repeat 5
+                ./manage.py lms plugin_startup_benchmark -m openedx_plugin_api.urls -m openedx_plugin_api.api
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+PLUGIN_APPS = (
+    "openedx_plugin",
+    "openedx_plugin_api",
+    "openedx_plugin_cms",
+    "openedx_plugin_mobile_api",
+)
+RESULT_PREFIX = "PLUGIN_STARTUP_BENCHMARK "
+
+SAMPLE_SCRIPT = """
+import importlib, json, sys, time
+
+start = time.perf_counter()
+import django
+
+django.setup()
+setup = time.perf_counter() - start
+
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+module = time.perf_counter() - start
+
+print({prefix!r} + json.dumps({{"setup": setup, "module": module}}))
+""".format(
+    prefix=RESULT_PREFIX
+)
+
+
+def run_sample(module: str) -> dict:
+    """
+    time django.setup() and the import of module in a fresh interpreter.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", SAMPLE_SCRIPT, module],
+        env=os.environ.copy(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+    raise CommandError(
+        "benchmark of {module} failed: {stderr}".format(module=module, stderr=completed.stderr.strip()[-2000:])
+    )
+
+
+def milliseconds(samples) -> str:
+    return "median {median:8.1f} ms   min {min:8.1f} ms".format(
+        median=statistics.median(samples) * 1000, min=min(samples) * 1000
+    )
+
+
+class Command(BaseCommand):
+    help = "Measure the process start-up cost of django.setup() and of each plugin URLconf"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-m",
+            "--module",
+            action="append",
+            dest="modules",
+            default=None,
+            help="module to import after django.setup(). Defaults to the URLconf of each installed plugin app.",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="samples per module")
+
+    def handle(self, *args, **options):
+        modules = options["modules"] or ["{app}.urls".format(app=app) for app in PLUGIN_APPS if apps.is_installed(app)]
+        repeat = max(1, options["repeat"])
+
+        setup_samples = []
+        for module in modules:
+            module_samples = []
+            for _ in range(repeat):
+                sample = run_sample(module)
+                setup_samples.append(sample["setup"])
+                module_samples.append(sample["module"])
+            self.stdout.write("import {module:40} {timing}".format(module=module, timing=milliseconds(module_samples)))
+
+        self.stdout.write("{label:47} {timing}".format(label="django.setup()", timing=milliseconds(setup_samples)))
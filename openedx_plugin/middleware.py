@@ -16,9 +16,17 @@ usage:      scaffolding to override the Django Admin login page defined in
             page template.
 """
 import logging
+from functools import lru_cache
 
+from django.contrib import admin
+from django.contrib.admin.forms import AdminAuthenticationForm
+from django.contrib.auth import REDIRECT_FIELD_NAME
 from django.http import HttpResponse
-from django.template import loader, Context
+from django.template import loader
+from django.urls import reverse
+from django.utils.translation import gettext as _
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import csrf_protect
 
 from .waffle import waffle_switches, OVERRIDE_OPENEDX_DJANGO_LOGIN
 
@@ -35,18 +43,50 @@ WAFFLE_NAMESPACE = "openedx_plugin"
 OPENEDX_DJANGO_LOGIN_URL = "/admin/login"
 
 
+@lru_cache(maxsize=None)
+def login_template():
+    """
+    the compiled Django Admin login template, loaded once per process.
+    """
+    return loader.get_template("admin/login.html")
+
+
+@never_cache
+@csrf_protect
+def django_admin_login(request):
+    """
+    the original Django Admin login page. GET renders the cached template;
+    POST is handed to the Django Admin login view, which authenticates the
+    user and redirects on success.
+    """
+    if request.method == "POST":
+        return admin.site.login(request)
+
+    context = admin.site.each_context(request)
+    context.update(
+        {
+            "title": _("Log in"),
+            "app_path": request.get_full_path(),
+            "form": AdminAuthenticationForm(request),
+            "username": request.user.get_username(),
+            REDIRECT_FIELD_NAME: request.GET.get(REDIRECT_FIELD_NAME) or reverse("admin:index"),
+        }
+    )
+    return HttpResponse(login_template().render(context, request))
+
+
 class RedirectDjangoAdminMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        # require a Waffle flag to enable overrides of the stock openedx api functionality
-        if request.path.startswith(OPENEDX_DJANGO_LOGIN_URL) and waffle_switches[OVERRIDE_OPENEDX_DJANGO_LOGIN]:
+        # require a Waffle flag to enable overrides of the stock openedx api functionality.
+        # the switch state is cached in memory, so when the override is off this
+        # middleware costs one dictionary lookup per request.
+        if waffle_switches[OVERRIDE_OPENEDX_DJANGO_LOGIN] and request.path.startswith(OPENEDX_DJANGO_LOGIN_URL):
             log.info(
                 "openedx_plugin.middleware.RedirectDjangoAdminMiddleware.__call__()"
-                " redirecting host: {host} path: {path}".format(host=request.META["HTTP_HOST"], path=request.path)
+                " redirecting host: {host} path: {path}".format(host=request.get_host(), path=request.path)
             )
-            template = loader.get_template("admin/login.html")
-            context = Context({})
-            return HttpResponse(template.render(context, request))
+            return django_admin_login(request)
         return self.get_response(request)
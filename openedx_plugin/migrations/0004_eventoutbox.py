@@ -0,0 +1,42 @@
+# coding=utf-8
+# Generated by Django 3.2.19 on 2023-07-10 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin", "0003_auto_20230615_1732"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventOutbox",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "event_type",
+                    models.CharField(
+                        help_text="The openedx-events signal name. Example: COURSE_ENROLLMENT_CREATED",
+                        max_length=255,
+                    ),
+                ),
+                ("payload", models.TextField(help_text="Compact JSON representation of the event data.")),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("delivered_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "index_together": {("delivered_at", "id")},
+            },
+        ),
+    ]
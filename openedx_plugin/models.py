@@ -132,3 +132,27 @@ class Configuration(TimeStampedModel):
 
     def __str__(self):
         return self.type
+
+
+class EventOutbox(models.Model):
+    """
+    Durable queue of openedx-events payloads awaiting delivery to the
+    configured event sinks. Rows are appended by the signal receivers and
+    drained in batches by a background task. see openedx_plugin.outbox
+    """
+
+    class Meta:
+        index_together = ("delivered_at", "id")
+
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    event_type = models.CharField(
+        max_length=255,
+        help_text=_("The openedx-events signal name. Example: COURSE_ENROLLMENT_CREATED"),
+    )
+    payload = models.TextField(help_text=_("Compact JSON representation of the event data."))
+    attempts = models.PositiveIntegerField(default=0)
+    delivered_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return "{event_type}-{id}".format(event_type=self.event_type, id=self.id)
@@ -0,0 +1,150 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          an outbox for openedx-events.
+
+                Signal receivers call enqueue_event(), which costs one small
+                INSERT inside the request. Delivery to the configured sinks
+                happens later, in batches, from the drain_event_outbox Celery
+                task (or the drain_event_outbox management command), so the
+                latency of login, registration and enrollment never depends
+                on the speed of a sink. Delivery is at-least-once.
+"""
+import json
+import logging
+from datetime import timedelta
+from typing import Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..models import EventOutbox
+from ..utils import PluginJSONEncoder, masked_dict
+from .sinks import get_sinks
+
+log = logging.getLogger(__name__)
+
+DRAIN_SCHEDULED_CACHE_KEY = "openedx_plugin.outbox.drain_scheduled"
+DEFAULT_OUTBOX_SETTINGS = {
+    # seconds to wait after the first enqueued event before draining, so
+    # that events arriving close together are delivered as one batch.
+    "DRAIN_DELAY": 5,
+    "BATCH_SIZE": 500,
+    # batches per drain. whatever remains is picked up by the next drain.
+    "MAX_BATCHES": 20,
+    # undelivered events are abandoned after this many failed attempts.
+    "MAX_ATTEMPTS": 10,
+    # seconds to wait before retrying a drain that failed to deliver.
+    "RETRY_DELAY": 60,
+    # delivered events are deleted after this many days.
+    "RETENTION_DAYS": 7,
+}
+
+
+def outbox_setting(name: str):
+    return getattr(settings, "OPENEDX_PLUGIN_EVENT_OUTBOX", {}).get(name, DEFAULT_OUTBOX_SETTINGS[name])
+
+
+def enqueue_event(event_type: str, payload: Dict) -> None:
+    """
+    append an event to the outbox, and make sure that a drain is scheduled
+    once the current transaction commits.
+    """
+    EventOutbox.objects.create(
+        event_type=event_type,
+        payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, separators=(",", ":")),
+    )
+    transaction.on_commit(schedule_drain)
+
+
+def schedule_drain(delay: int = None) -> None:
+    """
+    schedule at most one drain per DRAIN_DELAY seconds, or per delay seconds
+    when one is given. The cache key expires no later than the scheduled
+    drain starts, so an event that misses one drain always schedules the next.
+    """
+    delay = delay or outbox_setting("DRAIN_DELAY")
+    if not cache.add(DRAIN_SCHEDULED_CACHE_KEY, True, delay):
+        return
+
+    from .tasks import drain_event_outbox
+
+    try:
+        drain_event_outbox.apply_async(countdown=delay)
+    except Exception as e:  # noqa: B902
+        # the events are safe in the outbox. the next successful schedule,
+        # or the management command, will deliver them.
+        cache.delete(DRAIN_SCHEDULED_CACHE_KEY)
+        log.warning("openedx_plugin unable to schedule drain_event_outbox: {err}".format(err=e))
+
+
+def pending_events():
+    """
+    the undelivered events that will still be retried.
+    """
+    return EventOutbox.objects.filter(delivered_at__isnull=True, attempts__lt=outbox_setting("MAX_ATTEMPTS"))
+
+
+def drain_outbox(batch_size: int = None, max_batches: int = None) -> int:
+    """
+    deliver undelivered events to every configured sink, oldest first, in
+    batches. Returns the number of events delivered.
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED so that
+    concurrent drains deliver different batches.
+    """
+    batch_size = batch_size or outbox_setting("BATCH_SIZE")
+    max_batches = max_batches or outbox_setting("MAX_BATCHES")
+    max_attempts = outbox_setting("MAX_ATTEMPTS")
+    sinks = get_sinks()
+    delivered = 0
+
+    for _ in range(max_batches):
+        with transaction.atomic():
+            batch = list(
+                EventOutbox.objects.select_for_update(skip_locked=True)
+                .filter(delivered_at__isnull=True, attempts__lt=max_attempts)
+                .order_by("id")[:batch_size]
+            )
+            if not batch:
+                break
+
+            ids = [record.id for record in batch]
+            events = [
+                {
+                    "id": record.id,
+                    "event_type": record.event_type,
+                    "created": record.created,
+                    "data": json.loads(record.payload),
+                }
+                for record in batch
+            ]
+            try:
+                for sink in sinks:
+                    sink.send(events)
+            except Exception as e:  # noqa: B902
+                EventOutbox.objects.filter(id__in=ids).update(attempts=F("attempts") + 1, last_error=str(e)[:1000])
+                log.warning(
+                    "openedx_plugin failed to deliver {n} events to {sink}: {err}".format(
+                        n=len(events), sink=type(sink).__name__, err=e
+                    )
+                )
+                break
+
+            EventOutbox.objects.filter(id__in=ids).update(
+                attempts=F("attempts") + 1, delivered_at=timezone.now(), last_error=""
+            )
+            delivered += len(batch)
+
+    purge_before = timezone.now() - timedelta(days=outbox_setting("RETENTION_DAYS"))
+    EventOutbox.objects.filter(delivered_at__lt=purge_before).delete()
+
+    log.debug("openedx_plugin delivered {delivered} events".format(delivered=delivered))
+    return delivered
@@ -0,0 +1,128 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          pluggable destinations for drained EventOutbox records.
+
+                Configure with settings.OPENEDX_PLUGIN_EVENT_SINKS, a list whose
+                items are either a dotted path to an EventSink class, or a dict
+                of the form {"class": "dotted.path", "options": {...}} where
+                options are passed to the class constructor. Example:
+
+                OPENEDX_PLUGIN_EVENT_SINKS = [
+                    "openedx_plugin.outbox.sinks.LogSink",
+                    {
+                        "class": "openedx_plugin.outbox.sinks.HttpSink",
+                        "options": {"url": "https://warehouse.example.org/events/", "timeout": 10},
+                    },
+                ]
+"""
+import json
+import logging
+from typing import Dict, List
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ..utils import PluginJSONEncoder
+
+log = logging.getLogger(__name__)
+
+DEFAULT_EVENT_SINKS = ["openedx_plugin.outbox.sinks.LogSink"]
+
+
+def to_ndjson(events: List[Dict]) -> str:
+    return "".join(json.dumps(event, cls=PluginJSONEncoder, separators=(",", ":")) + "\n" for event in events)
+
+
+class EventSink:
+    """
+    Base class for event sinks. send() receives a batch of events, each a
+    dict with the keys id, event_type, created and data, and should raise
+    an exception if the batch was not delivered. Batches that raise are
+    retried, so sinks should tolerate receiving an event more than once.
+    """
+
+    def send(self, events: List[Dict]) -> None:
+        raise NotImplementedError
+
+
+class LogSink(EventSink):
+    """
+    writes each event to the application log.
+    """
+
+    def __init__(self, level=logging.INFO):
+        self.level = level
+
+    def send(self, events: List[Dict]) -> None:
+        for event in events:
+            log.log(
+                self.level,
+                "openedx_plugin event {event_type}: {data}".format(
+                    event_type=event["event_type"],
+                    data=json.dumps(event, cls=PluginJSONEncoder, separators=(",", ":")),
+                ),
+            )
+
+
+class FileSink(EventSink):
+    """
+    appends events to a file, one JSON document per line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, events: List[Dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(to_ndjson(events))
+
+
+class HttpSink(EventSink):
+    """
+    POSTs each batch of events to a url as newline-delimited JSON.
+    """
+
+    def __init__(self, url: str, timeout: float = 10, headers: Dict = None):
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/x-ndjson"}
+        self.headers.update(headers or {})
+
+    def send(self, events: List[Dict]) -> None:
+        data = to_ndjson(events).encode("utf-8")
+        response = requests.post(self.url, data=data, headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
+
+
+class MemorySink(EventSink):
+    """
+    a local stand-in for testing. Collects events in the class attribute
+    MemorySink.events, which is shared by every instance in the process.
+    """
+
+    events = []
+
+    def send(self, events: List[Dict]) -> None:
+        MemorySink.events.extend(events)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.events = []
+
+
+def get_sinks() -> List[EventSink]:
+    """
+    instantiate the sinks configured in settings.OPENEDX_PLUGIN_EVENT_SINKS
+    """
+    retval = []
+    for sink in getattr(settings, "OPENEDX_PLUGIN_EVENT_SINKS", DEFAULT_EVENT_SINKS):
+        if isinstance(sink, str):
+            sink = {"class": sink}
+        retval.append(import_string(sink["class"])(**sink.get("options", {})))
+    return retval
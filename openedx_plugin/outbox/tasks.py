@@ -0,0 +1,37 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          Celery task to drain the openedx-events outbox.
+"""
+import logging
+
+try:
+    # mcdaniel aug-2022: deprecated sometime after Lilac.
+    # see: https://docs.celeryq.dev/en/stable/internals/deprecation.html
+    from celery.task import task
+except ImportError:
+    from celery import shared_task as task
+
+from .api import drain_outbox, outbox_setting, pending_events, schedule_drain
+
+log = logging.getLogger(__name__)
+
+
+@task(name="openedx_plugin.outbox.tasks.drain_event_outbox", ignore_result=True)
+def drain_event_outbox():
+    """
+    deliver pending EventOutbox records to the configured sinks. if the
+    drain stopped at its batch limit then there is probably a backlog, so
+    keep going. if a delivery failed, retry after RETRY_DELAY seconds,
+    until the events reach MAX_ATTEMPTS.
+    """
+    delivered = drain_outbox()
+    if delivered >= outbox_setting("BATCH_SIZE") * outbox_setting("MAX_BATCHES"):
+        schedule_drain()
+    elif pending_events().exists():
+        schedule_drain(delay=outbox_setting("RETRY_DELAY"))
+    return delivered
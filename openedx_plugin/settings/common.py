@@ -29,3 +29,12 @@ def plugin_settings(settings):
 
     # settings.SOCIAL_AUTH_REDIRECT_IS_HTTPS = True
     # SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+
+    # openedx-events outbox. see openedx_plugin.outbox
+    settings.OPENEDX_PLUGIN_EVENT_SINKS = getattr(
+        settings, "OPENEDX_PLUGIN_EVENT_SINKS", ["openedx_plugin.outbox.sinks.LogSink"]
+    )
+    settings.OPENEDX_PLUGIN_EVENT_OUTBOX = getattr(settings, "OPENEDX_PLUGIN_EVENT_OUTBOX", {})
+
+    # student_dashboard entry point. see openedx_plugin.dashboard.views
+    settings.OPENEDX_PLUGIN_DASHBOARD = getattr(settings, "OPENEDX_PLUGIN_DASHBOARD", {})
@@ -3,14 +3,14 @@
 Common Pluggable Django App settings
 """
 
-from ..waffle import waffle_switches, OVERRIDE_OPENEDX_DJANGO_LOGIN
-
 
 def plugin_settings(settings):
     """
     Injects local settings into django settings
+
+    The middleware is always installed; it checks the
+    OVERRIDE_OPENEDX_DJANGO_LOGIN switch on each request.
     """
-    if waffle_switches[OVERRIDE_OPENEDX_DJANGO_LOGIN]:
-        middleware = getattr(settings, "MIDDLEWARE", None)
-        if middleware:
-            settings.MIDDLEWARE.append("openedx_plugin.middleware.RedirectDjangoAdminMiddleware")
+    middleware = getattr(settings, "MIDDLEWARE", None)
+    if middleware:
+        settings.MIDDLEWARE.append("openedx_plugin.middleware.RedirectDjangoAdminMiddleware")
@@ -8,7 +8,6 @@ date:           feb-2022
 usage:          listen for Django Signals published by Open edX
                 see https://docs.djangoproject.com/en/4.1/topics/signals/
 """
-import json
 import logging
 from attr import asdict
 
@@ -16,7 +15,20 @@ from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 
 from openedx.core.djangoapps.user_authn.views.register import REGISTER_USER
-from .utils import serialize_course_key, PluginJSONEncoder, masked_dict
+from .apps import (
+    STUDENT_REGISTRATION_COMPLETED,
+    SESSION_LOGIN_COMPLETED,
+    COURSE_ENROLLMENT_CREATED,
+    COURSE_ENROLLMENT_CHANGED,
+    COURSE_UNENROLLMENT_COMPLETED,
+    PERSISTENT_GRADE_SUMMARY_CHANGED,
+    CERTIFICATE_CREATED,
+    CERTIFICATE_CHANGED,
+    CERTIFICATE_REVOKED,
+    COHORT_MEMBERSHIP_CHANGED,
+)
+from .outbox.api import enqueue_event
+from .utils import serialize_course_key
 from .waffle import waffle_switches, SIGNALS
 
 
@@ -76,6 +88,9 @@ def register_user(sender, user, registration, **kwargs):  # pylint: disable=unus
 
     I scaffolded these from https://github.com/eduNEXT/openedx-events-2-zapier
 
+    Receivers do not deliver events themselves. They append the event to
+    the outbox and return; see openedx_plugin.outbox.api
+
 """
 
 
@@ -116,11 +131,7 @@ def student_registration_completed(user, **kwargs):  # pylint: disable=unused-ar
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received STUDENT_REGISTRATION_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(STUDENT_REGISTRATION_COMPLETED, payload)
 
 
 def session_login_completed(user, **kwargs):
@@ -145,11 +156,7 @@ def session_login_completed(user, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received SESSION_LOGIN_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(SESSION_LOGIN_COMPLETED, payload)
 
 
 def course_enrollment_created(enrollment, **kwargs):
@@ -200,11 +207,7 @@ def course_enrollment_created(enrollment, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(COURSE_ENROLLMENT_CREATED, payload)
 
 
 def course_enrollment_changed(enrollment, **kwargs):
@@ -233,11 +236,7 @@ def course_enrollment_changed(enrollment, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(COURSE_ENROLLMENT_CHANGED, payload)
 
 
 def course_unenrollment_completed(enrollment, **kwargs):
@@ -265,11 +264,7 @@ def course_unenrollment_completed(enrollment, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received COURSE_UNENROLLMENT_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(COURSE_UNENROLLMENT_COMPLETED, payload)
 
 
 def certificate_created(certificate, **kwargs):
@@ -297,11 +292,7 @@ def certificate_created(certificate, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received CERTIFICATE_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(CERTIFICATE_CREATED, payload)
 
 
 def certificate_changed(certificate, **kwargs):
@@ -328,11 +319,7 @@ def certificate_changed(certificate, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received CERTIFICATE_CHANGED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(CERTIFICATE_CHANGED, payload)
 
 
 def certificate_revoked(certificate, **kwargs):
@@ -360,11 +347,7 @@ def certificate_revoked(certificate, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received CERTIFICATE_REVOKED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(CERTIFICATE_REVOKED, payload)
 
 
 def persistent_grade_summary_changed(grade, **kwargs):
@@ -410,11 +393,7 @@ def persistent_grade_summary_changed(grade, **kwargs):
         "grade": grade_info,
         "event_metadata": event_metadata,
     }
-    log.info(
-        "openedx_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(PERSISTENT_GRADE_SUMMARY_CHANGED, payload)
 
 
 def cohort_membership_changed(cohort, **kwargs):
@@ -443,11 +422,7 @@ def cohort_membership_changed(cohort, **kwargs):
         "event_metadata": event_metadata,
     }
 
-    log.info(
-        "openedx_plugin received COHORT_MEMBERSHIP_CHANGED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    enqueue_event(COHORT_MEMBERSHIP_CHANGED, payload)
 
 
 def course_discussions_changed(configuration, **kwargs):  # lint-amnesty, pylint: disable=unused-argument
@@ -0,0 +1,85 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Jul-2023
+
+Tests of the openedx-events outbox, openedx_plugin.outbox
+"""
+# python stuff
+import json
+from unittest import mock
+
+# django stuff
+from django.test import TestCase, override_settings
+
+# our stuff
+from openedx_plugin.models import EventOutbox
+from openedx_plugin.outbox.api import drain_outbox, enqueue_event
+from openedx_plugin.outbox.sinks import EventSink, MemorySink
+
+MEMORY_SINK = "openedx_plugin.outbox.sinks.MemorySink"
+FAILING_SINK = "openedx_plugin.tests.test_outbox.FailingSink"
+
+
+class FailingSink(EventSink):
+    def send(self, events):
+        raise ConnectionError("sink is down")
+
+
+class TestEventOutbox(TestCase):
+    def setUp(self):
+        super().setUp()
+        MemorySink.clear()
+
+    def enqueue(self, n):
+        for i in range(n):
+            enqueue_event("COURSE_ENROLLMENT_CREATED", {"user_id": i, "course_id": "course-v1:edX+DemoX+Demo"})
+
+    def test_enqueue_event_writes_a_row(self):
+        enqueue_event("STUDENT_REGISTRATION_COMPLETED", {"username": "alice"})
+
+        record = EventOutbox.objects.get()
+        assert record.event_type == "STUDENT_REGISTRATION_COMPLETED"
+        assert json.loads(record.payload) == {"username": "alice"}
+        assert record.delivered_at is None
+        assert record.attempts == 0
+
+    @override_settings(OPENEDX_PLUGIN_EVENT_SINKS=[MEMORY_SINK])
+    def test_drain_delivers_and_marks_rows_sent(self):
+        self.enqueue(3)
+
+        delivered = drain_outbox()
+
+        assert delivered == 3
+        assert [event["data"]["user_id"] for event in MemorySink.events] == [0, 1, 2]
+        assert not EventOutbox.objects.filter(delivered_at__isnull=True).exists()
+        assert set(EventOutbox.objects.values_list("attempts", flat=True)) == {1}
+
+    @override_settings(OPENEDX_PLUGIN_EVENT_SINKS=[FAILING_SINK])
+    def test_sink_failure_leaves_rows_pending(self):
+        self.enqueue(2)
+
+        delivered = drain_outbox()
+
+        assert delivered == 0
+        for record in EventOutbox.objects.all():
+            assert record.delivered_at is None
+            assert record.attempts == 1
+            assert record.last_error == "sink is down"
+
+    @override_settings(OPENEDX_PLUGIN_EVENT_SINKS=[MEMORY_SINK])
+    def test_drain_claims_batches_with_skip_locked(self):
+        self.enqueue(5)
+
+        with mock.patch.object(
+            EventOutbox.objects, "select_for_update", wraps=EventOutbox.objects.select_for_update
+        ) as select_for_update:
+            delivered = drain_outbox(batch_size=2, max_batches=2)
+
+        assert delivered == 4
+        assert select_for_update.call_count == 2
+        select_for_update.assert_called_with(skip_locked=True)
+        assert EventOutbox.objects.filter(delivered_at__isnull=True).count() == 1
+
+        assert drain_outbox(batch_size=2, max_batches=2) == 1
+        assert [event["data"]["user_id"] for event in MemorySink.events] == [0, 1, 2, 3, 4]
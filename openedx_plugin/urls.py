@@ -14,24 +14,31 @@ from django.conf.urls import url
 from openedx_plugin.dashboard.views import student_dashboard
 from openedx_plugin.locale.views import marketing_redirector
 from openedx_plugin.api.urls import urlpatterns as api_urlpatterns
+from openedx_plugin_common.switch_cache import gate_urlpatterns
 from .waffle import waffle_switches, AUTOMATED_ENROLLMENT, MARKETING_REDIRECTOR
 
 app_name = "openedx_plugin"
 
 urlpatterns = []
 
-if waffle_switches[AUTOMATED_ENROLLMENT]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         url(r"^dashboard/?$", student_dashboard, name="example_dashboard"),
-    ]
+    ],
+    waffle_switches,
+    AUTOMATED_ENROLLMENT,
+)
 
-if waffle_switches[MARKETING_REDIRECTOR]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         url(
             r"^marketing-redirector/?$",
             marketing_redirector,
             name="example_marketing_redirector",
         ),
-    ]
+    ],
+    waffle_switches,
+    MARKETING_REDIRECTOR,
+)
 
 urlpatterns += api_urlpatterns
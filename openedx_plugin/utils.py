@@ -8,10 +8,13 @@ date:           feb-2022
 usage:          utility and convenience functions for openedx_plugin
 """
 import json
+from datetime import date, datetime, time
+from uuid import UUID
 from dateutil.parser import parse, ParserError
 from unittest.mock import MagicMock
 from collections.abc import MutableMapping
 
+from opaque_keys import OpaqueKey
 from opaque_keys.edx.locator import CourseLocator
 
 SENSITIVE_KEYS = [
@@ -90,6 +93,10 @@ class PluginJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, bytes):
             return str(obj, encoding="utf-8")
+        if isinstance(obj, (datetime, date, time)):
+            return obj.isoformat()
+        if isinstance(obj, (UUID, OpaqueKey)):
+            return str(obj)
         if isinstance(obj, MagicMock):
             return ""
         try:
@@ -12,6 +12,8 @@ import logging
 
 from edx_toggles.toggles import WaffleSwitch
 
+from openedx_plugin_common.switch_cache import CachedSwitchStates
+
 log = logging.getLogger(__name__)
 
 WAFFLE_NAMESPACE = "openedx_plugin"
@@ -45,7 +47,7 @@ OVERRIDE_OPENEDX_DJANGO_LOGIN_WAFFLE = WaffleSwitch(OVERRIDE_OPENEDX_DJANGO_LOGI
 # .. toggle_use_cases:
 # .. toggle_creation_date: 2022-12-27
 AUTOMATED_ENROLLMENT = f"{WAFFLE_NAMESPACE}.automated_enrollment"
-AUTOMATED_ENROLLMENT_WAFFLE = WaffleSwitch(OVERRIDE_OPENEDX_DJANGO_LOGIN, module_name=__name__)
+AUTOMATED_ENROLLMENT_WAFFLE = WaffleSwitch(AUTOMATED_ENROLLMENT, module_name=__name__)
 
 # .. toggle_name: openedx_plugin.marketing_redirector
 # .. toggle_implementation: WaffleSwitch
@@ -84,32 +86,27 @@ def is_ready():
         return False
 
 
-def is_enabled(switch: WaffleSwitch) -> bool:
-    """
-    To resolve a race condition during application launch. The waffle_switches
-    are inspected before the db service has initialized.
-    """
-    try:
-        return switch.is_enabled()
-    except Exception:  # noqa: B902
-        return False
-
-
-waffle_switches = {
-    SIMPLE_REST_API: is_enabled(SIMPLE_REST_API_WAFFLE),
-    OVERRIDE_OPENEDX_DJANGO_LOGIN: is_enabled(OVERRIDE_OPENEDX_DJANGO_LOGIN_WAFFLE),
-    AUTOMATED_ENROLLMENT: is_enabled(AUTOMATED_ENROLLMENT_WAFFLE),
-    MARKETING_REDIRECTOR: is_enabled(MARKETING_REDIRECTOR_WAFFLE),
-    SIGNALS: is_enabled(SIGNALS_WAFFLE),
-}
+# switch states are read lazily and cached briefly. see openedx_plugin_common.switch_cache
+waffle_switches = CachedSwitchStates(
+    {
+        SIMPLE_REST_API: SIMPLE_REST_API_WAFFLE,
+        OVERRIDE_OPENEDX_DJANGO_LOGIN: OVERRIDE_OPENEDX_DJANGO_LOGIN_WAFFLE,
+        AUTOMATED_ENROLLMENT: AUTOMATED_ENROLLMENT_WAFFLE,
+        MARKETING_REDIRECTOR: MARKETING_REDIRECTOR_WAFFLE,
+        SIGNALS: SIGNALS_WAFFLE,
+    }
+)
 
 
 def waffle_init():
     """
     Bootstrapper for the WaffleSwitch objects defined in this module. Iterate
-    all WaffleSwitch objects, create any that are missing. This is called once
-    from apps.CustomPluginConfig.ready() during application launch to ensure
-    that WaffleSwitch objects exist in Django Admin for all switches.
+    all WaffleSwitch objects, create any that are missing, so that
+    WaffleSwitch objects exist in Django Admin for all switches. This is called
+    from the <namespace>_init management command rather than from
+    apps.CustomPluginConfig.ready(), so that application launch does not query
+    the database. The <namespace>.W001 system check reports switches that have
+    not been initialized.
 
     Note that django-waffle actually includes a handy setting,
     WAFFLE_CREATE_MISSING_FLAGS, that **could** do this for us automatically.
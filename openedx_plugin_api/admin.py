@@ -8,7 +8,7 @@ date:           sep-2021
 usage:          register the custom Django model in LMS Django Admin
 """
 from django.contrib import admin
-from .models import CoursePoints
+from .models import BackgroundJob, CoursePoints
 
 
 class CoursePointsAdmin(admin.ModelAdmin):
@@ -16,3 +16,12 @@ class CoursePointsAdmin(admin.ModelAdmin):
 
 
 admin.site.register(CoursePoints, CoursePointsAdmin)
+
+
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "job_type", "status", "processed", "total", "requested_by", "created")
+    list_filter = ("job_type", "status")
+    readonly_fields = ("created", "modified")
+
+
+admin.site.register(BackgroundJob, BackgroundJobAdmin)
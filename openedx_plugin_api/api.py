@@ -11,10 +11,16 @@ usage:          Example custom REST API leveraging misc functionality from
 # python stuff
 import os
 import json
+from datetime import timedelta
 
 # django stuff
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.http import StreamingHttpResponse
 from django.http.response import HttpResponseNotFound
+from django.urls import reverse
+from django.utils import timezone
 from openedx.core.djangoapps.oauth_dispatch.jwt import create_jwt_for_user
 from openedx.core.lib.api.view_utils import view_auth_classes
 
@@ -24,46 +30,56 @@ from rest_framework.views import APIView
 from social_django.models import UserSocialAuth
 
 # open edx stuff
+from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.djangoapps.enrollments import api
 from common.djangoapps.student.models import CourseEnrollment, email_exists_or_retired
 from common.djangoapps.student.roles import CourseDataResearcherRole
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from common.djangoapps.course_modes.models import CourseMode
-from lms.djangoapps.certificates.models import CertificateGenerationCourseSetting
-from lms.djangoapps.bulk_email.models import CourseAuthorization
 from lms.djangoapps.courseware.models import StudentModule
-from lms.djangoapps.grades.models import PersistentCourseGrade
 from openedx.core.djangoapps.django_comment_common.models import (
     FORUM_ROLE_MODERATOR,
     Role,
 )
-import openedx.core.djangoapps.django_comment_common.comment_client as cc
-import lms.djangoapps.discussion.django_comment_client.utils as utils
-
-try:
-    # for olive and later
-    from xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.course_module import DEFAULT_START_DATE, CourseFields
-except ImportError:
-    # for backward compatibility with nutmeg and earlier
-    from common.lib.xmodule.xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.course_module import (
-        DEFAULT_START_DATE,
-        CourseFields,
-    )
+
+# the comment client, grades, bulk_email, certificates and modulestore are
+# imported by the views that use them, on first use, rather than with the
+# URLconf.
 
 # our stuff
-from .utils import get_course_info
-from .models import CoursePoints
+from .bulk import MAX_ITEMS, MAX_SYNC_ITEMS, run_bulk_action, summarize
+from .pagination import (
+    STREAM_CHUNK_SIZE,
+    PluginCursorPagination,
+    is_true,
+    ndjson_response,
+    parse_since,
+    wants_stream,
+)
+from .utils import get_course_info, get_course_infos
+from .models import BackgroundJob, CoursePoints
 from .__about__ import __version__
 
 User = get_user_model()
 
+ACTIVE_STUDENTS_TOTAL_CACHE_TTL = 60 * 5
+ACTIVE_STUDENTS_TOTAL_CACHE_KEY = "openedx_plugin_api.active_students.{course_key}.{exclude_removed}"
+STUDENT_MODULE_ORDERING = ("created", "id")
+MAX_HISTORY_USERNAMES = 500
+COURSE_GRADE_ORDERING = ("modified", "id")
+DISCUSSION_EXPORT_JOB = "discussion_export"
+JOB_STALE_AFTER = 60 * 10
+MAX_COURSE_INFO_KEYS = 100
+
+
+def active_student(row: dict) -> dict:
+    """
+    CourseActiveStudentsAPIView pages through enrollments by user_id, and
+    returns it as the student's id.
+    """
+    return {"id": row["user_id"], "email": row["email"], "username": row["username"]}
+
 
 class ResponseSuccess(Response):
     def __init__(self, data=None, http_status=None, content_type=None):
@@ -76,10 +92,30 @@ class ResponseSuccess(Response):
 
 @view_auth_classes(is_authenticated=True)
 class UsersAPIView(APIView):
+    """
+    id and username of every user, a page at a time.
+
+    query params:
+    - updated_since: ISO 8601 date or datetime. only users who registered
+      or logged in since then. auth_user has no modification timestamp,
+      so these are the closest signals that we have for incremental sync.
+    - page_size: default 1000, max 10000. follow "next" for the next page.
+    - stream=true: every matching user as NDJSON, in a single response.
+    """
+
     def get(self, request):
         users = User.objects.all()
-        results = [{"id": user.id, "name": user.username} for user in users]
-        return Response(results, content_type="application/json")
+        updated_since = parse_since(request, "updated_since")
+        if updated_since:
+            users = users.filter(Q(date_joined__gte=updated_since) | Q(last_login__gte=updated_since))
+        users = users.values("id", name=F("username"))
+
+        if wants_stream(request):
+            return ndjson_response(users.order_by("id").iterator(chunk_size=STREAM_CHUNK_SIZE))
+
+        paginator = PluginCursorPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        return paginator.get_paginated_response(page)
 
 
 @view_auth_classes(is_authenticated=True)
@@ -115,6 +151,156 @@ class EnrollUserAPIView(APIView):
         return Response(response, content_type="application/json")
 
 
+class BulkEnrollmentAPIView(APIView):
+    """
+    body: {"items": [{"username": ..., "course_id": ..., "mode": ...}, ...], "async": false}
+
+    applies every item, MAX_SYNC_ITEMS at most, and returns a result per
+    item in request order. with "async": true, up to MAX_ITEMS items are
+    queued as a BackgroundJob and the response is 202 with its status_url.
+    """
+
+    job_type = None
+
+    def post(self, request):
+        items = request.data.get("items")
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return Response({"items": "Expected a list of objects."}, status=status.HTTP_400_BAD_REQUEST)
+
+        run_async = is_true(request.data.get("async"))
+        limit = MAX_ITEMS if run_async else MAX_SYNC_ITEMS
+        if len(items) > limit:
+            return Response(
+                {"items": "At most {limit} items per request. Use async for larger batches.".format(limit=limit)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not run_async:
+            results = run_bulk_action(self.job_type, items)
+            return ResponseSuccess({"summary": summarize(results), "results": results})
+
+        from .tasks import queue_job
+
+        job = BackgroundJob.objects.create(
+            job_type=self.job_type, requested_by=request.user, params={"items": items}, total=len(items)
+        )
+        queue_job(job)
+        return ResponseSuccess(job_urls(request, job), http_status=status.HTTP_202_ACCEPTED)
+
+
+@view_auth_classes(is_authenticated=True)
+class BulkEnrollUserAPIView(BulkEnrollmentAPIView):
+    job_type = "bulk_enroll"
+
+
+@view_auth_classes(is_authenticated=True)
+class BulkUnenrollUserAPIView(BulkEnrollmentAPIView):
+    job_type = "bulk_unenroll"
+
+
+def get_job(request, job_id):
+    """
+    the BackgroundJob, if it was requested by this user or the user is staff.
+    """
+    job = BackgroundJob.objects.filter(id=job_id).first()
+    if not job or (job.requested_by_id != request.user.id and not request.user.is_staff):
+        return None
+    return job
+
+
+def job_urls(request, job: BackgroundJob) -> dict:
+    retval = {
+        "job_id": str(job.id),
+        "status_url": request.build_absolute_uri(
+            reverse("openedx_plugin_api:openedx_plugin_api_job_status", kwargs={"job_id": job.id})
+        ),
+    }
+    if job.job_type == DISCUSSION_EXPORT_JOB:
+        retval["download_url"] = request.build_absolute_uri(
+            reverse("openedx_plugin_api:openedx_plugin_api_job_download", kwargs={"job_id": job.id})
+        )
+    return retval
+
+
+@view_auth_classes(is_authenticated=True)
+class JobStatusAPIView(APIView):
+    """
+    status and progress of a BackgroundJob, for the user who requested it
+    or for staff. ?results=true includes the per item results once the job
+    has finished.
+    """
+
+    def get(self, request, job_id):
+        job = get_job(request, job_id)
+        if not job:
+            return HttpResponseNotFound()
+
+        data = {
+            "job_id": str(job.id),
+            "job_type": job.job_type,
+            "status": job.status,
+            "total": job.total,
+            "processed": job.processed,
+            "created": job.created,
+            "modified": job.modified,
+            "summary": job.result.get("summary"),
+        }
+        data.update(job_urls(request, job))
+        if job.error:
+            data["error"] = job.error
+        if is_true(request.query_params.get("results")):
+            data["results"] = job.result.get("results")
+        return ResponseSuccess(data)
+
+
+@view_auth_classes(is_authenticated=True)
+class JobResumeAPIView(APIView):
+    """
+    queue a failed job again, or a running job whose worker has not
+    reported progress for JOB_STALE_AFTER seconds. discussion exports
+    resume after their last checkpointed thread.
+    """
+
+    def post(self, request, job_id):
+        from .tasks import queue_job
+
+        job = get_job(request, job_id)
+        if not job:
+            return HttpResponseNotFound()
+
+        stale = job.modified < timezone.now() - timedelta(seconds=JOB_STALE_AFTER)
+        if job.status == BackgroundJob.STATUS_SUCCEEDED or (job.status != BackgroundJob.STATUS_FAILED and not stale):
+            message = "Only failed or stalled jobs can be resumed. This job is {status}.".format(status=job.status)
+            return Response({"status": message}, status=status.HTTP_409_CONFLICT)
+
+        job.status = BackgroundJob.STATUS_PENDING
+        job.save(update_fields=["status", "modified"])
+        queue_job(job)
+        return ResponseSuccess(job_urls(request, job), http_status=status.HTTP_202_ACCEPTED)
+
+
+@view_auth_classes(is_authenticated=True)
+class JobDownloadAPIView(APIView):
+    """
+    the NDJSON file of a finished discussion export.
+    """
+
+    def get(self, request, job_id):
+        from .discussion import read_export
+
+        job = get_job(request, job_id)
+        if not job or job.job_type != DISCUSSION_EXPORT_JOB:
+            return HttpResponseNotFound()
+        if job.status != BackgroundJob.STATUS_SUCCEEDED:
+            return Response(
+                {"status": "The export is {status}.".format(status=job.status)}, status=status.HTTP_409_CONFLICT
+            )
+
+        response = StreamingHttpResponse(read_export(job.result["parts"]), content_type="application/x-ndjson")
+        response["Content-Disposition"] = 'attachment; filename="discussion-{job_id}.ndjson"'.format(job_id=job.id)
+        return response
+
+
 @view_auth_classes(is_authenticated=True)
 class AssociateUserOAuthAPIView(APIView):
     def post(self, request):
@@ -187,52 +373,132 @@ class CourseRevokeRoleAccessAPIView(APIView):
         return ResponseSuccess(content_type="application/json")
 
 
+def student_module_response(request, view, student_modules, *fields, **expressions):
+    """
+    the scalar columns of student_modules, never the state column, ordered
+    by (created, id) and paginated with a cursor, or streamed as NDJSON.
+    modified_since limits the rows to those changed since the last pull.
+    """
+    modified_since = parse_since(request, "modified_since")
+    if modified_since:
+        student_modules = student_modules.filter(modified__gte=modified_since)
+    student_modules = student_modules.values(
+        "id", "grade", "max_grade", "done", "module_type", "created", "modified", *fields, **expressions
+    )
+
+    if wants_stream(request):
+        rows = student_modules.order_by(*STUDENT_MODULE_ORDERING).iterator(chunk_size=STREAM_CHUNK_SIZE)
+        return ndjson_response(rows)
+
+    paginator = PluginCursorPagination()
+    paginator.ordering = STUDENT_MODULE_ORDERING
+    page = paginator.paginate_queryset(student_modules, request, view=view)
+    return paginator.get_paginated_response(page)
+
+
 @view_auth_classes(is_authenticated=True)
 class StudentHistoryAPIView(APIView):
+    """
+    the StudentModule rows of a student in a course, a page at a time.
+
+    query params:
+    - modified_since: ISO 8601 date or datetime. only rows modified since then.
+    - page_size: default 1000, max 10000. follow "next" for the next page.
+    - stream=true: every matching row as NDJSON, in a single response.
+    """
+
     def get(self, request, username, course_key):
-        user = User.objects.get(username=username)
-        student_modules = StudentModule.objects.filter(student=user, course_id=course_key).order_by("created")
-        results = [
-            {
-                "id": sm.id,
-                "grade": sm.grade,
-                "max_grade": sm.max_grade,
-                "done": sm.done,
-                "module_type": sm.module_type,
-            }
-            for sm in student_modules
-        ]
-        return Response(results, content_type="application/json")
+        user_id = User.objects.filter(username=username).values_list("id", flat=True).first()
+        if user_id is None:
+            return HttpResponseNotFound()
+        student_modules = StudentModule.objects.filter(student_id=user_id, course_id=course_key)
+        return student_module_response(request, self, student_modules)
+
+
+@view_auth_classes(is_authenticated=True)
+class CourseStudentsHistoryAPIView(APIView):
+    """
+    StudentHistoryAPIView for many students of a course at once. each row
+    includes the student's username.
+
+    query params:
+    - usernames: comma separated, MAX_HISTORY_USERNAMES at most.
+    - modified_since, page_size and stream, as StudentHistoryAPIView.
+    """
+
+    def get(self, request, course_key):
+        usernames = [username for username in request.query_params.get("usernames", "").split(",") if username]
+        if not usernames or len(usernames) > MAX_HISTORY_USERNAMES:
+            return Response(
+                {"usernames": "Expected 1 to {limit} comma separated usernames.".format(limit=MAX_HISTORY_USERNAMES)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        student_modules = StudentModule.objects.filter(
+            student_id__in=User.objects.filter(username__in=usernames).values("id"), course_id=course_key
+        )
+        return student_module_response(request, self, student_modules, username=F("student__username"))
 
 
 @view_auth_classes(is_authenticated=True)
 class CourseActiveStudentsAPIView(APIView):
+    """
+    id, email and username of the honor mode students of a course who have
+    interacted with it at least once, a page at a time.
+
+    query params:
+    - exclude_removed: default true. only active enrollments.
+    - page_size: default 1000, max 10000. follow "next" for the next page.
+    - stream=true: every matching student as NDJSON, in a single response.
+
+    the page of students is returned in "users", as it always has been,
+    with the "total" and the "next" and "previous" cursor urls.
+
+    this starts from the course's enrollments, one index range, and checks
+    StudentModule with EXISTS on its (student, course) index, rather than
+    reading every module row of the course. the total is cached for
+    ACTIVE_STUDENTS_TOTAL_CACHE_TTL seconds.
+    """
+
     def get(self, request, course_key):
+        try:
+            course_key = CourseKey.from_string(course_key)
+        except InvalidKeyError:
+            return Response({"course_key": "Invalid course key."}, status=status.HTTP_400_BAD_REQUEST)
         exclude_removed = request.query_params.get("exclude_removed", "true") == "true"
-        active_user_ids = StudentModule.objects.filter(course_id=course_key).filter(
-            student__courseenrollment__mode="honor"
-        )
+
+        enrollments = CourseEnrollment.objects.filter(course_id=course_key, mode="honor")
         if exclude_removed:
-            active_user_ids = active_user_ids.filter(student__courseenrollment__is_active=True)
-        active_user_ids = active_user_ids.values_list("student", flat=True).distinct()
-        active_users = User.objects.filter(id__in=active_user_ids)
-        results = {
-            "total": active_users.count(),
-            "users": [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "username": user.username,
-                }
-                for user in active_users
-            ],
-        }
-        return Response(results, content_type="application/json")
+            enrollments = enrollments.filter(is_active=True)
+        enrollments = enrollments.filter(
+            Exists(StudentModule.objects.filter(course_id=course_key, student_id=OuterRef("user_id")))
+        )
+        students = enrollments.values("user_id", email=F("user__email"), username=F("user__username"))
+
+        if wants_stream(request):
+            rows = students.order_by("user_id").iterator(chunk_size=STREAM_CHUNK_SIZE)
+            return ndjson_response(active_student(row) for row in rows)
+
+        cache_key = ACTIVE_STUDENTS_TOTAL_CACHE_KEY.format(course_key=course_key, exclude_removed=exclude_removed)
+        total = cache.get(cache_key)
+        if total is None:
+            total = enrollments.count()
+            cache.set(cache_key, total, ACTIVE_STUDENTS_TOTAL_CACHE_TTL)
+
+        paginator = PluginCursorPagination()
+        paginator.ordering = "user_id"
+        page = paginator.paginate_queryset(students, request, view=self)
+        response = paginator.get_paginated_response([active_student(row) for row in page])
+        # existing clients read the page of students from "users".
+        response.data["users"] = response.data.pop("results")
+        response.data["total"] = total
+        return response
 
 
 @view_auth_classes(is_authenticated=True)
 class StudentCourseGradeAPIView(APIView):
     def get(self, request, username, course_key):
+        from lms.djangoapps.grades.models import PersistentCourseGrade
+
         user = User.objects.get(username=username)
         try:
             grade = PersistentCourseGrade.objects.get(user_id=user.id, course_id=course_key)
@@ -246,6 +512,62 @@ class StudentCourseGradeAPIView(APIView):
         return ResponseSuccess(response)
 
 
+@view_auth_classes(is_authenticated=True)
+class CourseGradesAPIView(APIView):
+    """
+    the persisted course grades of a course, a page at a time, with each
+    learner's username joined in the same query.
+
+    query params:
+    - usernames: optional, comma separated, MAX_HISTORY_USERNAMES at most.
+      all learners of the course when omitted.
+    - modified_since: ISO 8601 date or datetime. only grades modified since
+      then. rows are ordered by (modified, id), so the last row's modified
+      is the next pull's modified_since.
+    - page_size: default 1000, max 10000. follow "next" for the next page.
+    - stream=true: every matching grade as NDJSON, in a single response.
+    """
+
+    def get(self, request, course_key):
+        from lms.djangoapps.grades.models import PersistentCourseGrade
+
+        try:
+            course_key = CourseKey.from_string(course_key)
+        except InvalidKeyError:
+            return Response({"course_key": "Invalid course key."}, status=status.HTTP_400_BAD_REQUEST)
+
+        grades = PersistentCourseGrade.objects.filter(course_id=course_key)
+        usernames = [username for username in request.query_params.get("usernames", "").split(",") if username]
+        if len(usernames) > MAX_HISTORY_USERNAMES:
+            return Response(
+                {"usernames": "At most {limit} comma separated usernames.".format(limit=MAX_HISTORY_USERNAMES)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if usernames:
+            grades = grades.filter(user_id__in=User.objects.filter(username__in=usernames).values("id"))
+        modified_since = parse_since(request, "modified_since")
+        if modified_since:
+            grades = grades.filter(modified__gte=modified_since)
+        grades = grades.values(
+            "id",
+            "user_id",
+            "percent_grade",
+            "letter_grade",
+            "passed_timestamp",
+            "modified",
+            username=Subquery(User.objects.filter(id=OuterRef("user_id")).values("username")[:1]),
+        )
+
+        if wants_stream(request):
+            rows = grades.order_by(*COURSE_GRADE_ORDERING).iterator(chunk_size=STREAM_CHUNK_SIZE)
+            return ndjson_response(rows)
+
+        paginator = PluginCursorPagination()
+        paginator.ordering = COURSE_GRADE_ORDERING
+        page = paginator.paginate_queryset(grades, request, view=self)
+        return paginator.get_paginated_response(page)
+
+
 @view_auth_classes(is_authenticated=True)
 class CourseInfoAPIView(APIView):
     def get(self, request, course_key):
@@ -259,6 +581,30 @@ class CourseInfoAPIView(APIView):
             return ResponseSuccess(response)  # noqa: B012
 
 
+@view_auth_classes(is_authenticated=True)
+class CoursesInfoAPIView(APIView):
+    """
+    CourseInfoAPIView for many courses in one call.
+
+    query params:
+    - course_keys: comma separated and url encoded, MAX_COURSE_INFO_KEYS at
+      most. courses that don't exist are left out of the response.
+    """
+
+    def get(self, request):
+        course_ids = [course_id for course_id in request.query_params.get("course_keys", "").split(",") if course_id]
+        if not course_ids or len(course_ids) > MAX_COURSE_INFO_KEYS:
+            message = "Expected 1 to {limit} comma separated course keys.".format(limit=MAX_COURSE_INFO_KEYS)
+            return Response({"course_keys": message}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            course_keys = [CourseKey.from_string(course_id) for course_id in course_ids]
+        except InvalidKeyError as e:
+            return Response({"course_keys": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        course_infos = get_course_infos(course_keys)
+        return ResponseSuccess({"courses": {str(course_key): info for course_key, info in course_infos.items()}})
+
+
 @view_auth_classes(is_authenticated=True)
 class CoursePointsAPIView(APIView):
     def get(self, request, course_key):
@@ -296,6 +642,13 @@ class CourseRerunAPIView(APIView):
     def post(self, request):
         from cms.djangoapps.contentstore.views.course import rerun_course
 
+        try:
+            # for olive and later
+            from xmodule.course_module import CourseFields
+        except ImportError:
+            # for backward compatibility with nutmeg and earlier
+            from common.lib.xmodule.xmodule.course_module import CourseFields
+
         source_course_key = request.POST.get("source_course_key")
         username = request.POST.get("user")
         try:
@@ -329,6 +682,14 @@ class CourseCertificateAPIView(APIView):
             CertificateManager,
             Certificate,
         )
+        from lms.djangoapps.certificates.models import CertificateGenerationCourseSetting
+
+        try:
+            # for olive and later
+            from xmodule.modulestore.django import modulestore
+        except ImportError:
+            # for backward compatibility with nutmeg and earlier
+            from common.lib.xmodule.xmodule.modulestore.django import modulestore
 
         signatory_name = request.POST.get("signatory_name")
         signatory_title = request.POST.get("signatory_title")
@@ -385,6 +746,8 @@ class CourseBulkEmailAPIView(APIView):
     """
 
     def post(self, request, course_id):
+        from lms.djangoapps.bulk_email.models import CourseAuthorization
+
         course_key = CourseKey.from_string(course_id)
         course_auth, _ = CourseAuthorization.objects.get_or_create(course_id=course_key, email_enabled=True)
         return ResponseSuccess({"enabled": course_auth.email_enabled})
@@ -410,68 +773,37 @@ class APIInfoView(APIView):
 
 @view_auth_classes(is_authenticated=True)
 class DiscussionForum(APIView):
-    def get_discussion_page(self, course_id, page):
-        from lms.djangoapps.discussion.views import THREADS_PER_PAGE
-
-        params = {
-            "sort_key": "activity",
-            "course_id": course_id,
-            "context": "course",
-            "per_page": THREADS_PER_PAGE,
-            "page": page,
-        }
-        paginated_results = cc.Thread.search(params)
-        return paginated_results.collection, paginated_results.num_pages
+    """
+    every post of the course's discussion forum, with its author's email.
+    stream=true returns the rows as NDJSON, as they are ready. for large
+    courses, use DiscussionExportAPIView instead.
+    """
 
-    def get_thread(self, thread_id):
-        thread = cc.Thread.find(thread_id).retrieve(
-            with_responses=True,
-            recursive=True,
-        )
-        return thread
-
-    def base_row(self, thread):
-        row = {
-            "course_id": thread["course_id"],
-            "module": "",
-            "section": "",
-            "title": thread.get("title"),
-            "pinned": "Yes" if thread.get("pinned") else "No",
-        }
-        return row
+    def get(self, request, course_id):
+        from .discussion import DiscussionExporter
 
-    def row(self, row, block):
-        if "user_id" in block:
-            user = User.objects.get(id=int(block["user_id"]))
-            row["email"] = user.email
+        rows = DiscussionExporter().rows(course_id)
+        if wants_stream(request):
+            return ndjson_response(rows)
+        return Response(list(rows), content_type="application/json")
 
-        row["content"] = block.get("body")
-        row["char_count"] = len(row["content"])
-        row["votes"] = block.get("votes", {}).get("count")
-        row["num_responses"] = block.get("comments_count")
-        row["post_type"] = block.get("type")
-        row["created_at"] = block.get("created_at")
-        return row
 
-    def get(self, request, course_id):
-        self.user = request.user
-        self.course_id = course_id
-        # course_key = CourseKey.from_string(course_id)
-        # course = get_course(course_key)
-        results = []
-        page = total_pages = 1
-        while page <= total_pages:
-            collection, total_pages = self.get_discussion_page(course_id, page)
-            for item in collection:
-                thread = self.get_thread(item["id"])
-                row = self.row(row=self.base_row(thread), block=item)
-                results.append(row)
-                for comment in thread.get("children", []):
-                    row = self.row(row=self.base_row(thread), block=comment)
-                    results.append(row)
-            page += 1
-
-        return Response(results, content_type="application/json")
+@view_auth_classes(is_authenticated=True)
+class DiscussionExportAPIView(APIView):
+    """
+    export the course's discussion forum in a background job. the response
+    is 202 with the job's status_url and download_url.
+    """
+
+    def post(self, request, course_id):
+        from .tasks import queue_job
+
+        job = BackgroundJob.objects.create(
+            job_type=DISCUSSION_EXPORT_JOB, requested_by=request.user, params={"course_id": course_id}
+        )
+        queue_job(job)
+        return ResponseSuccess(job_urls(request, job), http_status=status.HTTP_202_ACCEPTED)
+
 
 class UsersProfileUpdateView(APIView):
     """
@@ -0,0 +1,200 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          bulk enrollment and unenrollment for the openedx_plugin_api
+                plugin.
+
+                Users, courses, course modes and existing enrollments are
+                resolved for a whole batch with a handful of set-based
+                queries. Each enrollment change then goes through the
+                CourseEnrollment api, so that the platform's signals and
+                tracking events still fire, inside one transaction per batch.
+                Every item gets its own result, in request order.
+"""
+# python stuff
+import logging
+from typing import Callable, Dict, List, Optional
+
+# django stuff
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+# open edx stuff
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.course_modes.models import CourseMode
+from common.djangoapps.student.models import CourseEnrollment
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+log = logging.getLogger(__name__)
+User = get_user_model()
+
+BATCH_SIZE = 500
+MAX_SYNC_ITEMS = 1000
+MAX_ITEMS = 50000
+
+RESULT_ENROLLED = "enrolled"
+RESULT_UNENROLLED = "unenrolled"
+RESULT_UNCHANGED = "unchanged"
+RESULT_ERROR = "error"
+
+
+def item_result(item: Dict, status: str, detail: str = "") -> Dict:
+    retval = {"username": item.get("username"), "course_id": item.get("course_id"), "status": status}
+    if item.get("mode"):
+        retval["mode"] = item["mode"]
+    if detail:
+        retval["detail"] = detail
+    return retval
+
+
+def parse_items(items: List[Dict]) -> List[Optional[CourseKey]]:
+    """
+    the CourseKey of each item, or None if its course_id is invalid.
+    """
+    retval = []
+    for item in items:
+        try:
+            retval.append(CourseKey.from_string(str(item.get("course_id"))))
+        except InvalidKeyError:
+            retval.append(None)
+    return retval
+
+
+def resolve_users(items: List[Dict]) -> Dict[str, User]:
+    usernames = {item.get("username") for item in items if item.get("username")}
+    return User.objects.filter(username__in=usernames).in_bulk(field_name="username")
+
+
+def ensure_course_modes(pairs) -> None:
+    """
+    create the course modes in pairs, a set of (course_key, mode_slug), that
+    do not exist yet. one query to find them, and one to create them. a
+    concurrent batch may create the same mode in between, so conflicts
+    with existing rows are ignored.
+    """
+    if not pairs:
+        return
+    course_keys = {course_key for course_key, _ in pairs}
+    existing = set(
+        CourseMode.objects.filter(course_id__in=course_keys, mode_slug__in={slug for _, slug in pairs}).values_list(
+            "course_id", "mode_slug"
+        )
+    )
+    CourseMode.objects.bulk_create(
+        [
+            CourseMode(course_id=course_key, mode_slug=slug, mode_display_name=slug.capitalize())
+            for course_key, slug in pairs
+            if (course_key, slug) not in existing
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def enroll_batch(items: List[Dict]) -> List[Dict]:
+    """
+    items: [{"username": ..., "course_id": ..., "mode": ...}, ...]
+    """
+    course_keys = parse_items(items)
+    users = resolve_users(items)
+    known_courses = set(
+        CourseOverview.objects.filter(id__in={key for key in course_keys if key}).values_list("id", flat=True)
+    )
+    enrollments = {
+        (user_id, course_id): (mode, is_active)
+        for user_id, course_id, mode, is_active in CourseEnrollment.objects.filter(
+            user_id__in=[user.id for user in users.values()], course_id__in=known_courses
+        ).values_list("user_id", "course_id", "mode", "is_active")
+    }
+
+    results = [None] * len(items)
+    todo = []
+    for i, (item, course_key) in enumerate(zip(items, course_keys)):
+        user = users.get(item.get("username"))
+        mode = item.get("mode") or CourseMode.DEFAULT_MODE_SLUG
+        if not user:
+            results[i] = item_result(item, RESULT_ERROR, "unknown username")
+        elif course_key is None or course_key not in known_courses:
+            results[i] = item_result(item, RESULT_ERROR, "unknown course_id")
+        elif enrollments.get((user.id, course_key)) == (mode, True):
+            results[i] = item_result(item, RESULT_UNCHANGED)
+        else:
+            todo.append((i, item, user, course_key, mode))
+
+    ensure_course_modes({(course_key, mode) for _, _, _, course_key, mode in todo})
+
+    with transaction.atomic():
+        for i, item, user, course_key, mode in todo:
+            try:
+                with transaction.atomic():
+                    CourseEnrollment.enroll(user, course_key, mode=mode)
+                results[i] = item_result(item, RESULT_ENROLLED)
+            except Exception as e:  # noqa: B902
+                results[i] = item_result(item, RESULT_ERROR, str(e))
+    return results
+
+
+def unenroll_batch(items: List[Dict]) -> List[Dict]:
+    """
+    items: [{"username": ..., "course_id": ...}, ...]
+    """
+    course_keys = parse_items(items)
+    users = resolve_users(items)
+    enrollments = {
+        (enrollment.user_id, enrollment.course_id): enrollment
+        for enrollment in CourseEnrollment.objects.filter(
+            user_id__in=[user.id for user in users.values()],
+            course_id__in={key for key in course_keys if key},
+        )
+    }
+
+    results = []
+    with transaction.atomic():
+        for item, course_key in zip(items, course_keys):
+            user = users.get(item.get("username"))
+            enrollment = enrollments.get((user.id, course_key)) if user and course_key else None
+            if not enrollment:
+                results.append(item_result(item, RESULT_ERROR, "enrollment not found"))
+            elif not enrollment.is_active:
+                results.append(item_result(item, RESULT_UNCHANGED))
+            else:
+                try:
+                    with transaction.atomic():
+                        enrollment.update_enrollment(is_active=False)
+                    results.append(item_result(item, RESULT_UNENROLLED))
+                except Exception as e:  # noqa: B902
+                    results.append(item_result(item, RESULT_ERROR, str(e)))
+    return results
+
+
+BULK_ACTIONS = {
+    "bulk_enroll": enroll_batch,
+    "bulk_unenroll": unenroll_batch,
+}
+
+
+def run_bulk_action(
+    action: str, items: List[Dict], progress: Optional[Callable[[int, List[Dict]], None]] = None
+) -> List[Dict]:
+    """
+    apply the action to items, BATCH_SIZE at a time. progress(processed, results)
+    is called after each batch.
+    """
+    batch_action = BULK_ACTIONS[action]
+    results = []
+    for start in range(0, len(items), BATCH_SIZE):
+        results += batch_action(items[start : start + BATCH_SIZE])
+        if progress:
+            progress(len(results), results)
+    return results
+
+
+def summarize(results: List[Dict]) -> Dict[str, int]:
+    summary = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return summary
@@ -0,0 +1,275 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          export of a course's discussion forum for the
+                DiscussionForum api view.
+
+                Thread pages and threads are fetched with the platform
+                comment client, cc, with the calls running concurrently
+                in a bounded thread pool. Each thread is flattened into
+                rows, recursing through responses and comments, and the
+                rows of a thread are cached until its summary changes.
+                Authors' emails are resolved with one query per chunk of
+                threads, so that rows can be streamed as they are ready.
+
+                The client is pluggable: anything with search_threads()
+                and get_thread() will do, which is how the tests run
+                against a local stub of the comments service.
+"""
+# python stuff
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# django stuff
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections
+
+log = logging.getLogger(__name__)
+User = get_user_model()
+
+DEFAULT_DISCUSSION_SETTINGS = {
+    "MAX_WORKERS": 8,
+    "THREADS_PER_PAGE": 100,
+    "CHUNK_SIZE": 200,
+    "CACHE_TTL": 60 * 60,
+    # days after which export jobs, and their part files, are deleted.
+    "RETENTION_DAYS": 7,
+}
+THREAD_ROWS_CACHE_KEY = "openedx_plugin_api.discussion.thread_rows.{thread_id}.{version}"
+EXPORT_PART_NAME = "openedx_plugin_api/discussion_exports/{job_id}/part-{part:05d}.ndjson"
+EXPORT_READ_CHUNK_SIZE = 64 * 1024
+
+# responses to a question thread are split by endorsement.
+RESPONSE_KEYS = ("children", "endorsed_responses", "non_endorsed_responses")
+
+
+def discussion_setting(name: str):
+    return getattr(settings, "OPENEDX_PLUGIN_API_DISCUSSION", {}).get(name, DEFAULT_DISCUSSION_SETTINGS[name])
+
+
+def closing_connections(func):
+    """
+    func, closing the db connections that it opened. pool threads are not
+    request threads, so Django never closes their connections itself. cc
+    reads course waffle flags, and the forum backend may use the db.
+    """
+
+    @wraps(func)
+    def wrapped(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return wrapped
+
+
+class CommentClient:
+    """
+    the platform comment client, cc, with the calls that the exporter needs.
+    cc sends each request with requests.request(), on a connection of its
+    own, so there is no session to share between calls. the thread pool
+    bounds how many are open at once.
+    """
+
+    def search_threads(
+        self, course_id: str, page: int, per_page: int, sort_key: str = "activity"
+    ) -> Tuple[List[Dict], int]:
+        """
+        one page of the course's threads, and the number of pages.
+        """
+        import openedx.core.djangoapps.django_comment_common.comment_client as cc
+
+        params = {
+            "sort_key": sort_key,
+            "course_id": course_id,
+            "context": "course",
+            "per_page": per_page,
+            "page": page,
+        }
+        paginated_results = cc.Thread.search(params)
+        return paginated_results.collection, paginated_results.num_pages
+
+    def get_thread(self, thread_id: str) -> Dict:
+        """
+        a thread with all of its responses and comments.
+        """
+        import openedx.core.djangoapps.django_comment_common.comment_client as cc
+
+        return cc.Thread.find(thread_id).retrieve(with_responses=True, recursive=True).to_dict()
+
+
+def iter_blocks(block: Dict, parent_id: Optional[str] = None) -> Iterator[Tuple[Dict, Optional[str]]]:
+    """
+    (block, parent_id) for block and every response and comment beneath it,
+    depth first.
+    """
+    yield block, parent_id
+    for key in RESPONSE_KEYS:
+        for child in block.get(key) or []:
+            yield from iter_blocks(child, block.get("id"))
+
+
+def thread_rows(thread: Dict) -> List[Dict]:
+    """
+    one row per post of thread. rows carry the author's user_id, which
+    DiscussionExporter replaces with their email.
+    """
+    rows = []
+    for block, parent_id in iter_blocks(thread):
+        content = block.get("body") or ""
+        rows.append(
+            {
+                "course_id": thread.get("course_id"),
+                "module": "",
+                "section": "",
+                "title": thread.get("title"),
+                "pinned": "Yes" if thread.get("pinned") else "No",
+                "id": block.get("id"),
+                "parent_id": parent_id,
+                "user_id": block.get("user_id"),
+                "content": content,
+                "char_count": len(content),
+                "votes": (block.get("votes") or {}).get("count"),
+                "num_responses": block.get("comments_count"),
+                "post_type": block.get("type"),
+                "created_at": block.get("created_at"),
+            }
+        )
+    return rows
+
+
+def thread_version(summary: Dict) -> str:
+    """
+    the fields of a thread summary that change when the thread does.
+    """
+    return "{updated_at}.{last_activity_at}.{votes}.{comments_count}".format(
+        updated_at=summary.get("updated_at"),
+        last_activity_at=summary.get("last_activity_at"),
+        votes=(summary.get("votes") or {}).get("count"),
+        comments_count=summary.get("comments_count"),
+    )
+
+
+def thread_key(summary: Dict) -> List[str]:
+    """
+    a thread's place in creation date order. the forum lists the newest
+    threads first, so a smaller key is an older thread.
+    """
+    return [summary.get("created_at") or "", summary["id"]]
+
+
+def resolve_emails(user_ids) -> Dict[int, str]:
+    users = User.objects.filter(id__in=user_ids).values_list("id", "email")
+    return dict(users)
+
+
+class DiscussionExporter:
+    """
+    rows of every post of a course's discussion forum, in thread activity
+    order.
+    """
+
+    def __init__(self, client=None, max_workers: int = None, chunk_size: int = None):
+        self.client = client or CommentClient()
+        self.max_workers = max_workers or discussion_setting("MAX_WORKERS")
+        self.chunk_size = chunk_size or discussion_setting("CHUNK_SIZE")
+        self.per_page = discussion_setting("THREADS_PER_PAGE")
+
+    def thread_summaries(self, executor: ThreadPoolExecutor, course_id: str) -> List[Dict]:
+        collection, num_pages = self.client.search_threads(course_id, 1, self.per_page)
+        pages = executor.map(
+            closing_connections(lambda page: self.client.search_threads(course_id, page, self.per_page)[0]),
+            range(2, num_pages + 1),
+        )
+        for page in pages:
+            collection += page
+        return collection
+
+    def rows_of(self, summary: Dict) -> List[Dict]:
+        """
+        thread_rows() of the thread, from the cache while its summary is
+        unchanged. a vote does not always bump updated_at, so the vote and
+        response counts are part of the key. votes on responses and
+        comments are not in the summary, and can be up to CACHE_TTL
+        seconds old.
+        """
+        cache_key = THREAD_ROWS_CACHE_KEY.format(thread_id=summary["id"], version=thread_version(summary))
+        rows = cache.get(cache_key)
+        if rows is None:
+            rows = thread_rows(self.client.get_thread(summary["id"]))
+            try:
+                cache.set(cache_key, rows, discussion_setting("CACHE_TTL"))
+            except Exception:  # noqa: B902
+                log.debug("DiscussionExporter could not cache thread {thread_id}".format(thread_id=summary["id"]))
+        return rows
+
+    def with_emails(self, executor: ThreadPoolExecutor, summaries: List[Dict]) -> Iterator[Dict]:
+        for start in range(0, len(summaries), self.chunk_size):
+            chunk = list(executor.map(closing_connections(self.rows_of), summaries[start : start + self.chunk_size]))
+            emails = resolve_emails({int(row["user_id"]) for rows in chunk for row in rows if row["user_id"]})
+            for rows in chunk:
+                for row in rows:
+                    row = dict(row)
+                    user_id = row.pop("user_id")
+                    # every row has an email, None when the author is unknown.
+                    row["email"] = emails.get(int(user_id)) if user_id else None
+                    yield row
+
+    def rows(self, course_id: str) -> Iterator[Dict]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from self.with_emails(executor, self.thread_summaries(executor, course_id))
+
+    def thread_page(self, course_id: str, page: int) -> Tuple[List[Dict], int]:
+        """
+        one page of the course's threads, newest first, and the number of
+        pages. for exports that checkpoint after each page: unlike activity
+        order, new posts do not move threads that are already exported.
+        """
+        return self.client.search_threads(course_id, page, self.per_page, sort_key="date")
+
+    def summary_rows(self, summaries: List[Dict]) -> List[Dict]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(self.with_emails(executor, summaries))
+
+
+def save_export_part(job_id: str, part: int, content: str) -> str:
+    """
+    save one part of an export to default_storage, replacing the part left
+    by an earlier, interrupted attempt.
+    """
+    name = EXPORT_PART_NAME.format(job_id=job_id, part=part)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, ContentFile(content.encode("utf-8")))
+
+
+def read_export(parts: List[str]) -> Iterator[bytes]:
+    """
+    the parts of an export, in order, as one stream.
+    """
+    for name in parts:
+        with default_storage.open(name, "rb") as part:
+            for chunk in iter(lambda: part.read(EXPORT_READ_CHUNK_SIZE), b""):
+                yield chunk
+
+
+def delete_export(parts: List[str]) -> None:
+    """
+    delete the part files of an export. called when its job is deleted.
+    """
+    for name in parts:
+        try:
+            default_storage.delete(name)
+        except Exception as e:  # noqa: B902
+            log.warning("delete_export() could not delete {name}: {e}".format(name=name, e=e))
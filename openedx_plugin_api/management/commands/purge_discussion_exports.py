@@ -0,0 +1,25 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          delete discussion export jobs, and their part files, that
+                are older than OPENEDX_PLUGIN_API_DISCUSSION["RETENTION_DAYS"].
+                Exports also purge old exports when they finish; run this
+                from cron when exports are rare.
+
+                ./manage.py lms purge_discussion_exports
+"""
+from django.core.management.base import BaseCommand
+
+from ...tasks import purge_discussion_exports
+
+
+class Command(BaseCommand):
+    help = "Delete expired discussion export jobs and their part files"
+
+    def handle(self, *args, **options):
+        deleted = purge_discussion_exports()
+        self.stdout.write("Deleted {deleted} discussion exports".format(deleted=deleted))
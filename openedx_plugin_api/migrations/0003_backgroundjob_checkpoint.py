@@ -0,0 +1,18 @@
+# coding=utf-8
+# Generated by Django 3.2.19 on 2023-07-20 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_api", "0002_backgroundjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="backgroundjob",
+            name="checkpoint",
+            field=models.JSONField(blank=True, default=dict, help_text="Where a resumed job picks up from."),
+        ),
+    ]
@@ -8,6 +8,9 @@ date:           sep-2021
 usage:          example custom Django model for
                 openedx_plugin_api plugin
 """
+from uuid import uuid4
+
+from django.conf import settings
 from django.db import models
 
 
@@ -17,3 +20,39 @@ class CoursePoints(models.Model):
 
     def __str__(self):
         return f"{self.course_id}: {self.points} points"
+
+
+class BackgroundJob(models.Model):
+    """
+    A long running api request, like a bulk enrollment, that runs in a
+    Celery task. The client polls jobs/<id>/ for its status and results.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUSES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    modified = models.DateTimeField(auto_now=True)
+    job_type = models.CharField(max_length=50, help_text="Example: bulk_enroll")
+    status = models.CharField(max_length=20, choices=STATUSES, default=STATUS_PENDING, db_index=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    params = models.JSONField(default=dict, blank=True, help_text="The request data of the job.")
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    result = models.JSONField(default=dict, blank=True)
+    checkpoint = models.JSONField(default=dict, blank=True, help_text="Where a resumed job picks up from.")
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"{self.job_type} {self.id}: {self.status}"
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          pagination and streaming helpers for the list endpoints of
+                the openedx_plugin_api plugin.
+
+                List endpoints project only the columns that they return
+                (values() / values_list()), paginate with an opaque cursor
+                so that each page is an index range scan regardless of its
+                depth, and can optionally stream every row as NDJSON.
+"""
+# python stuff
+import json
+from datetime import datetime, time
+from typing import Iterable, Optional
+
+# django stuff
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from opaque_keys import OpaqueKey
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.encoders import JSONEncoder
+
+STREAM_CHUNK_SIZE = 2000
+
+
+class NDJSONEncoder(JSONEncoder):
+    """
+    DRF's encoder, which handles dates, decimals and uuids, plus opaque keys
+    such as CourseKey columns.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, OpaqueKey):
+            return str(obj)
+        return super().default(obj)
+
+
+class PluginCursorPagination(CursorPagination):
+    """
+    cursor pagination over id, which is unique and indexed on every table
+    that we page through. views can override ordering.
+    """
+
+    ordering = "id"
+    page_size = 1000
+    page_size_query_param = "page_size"
+    max_page_size = 10000
+
+
+def is_true(value) -> bool:
+    return str(value or "").lower() in ("1", "true")
+
+
+def wants_stream(request) -> bool:
+    return is_true(request.query_params.get("stream"))
+
+
+def parse_since(request, name: str) -> Optional[datetime]:
+    """
+    an optional ISO 8601 date or datetime query parameter, as an aware
+    datetime. dates are taken as midnight UTC.
+    """
+    value = request.query_params.get(name)
+    if not value:
+        return None
+
+    try:
+        since = parse_datetime(value)
+        if since is None:
+            date = parse_date(value)
+            since = datetime.combine(date, time.min) if date else None
+    except ValueError:
+        since = None
+
+    if since is None:
+        raise ValidationError({name: "Expected an ISO 8601 date or datetime. Example: 2023-07-01T00:00:00Z"})
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, timezone.utc)
+    return since
+
+
+def ndjson_lines(rows: Iterable[dict]):
+    for row in rows:
+        yield json.dumps(row, cls=NDJSONEncoder, separators=(",", ":")) + "\n"
+
+
+def ndjson_response(rows: Iterable[dict]) -> StreamingHttpResponse:
+    """
+    stream rows as newline delimited JSON. pass a queryset's
+    .iterator(chunk_size=STREAM_CHUNK_SIZE) so that rows are never all
+    in memory at once.
+    """
+    return StreamingHttpResponse(ndjson_lines(rows), content_type="application/x-ndjson")
@@ -14,13 +14,24 @@ import logging
 import requests
 
 # Django
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.conf import settings
 
 # Open edX
 from openedx.core.djangoapps.signals.signals import COURSE_GRADE_NOW_PASSED
 
+try:
+    # for olive and later
+    from xmodule.modulestore.django import SignalHandler
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore.django import SignalHandler
+
 # this repo
+from .discussion import delete_export
+from .models import BackgroundJob
+from .utils import invalidate_course_info
 
 log = logging.getLogger(__name__)
 log.info("openedx_plugin_api.signals loaded")
@@ -35,3 +46,22 @@ def listen_for_passing_grade(sender, user, course_id, **kwargs):  # pylint: disa
         "Enrolled student {username} has achieved a passing grade in the course"
         " {course_id} [{kwargs}]".format(username=user.username, course_id=course_id, kwargs=kwargs)
     )
+
+
+@receiver(SignalHandler.course_published, dispatch_uid="plugin_api_course_info")
+def refresh_course_info(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    drop the cached course info of a course that was published in this
+    process. publishing in Studio rebuilds the CourseOverview, which changes
+    the version that the cached info is keyed on.
+    """
+    invalidate_course_info(course_key)
+
+
+@receiver(post_delete, sender=BackgroundJob, dispatch_uid="plugin_api_delete_export")
+def delete_job_export(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    delete the part files of a discussion export along with its job.
+    """
+    if instance.job_type == "discussion_export":
+        delete_export(instance.checkpoint.get("parts", []))
@@ -0,0 +1,192 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          Celery tasks for the background jobs of the
+                openedx_plugin_api plugin.
+"""
+import logging
+from datetime import timedelta
+from uuid import uuid4
+
+from django.db import transaction
+from django.utils import timezone
+
+try:
+    # mcdaniel aug-2022: deprecated sometime after Lilac.
+    # see: https://docs.celeryq.dev/en/stable/internals/deprecation.html
+    from celery.task import task
+except ImportError:
+    from celery import shared_task as task
+
+from .bulk import run_bulk_action, summarize
+from .discussion import DiscussionExporter, discussion_setting, save_export_part, thread_key
+from .models import BackgroundJob
+from .pagination import ndjson_lines
+
+log = logging.getLogger(__name__)
+
+
+@task(name="openedx_plugin_api.tasks.run_bulk_enrollment_job", ignore_result=True)
+def run_bulk_enrollment_job(job_id: str) -> None:
+    """
+    run a bulk_enroll or bulk_unenroll BackgroundJob, saving its progress
+    after each batch.
+    """
+    try:
+        job = BackgroundJob.objects.get(id=job_id)
+    except BackgroundJob.DoesNotExist:
+        log.warning("run_bulk_enrollment_job() job {job_id} does not exist.".format(job_id=job_id))
+        return
+
+    job.status = BackgroundJob.STATUS_RUNNING
+    job.save(update_fields=["status", "modified"])
+
+    def progress(processed, results):
+        job.processed = processed
+        job.save(update_fields=["processed", "modified"])
+
+    try:
+        results = run_bulk_action(job.job_type, job.params.get("items", []), progress=progress)
+    except Exception as e:  # noqa: B902
+        log.exception("run_bulk_enrollment_job() job {job_id} failed.".format(job_id=job_id))
+        job.status = BackgroundJob.STATUS_FAILED
+        job.error = str(e)
+        job.save(update_fields=["status", "error", "modified"])
+        return
+
+    job.status = BackgroundJob.STATUS_SUCCEEDED
+    job.result = {"summary": summarize(results), "results": results}
+    job.save(update_fields=["status", "result", "modified"])
+
+
+def save_discussion_export_page(job_id: str, owner: str, page: int, num_pages: int, last, rows) -> bool:
+    """
+    save a page of a discussion export as a part file and checkpoint it,
+    holding the job's row lock, so that only the run that owns the job
+    writes to it. False if another run has claimed the job.
+    """
+    with transaction.atomic():
+        job = BackgroundJob.objects.select_for_update().filter(id=job_id).first()
+        if not job or job.checkpoint.get("owner") != owner:
+            return False
+        checkpoint = job.checkpoint
+        if rows:
+            part = len(checkpoint["parts"]) + 1
+            checkpoint["parts"].append(save_export_part(job_id, part, "".join(ndjson_lines(rows))))
+        checkpoint["page"] = page
+        checkpoint["last"] = last
+        checkpoint["rows"] += len(rows)
+        job.checkpoint = checkpoint
+        job.total = num_pages
+        job.processed = page
+        job.save(update_fields=["checkpoint", "total", "processed", "modified"])
+    return True
+
+
+def finish_discussion_export(job_id: str, owner: str, error: str = None) -> None:
+    with transaction.atomic():
+        job = BackgroundJob.objects.select_for_update().filter(id=job_id).first()
+        if not job or job.checkpoint.get("owner") != owner:
+            return
+        if error is not None:
+            job.status = BackgroundJob.STATUS_FAILED
+            job.error = error
+            job.save(update_fields=["status", "error", "modified"])
+            return
+        checkpoint = job.checkpoint
+        job.status = BackgroundJob.STATUS_SUCCEEDED
+        job.result = {
+            "summary": {"pages": checkpoint["page"], "rows": checkpoint["rows"]},
+            "parts": checkpoint["parts"],
+        }
+        job.save(update_fields=["status", "result", "modified"])
+
+
+def purge_discussion_exports() -> int:
+    """
+    delete the discussion export jobs that have not changed for
+    RETENTION_DAYS. deleting a job deletes its part files.
+    """
+    purge_before = timezone.now() - timedelta(days=discussion_setting("RETENTION_DAYS"))
+    deleted, _ = BackgroundJob.objects.filter(job_type="discussion_export", modified__lt=purge_before).delete()
+    return deleted
+
+
+@task(
+    name="openedx_plugin_api.tasks.run_discussion_export_job",
+    ignore_result=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def run_discussion_export_job(job_id: str) -> None:
+    """
+    export a course's discussion forum one page of threads at a time,
+    newest thread first. each page is saved as a part file and then
+    checkpointed with the oldest thread exported so far, so a job that is
+    redelivered after a worker restart, or resumed after a failure, picks
+    up after it. threads posted after the export started are left out.
+
+    each run claims the job with a new owner token, and stops writing as
+    soon as another run, such as the resume of a stalled job, claims it.
+    """
+    owner = uuid4().hex
+    with transaction.atomic():
+        job = BackgroundJob.objects.select_for_update().filter(id=job_id).first()
+        if not job:
+            log.warning("run_discussion_export_job() job {job_id} does not exist.".format(job_id=job_id))
+            return
+        if job.status == BackgroundJob.STATUS_SUCCEEDED:
+            return
+        checkpoint = job.checkpoint or {"page": 0, "parts": [], "rows": 0}
+        checkpoint["owner"] = owner
+        job.checkpoint = checkpoint
+        job.status = BackgroundJob.STATUS_RUNNING
+        job.error = ""
+        job.save(update_fields=["checkpoint", "status", "error", "modified"])
+
+    course_id = job.params["course_id"]
+    exporter = DiscussionExporter()
+    last = checkpoint.get("last")
+    page = checkpoint["page"] + 1
+    try:
+        summaries, num_pages = exporter.thread_page(course_id, page)
+        # threads deleted since the checkpoint move older threads onto
+        # earlier pages. step back until the page starts at the checkpoint.
+        while last and page > 1 and (not summaries or thread_key(summaries[0]) < last):
+            page -= 1
+            summaries, num_pages = exporter.thread_page(course_id, page)
+
+        while True:
+            summaries = [summary for summary in summaries if not last or thread_key(summary) < last]
+            rows = exporter.summary_rows(summaries)
+            if summaries:
+                last = min(thread_key(summary) for summary in summaries)
+            if not save_discussion_export_page(job_id, owner, page, num_pages, last, rows):
+                log.info("run_discussion_export_job() job {job_id} was claimed by another run.".format(job_id=job_id))
+                return
+            if page >= num_pages:
+                break
+            page += 1
+            summaries, num_pages = exporter.thread_page(course_id, page)
+    except Exception as e:  # noqa: B902
+        log.exception("run_discussion_export_job() job {job_id} failed.".format(job_id=job_id))
+        finish_discussion_export(job_id, owner, error=str(e))
+        return
+
+    finish_discussion_export(job_id, owner)
+    purge_discussion_exports()
+
+
+JOB_TASKS = {
+    "bulk_enroll": run_bulk_enrollment_job,
+    "bulk_unenroll": run_bulk_enrollment_job,
+    "discussion_export": run_discussion_export_job,
+}
+
+
+def queue_job(job: BackgroundJob) -> None:
+    JOB_TASKS[job.job_type].delay(str(job.id))
@@ -0,0 +1,143 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Jul-2023
+
+Tests of bulk enrollment and unenrollment, openedx_plugin_api.bulk, and of
+the enroll/bulk/ and unenroll/bulk/ api endpoints.
+"""
+# python stuff
+from unittest import mock
+
+# django stuff
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# open edx stuff
+from common.djangoapps.course_modes.models import CourseMode
+from common.djangoapps.student.models import CourseEnrollment
+from common.djangoapps.student.tests.factories import UserFactory
+from edx_toggles.toggles.testutils import override_waffle_switch
+from openedx.core.djangoapps.content.course_overviews.tests.factories import CourseOverviewFactory
+
+# our stuff
+from openedx_plugin_api.bulk import ensure_course_modes, enroll_batch, unenroll_batch
+from openedx_plugin_api.models import BackgroundJob
+from openedx_plugin_api.waffle import API_ENROLLMENT_WAFFLE
+
+
+class TestBulkEnrollment(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.course = CourseOverviewFactory.create()
+        self.alice = UserFactory.create(username="alice")
+        self.bob = UserFactory.create(username="bob")
+
+    def item(self, username, mode=None):
+        item = {"username": username, "course_id": str(self.course.id)}
+        if mode:
+            item["mode"] = mode
+        return item
+
+    def test_enroll_batch(self):
+        results = enroll_batch([self.item("alice", "honor"), self.item("bob")])
+
+        self.assertEqual([result["status"] for result in results], ["enrolled", "enrolled"])
+        self.assertTrue(CourseEnrollment.is_enrolled(self.alice, self.course.id))
+        self.assertEqual(CourseEnrollment.enrollment_mode_for_user(self.alice, self.course.id)[0], "honor")
+        self.assertTrue(CourseMode.objects.filter(course_id=self.course.id, mode_slug="honor").exists())
+
+    def test_enroll_batch_unchanged(self):
+        enroll_batch([self.item("alice", "honor")])
+
+        results = enroll_batch([self.item("alice", "honor")])
+
+        self.assertEqual(results[0]["status"], "unchanged")
+
+    def test_enroll_batch_errors(self):
+        results = enroll_batch(
+            [
+                self.item("nobody"),
+                {"username": "alice", "course_id": "not a course key"},
+                {"username": "alice", "course_id": "course-v1:edX+Missing+Course"},
+                self.item("bob"),
+            ]
+        )
+
+        self.assertEqual([result["status"] for result in results], ["error", "error", "error", "enrolled"])
+        self.assertEqual(results[0]["detail"], "unknown username")
+        self.assertEqual(results[1]["detail"], "unknown course_id")
+        self.assertEqual(results[2]["detail"], "unknown course_id")
+
+    def test_ensure_course_modes_ignores_concurrent_creation(self):
+        CourseMode.objects.create(course_id=self.course.id, mode_slug="honor", mode_display_name="Honor")
+
+        # another batch created the mode after this one looked for it.
+        with mock.patch.object(CourseMode.objects, "filter", return_value=CourseMode.objects.none()):
+            ensure_course_modes({(self.course.id, "honor")})
+
+        self.assertEqual(CourseMode.objects.filter(course_id=self.course.id, mode_slug="honor").count(), 1)
+
+    def test_unenroll_batch(self):
+        CourseEnrollment.enroll(self.alice, self.course.id)
+        CourseEnrollment.enroll(self.bob, self.course.id)
+        CourseEnrollment.unenroll(self.bob, self.course.id)
+
+        results = unenroll_batch([self.item("alice"), self.item("bob"), self.item("nobody")])
+
+        self.assertEqual([result["status"] for result in results], ["unenrolled", "unchanged", "error"])
+        self.assertEqual(results[2]["detail"], "enrollment not found")
+        self.assertFalse(CourseEnrollment.is_enrolled(self.alice, self.course.id))
+
+
+@override_waffle_switch(API_ENROLLMENT_WAFFLE, active=True)
+class TestBulkEnrollmentAPI(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.course = CourseOverviewFactory.create()
+        self.alice = UserFactory.create(username="alice")
+        self.client.force_authenticate(user=UserFactory.create(is_staff=True))
+
+    def post(self, name, data):
+        return self.client.post(reverse("openedx_plugin_api:{name}".format(name=name)), data, format="json")
+
+    def test_bulk_enroll(self):
+        response = self.post(
+            "openedx_plugin_api_bulk_enroll",
+            {"items": [{"username": "alice", "course_id": str(self.course.id)}, {"username": "nobody"}]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["response"]["summary"], {"enrolled": 1, "error": 1})
+        self.assertEqual([result["status"] for result in response.data["response"]["results"]], ["enrolled", "error"])
+        self.assertTrue(CourseEnrollment.is_enrolled(self.alice, self.course.id))
+
+    def test_bulk_unenroll(self):
+        CourseEnrollment.enroll(self.alice, self.course.id)
+
+        response = self.post(
+            "openedx_plugin_api_bulk_unenroll", {"items": [{"username": "alice", "course_id": str(self.course.id)}]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["response"]["summary"], {"unenrolled": 1})
+        self.assertFalse(CourseEnrollment.is_enrolled(self.alice, self.course.id))
+
+    def test_bulk_enroll_rejects_bad_items(self):
+        response = self.post("openedx_plugin_api_bulk_enroll", {"items": "alice"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_enroll_async(self):
+        with mock.patch("openedx_plugin_api.tasks.queue_job") as queue_job:
+            response = self.post(
+                "openedx_plugin_api_bulk_enroll",
+                {"items": [{"username": "alice", "course_id": str(self.course.id)}], "async": True},
+            )
+
+        self.assertEqual(response.status_code, 202)
+        job = BackgroundJob.objects.get(id=response.data["response"]["job_id"])
+        self.assertEqual(job.job_type, "bulk_enroll")
+        self.assertEqual(job.total, 1)
+        queue_job.assert_called_once_with(job)
@@ -0,0 +1,259 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Jul-2023
+
+Tests of the discussion forum export, against a local stub of the
+comments service.
+"""
+# python stuff
+import json
+from datetime import timedelta
+from unittest import mock
+
+# django stuff
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.test import TestCase
+from django.utils import timezone
+
+# our stuff
+from openedx_plugin_api.discussion import DiscussionExporter, read_export
+from openedx_plugin_api.models import BackgroundJob
+from openedx_plugin_api.tasks import purge_discussion_exports, run_discussion_export_job
+
+User = get_user_model()
+COURSE_ID = "course-v1:edX+DemoX+Demo_Course"
+
+
+def make_threads(author_id, commenter_id):
+    threads = {}
+    for i in range(5):
+        thread_id = "thread-{i}".format(i=i)
+        threads[thread_id] = {
+            "id": thread_id,
+            "course_id": COURSE_ID,
+            "title": "Thread {i}".format(i=i),
+            "body": "Body {i}".format(i=i),
+            "user_id": str(author_id),
+            "type": "thread",
+            "created_at": "2023-07-0{day}T00:00:00Z".format(day=i + 1),
+            "updated_at": "2023-07-01T00:00:00Z",
+            "votes": {"count": 0},
+            "comments_count": 2,
+            "children": [
+                {
+                    "id": "{thread_id}-response".format(thread_id=thread_id),
+                    "body": "Response",
+                    "user_id": str(commenter_id),
+                    "type": "comment",
+                    "children": [
+                        {
+                            "id": "{thread_id}-comment".format(thread_id=thread_id),
+                            "body": "Comment",
+                            "user_id": str(author_id),
+                            "type": "comment",
+                        }
+                    ],
+                }
+            ],
+        }
+    return threads
+
+
+class StubCommentClient:
+    """
+    the comment client calls of DiscussionExporter, two threads per page.
+    fail_on_page makes search_threads() fail, and on_page is called before
+    each search.
+    """
+
+    def __init__(self, threads):
+        self.threads = threads
+        self.requests = []
+        self.fail_on_page = None
+        self.on_page = None
+
+    def search_threads(self, course_id, page, per_page, sort_key="activity"):
+        self.requests.append(("search_threads", page))
+        if self.on_page:
+            self.on_page(page)
+        if page == self.fail_on_page:
+            raise ConnectionError("comments service is down")
+        if sort_key == "date":
+            ids = sorted(self.threads, key=lambda thread_id: self.threads[thread_id]["created_at"], reverse=True)
+        else:
+            ids = sorted(self.threads)
+        collection = [
+            {key: value for key, value in self.threads[thread_id].items() if key != "children"}
+            for thread_id in ids[(page - 1) * 2 : page * 2]
+        ]
+        return collection, (len(ids) + 1) // 2
+
+    def get_thread(self, thread_id):
+        self.requests.append(("get_thread", thread_id))
+        return self.threads[thread_id]
+
+
+class TestDiscussionExporter(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.commenter = User.objects.create_user("commenter", "commenter@example.com", "password")
+        self.client = StubCommentClient(make_threads(self.author.id, self.commenter.id))
+        self.exporter = DiscussionExporter(client=self.client, max_workers=4, chunk_size=2)
+
+    def fetched_threads(self):
+        return [thread_id for call, thread_id in self.client.requests if call == "get_thread"]
+
+    def test_rows(self):
+        with self.assertNumQueries(3):
+            rows = list(self.exporter.rows(COURSE_ID))
+
+        self.assertEqual(len(rows), 15)
+        self.assertEqual([row["id"] for row in rows[:3]], ["thread-0", "thread-0-response", "thread-0-comment"])
+        self.assertEqual([row["parent_id"] for row in rows[:3]], [None, "thread-0", "thread-0-response"])
+        self.assertEqual(
+            [row["email"] for row in rows[:3]], ["author@example.com", "commenter@example.com", "author@example.com"]
+        )
+        self.assertEqual(rows[0]["title"], "Thread 0")
+        self.assertEqual(rows[2]["char_count"], len("Comment"))
+        self.assertNotIn("user_id", rows[0])
+
+    def test_pool_threads_close_their_connections(self):
+        with mock.patch("openedx_plugin_api.discussion.connections") as connections:
+            list(self.exporter.rows(COURSE_ID))
+
+        # two more pages of threads, and five threads.
+        self.assertEqual(connections.close_all.call_count, 7)
+
+    def test_unknown_author(self):
+        self.client.threads["thread-0"]["user_id"] = None
+
+        rows = list(self.exporter.rows(COURSE_ID))
+
+        self.assertIn("email", rows[0])
+        self.assertIsNone(rows[0]["email"])
+        self.assertEqual(set(rows[0]), set(rows[1]))
+
+    def test_cached_threads(self):
+        list(self.exporter.rows(COURSE_ID))
+        self.client.requests = []
+
+        rows = list(self.exporter.rows(COURSE_ID))
+
+        self.assertEqual(len(rows), 15)
+        self.assertEqual(self.fetched_threads(), [])
+
+    def test_updated_thread(self):
+        list(self.exporter.rows(COURSE_ID))
+        self.client.threads["thread-3"]["updated_at"] = "2023-07-02T00:00:00Z"
+        self.client.threads["thread-3"]["children"] = []
+        self.client.requests = []
+
+        rows = list(self.exporter.rows(COURSE_ID))
+
+        self.assertEqual(len(rows), 13)
+        self.assertEqual(self.fetched_threads(), ["thread-3"])
+
+    def test_voted_thread(self):
+        list(self.exporter.rows(COURSE_ID))
+        self.client.threads["thread-1"]["votes"] = {"count": 1}
+        self.client.requests = []
+
+        rows = list(self.exporter.rows(COURSE_ID))
+
+        self.assertEqual(self.fetched_threads(), ["thread-1"])
+        self.assertEqual(rows[3]["votes"], 1)
+
+
+class TestDiscussionExportJob(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.commenter = User.objects.create_user("commenter", "commenter@example.com", "password")
+        self.client = StubCommentClient(make_threads(self.author.id, self.commenter.id))
+        self.job = BackgroundJob.objects.create(
+            job_type="discussion_export", requested_by=self.author, params={"course_id": COURSE_ID}
+        )
+        patcher = mock.patch(
+            "openedx_plugin_api.tasks.DiscussionExporter",
+            return_value=DiscussionExporter(client=self.client, max_workers=4, chunk_size=2),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        BackgroundJob.objects.filter(id=self.job.id).delete()
+        super().tearDown()
+
+    def run_job(self):
+        run_discussion_export_job(str(self.job.id))
+        self.job.refresh_from_db()
+
+    def exported_threads(self):
+        rows = [json.loads(line) for line in b"".join(read_export(self.job.checkpoint["parts"])).splitlines()]
+        return [row["id"] for row in rows if row["parent_id"] is None]
+
+    def test_export(self):
+        self.run_job()
+
+        self.assertEqual(self.job.status, BackgroundJob.STATUS_SUCCEEDED)
+        self.assertEqual(self.job.result["summary"], {"pages": 3, "rows": 15})
+        self.assertEqual(self.exported_threads(), ["thread-4", "thread-3", "thread-2", "thread-1", "thread-0"])
+
+    def test_resume_after_new_thread(self):
+        self.client.fail_on_page = 2
+        self.run_job()
+        self.assertEqual(self.job.status, BackgroundJob.STATUS_FAILED)
+        self.assertEqual(self.job.checkpoint["page"], 1)
+
+        # a new thread moves every thread one place down the pages.
+        self.client.threads["thread-5"] = dict(self.client.threads["thread-0"], created_at="2023-07-09T00:00:00Z")
+        self.client.threads["thread-5"]["id"] = "thread-5"
+        self.client.fail_on_page = None
+        self.run_job()
+
+        self.assertEqual(self.job.status, BackgroundJob.STATUS_SUCCEEDED)
+        self.assertEqual(self.exported_threads(), ["thread-4", "thread-3", "thread-2", "thread-1", "thread-0"])
+
+    def test_resume_after_deleted_thread(self):
+        self.client.fail_on_page = 2
+        self.run_job()
+
+        # deleting an exported thread moves every older thread one place up.
+        del self.client.threads["thread-4"]
+        self.client.fail_on_page = None
+        self.run_job()
+
+        self.assertEqual(self.job.status, BackgroundJob.STATUS_SUCCEEDED)
+        self.assertEqual(self.exported_threads(), ["thread-4", "thread-3", "thread-2", "thread-1", "thread-0"])
+
+    def test_claimed_by_another_run(self):
+        def claim(page):
+            # a resume of the job, while this run is still exporting page 2.
+            if page == 2:
+                job = BackgroundJob.objects.get(id=self.job.id)
+                job.checkpoint["owner"] = "other"
+                job.save()
+
+        self.client.on_page = claim
+        self.run_job()
+
+        self.assertEqual(self.job.status, BackgroundJob.STATUS_RUNNING)
+        self.assertEqual(self.job.checkpoint["owner"], "other")
+        self.assertEqual(self.job.checkpoint["page"], 1)
+        self.assertEqual(len(self.job.checkpoint["parts"]), 1)
+
+    def test_purge_deletes_expired_exports(self):
+        self.run_job()
+        parts = self.job.result["parts"]
+        BackgroundJob.objects.filter(id=self.job.id).update(modified=timezone.now() - timedelta(days=8))
+
+        self.assertEqual(purge_discussion_exports(), 1)
+
+        self.assertFalse(BackgroundJob.objects.filter(id=self.job.id).exists())
+        self.assertFalse(any(default_storage.exists(name) for name in parts))
@@ -7,9 +7,15 @@ date:           sep-2021
 
 usage:          custom LMS url endpoints for
                 openedx_plugin_api plugin
+
+                all endpoints are registered unconditionally. each group
+                returns 404 while its waffle switch is off, apart from the
+                status urls of background jobs.
 """
 from django.urls import path
 
+from openedx_plugin_common.switch_cache import gate_urlpatterns
+
 from . import api
 from .waffle import (
     waffle_switches,
@@ -25,43 +31,60 @@ from .waffle import (
 
 urlpatterns = []
 
-if waffle_switches[API_META]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path("meta/", api.APIInfoView.as_view(), name="openedx_plugin_api_meta"),
-    ]
+    ],
+    waffle_switches,
+    API_META,
+)
 
-if waffle_switches[API_USERS]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path("users/", api.UsersAPIView.as_view(), name="openedx_plugin_api_users"),
         path("users/update/", api.UsersProfileUpdateView.as_view(), name="openedx_plugin_api_users_update"),
-    ]
+    ],
+    waffle_switches,
+    API_USERS,
+)
 
-if waffle_switches[API_TOKEN]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path("token/", api.RefreshToken.as_view(), name="openedx_plugin_api_token"),
-    ]
+    ],
+    waffle_switches,
+    API_TOKEN,
+)
 
-if waffle_switches[API_ENROLLMENT]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path(
             "unenroll/",
             api.UnenrollUserAPIView.as_view(),
             name="openedx_plugin_api_unenroll",
         ),
         path("enroll/", api.EnrollUserAPIView.as_view(), name="openedx_plugin_api_enroll"),
-    ]
+        path("enroll/bulk/", api.BulkEnrollUserAPIView.as_view(), name="openedx_plugin_api_bulk_enroll"),
+        path("unenroll/bulk/", api.BulkUnenrollUserAPIView.as_view(), name="openedx_plugin_api_bulk_unenroll"),
+    ],
+    waffle_switches,
+    API_ENROLLMENT,
+)
 
-if waffle_switches[API_ASSOCIATE]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path(
             "associate/",
             api.AssociateUserOAuthAPIView.as_view(),
             name="openedx_plugin_api_associate",
         ),
-    ]
+    ],
+    waffle_switches,
+    API_ASSOCIATE,
+)
 
-if waffle_switches[API_PERMISSIONS]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path(
             "roles/grant/",
             api.CourseGrantRoleAccessAPIView.as_view(),
@@ -72,10 +95,13 @@ if waffle_switches[API_PERMISSIONS]:
             api.CourseRevokeRoleAccessAPIView.as_view(),
             name="openedx_plugin_api_revoke_permissions",
         ),
-    ]
+    ],
+    waffle_switches,
+    API_PERMISSIONS,
+)
 
-if waffle_switches[API_COURSE]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path(
             "course-mode/",
             api.CourseChangeModeAPIView.as_view(),
@@ -96,6 +122,11 @@ if waffle_switches[API_COURSE]:
             api.CourseInfoAPIView.as_view(),
             name="openedx_plugin_api_course_info",
         ),
+        path(
+            "courses/info/",
+            api.CoursesInfoAPIView.as_view(),
+            name="openedx_plugin_api_courses_info",
+        ),
         path(
             "course/<str:course_key>/points/",
             api.CoursePointsAPIView.as_view(),
@@ -116,10 +147,18 @@ if waffle_switches[API_COURSE]:
             api.DiscussionForum.as_view(),
             name="openedx_plugin_api_discussion",
         ),
-    ]
+        path(
+            "course/<str:course_id>/discussion/export/",
+            api.DiscussionExportAPIView.as_view(),
+            name="openedx_plugin_api_discussion_export",
+        ),
+    ],
+    waffle_switches,
+    API_COURSE,
+)
 
-if waffle_switches[API_STUDENT]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path(
             "student/<str:username>/course/<str:course_key>/modules/",
             api.StudentHistoryAPIView.as_view(),
@@ -130,4 +169,25 @@ if waffle_switches[API_STUDENT]:
             api.StudentCourseGradeAPIView.as_view(),
             name="openedx_plugin_api_student_course_grade",
         ),
-    ]
+        path(
+            "course/<str:course_key>/modules/",
+            api.CourseStudentsHistoryAPIView.as_view(),
+            name="openedx_plugin_api_course_student_modules",
+        ),
+        path(
+            "course/<str:course_key>/grades/",
+            api.CourseGradesAPIView.as_view(),
+            name="openedx_plugin_api_course_grades",
+        ),
+    ],
+    waffle_switches,
+    API_STUDENT,
+)
+
+# the background jobs started by the groups above. always on, and only
+# visible to the user who started the job or to staff.
+urlpatterns += [
+    path("jobs/<uuid:job_id>/", api.JobStatusAPIView.as_view(), name="openedx_plugin_api_job_status"),
+    path("jobs/<uuid:job_id>/resume/", api.JobResumeAPIView.as_view(), name="openedx_plugin_api_job_resume"),
+    path("jobs/<uuid:job_id>/download/", api.JobDownloadAPIView.as_view(), name="openedx_plugin_api_job_download"),
+]
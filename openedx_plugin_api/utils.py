@@ -10,10 +10,12 @@ usage:          utility and convenience functions for
 """
 # python stuff
 from datetime import datetime
+from typing import Dict, List
 from pytz import UTC
 import re
 
 # django stuff
+from django.core.cache import cache
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 
@@ -23,41 +25,50 @@ from openedx.core.djangoapps.user_api.accounts.utils import (
 )
 from opaque_keys.edx.keys import CourseKey
 from common.djangoapps.util.date_utils import get_default_time_display
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 
 try:
     # for olive and later
+    from xmodule.fields import Date
     from xmodule.modulestore.django import (
         modulestore,
     )  # lint-amnesty, pylint: disable=wrong-import-order
 except ImportError:
     # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.fields import Date
     from common.lib.xmodule.xmodule.modulestore.django import (
         modulestore,
     )  # lint-amnesty, pylint: disable=wrong-import-order
 
 
-def get_course_info(course_key: CourseKey):
+COURSE_INFO_CACHE_TTL = 60 * 15
+COURSE_INFO_CACHE_KEY = "openedx_plugin_api.course_info.{course_key}"
+
+
+def course_info_cache_key(course_key: CourseKey) -> str:
+    return COURSE_INFO_CACHE_KEY.format(course_key=course_key)
+
+
+def course_info_version(course_overview: CourseOverview) -> str:
     """
-    Generate a verbose json object of course
-    descriptive and meta data.
+    CourseOverview is rebuilt each time that the course is published, so
+    its modified timestamp stands in for the published version.
+    """
+    return course_overview.modified.isoformat()
 
-    editorial comment: you can create a course key in
-    Django shell as follows:
-    ----------------
-    from opaque_keys.edx.keys import CourseKey
-    course_key_str = "course-v1:edX+DemoX+Demo_Course"
-    course_key = CourseKey.from_string(course_key_str)
 
+def get_modulestore_course_info(course_key: CourseKey) -> Dict:
+    """
+    the parts of get_course_info() that CourseOverview doesn't have. loads
+    the course descriptor, and has_changes() walks the draft and published
+    trees, so the result is cached by get_course_infos().
     """
     store = modulestore()
     course_module = store.get_course(course_key)
-
     published = store.has_published_version(course_module)
 
-    course_json = {
+    return {
         "id": str(course_module.location),
-        "language": course_module.fields["language"].to_json(course_module.language),
-        "display_name": course_module.display_name_with_default,
         "published": published,
         "published_on": get_default_time_display(course_module.published_on)
         if published and course_module.published_on
@@ -65,15 +76,76 @@ def get_course_info(course_key: CourseKey):
         "edited_on": get_default_time_display(course_module.subtree_edited_on)
         if course_module.subtree_edited_on
         else None,
-        "released_to_students": datetime.now(UTC) > course_module.start,
         "has_explicit_staff_lock": course_module.fields["visible_to_staff_only"].is_set_on(course_module),
-        "start": course_module.fields["start"].to_json(course_module.start),
         "has_changes": store.has_changes(course_module),
         "group_access": course_module.group_access,
-        "certificate_available_date": course_module.certificate_available_date,
     }
 
-    return course_json
+
+def get_course_infos(course_keys: List[CourseKey]) -> Dict[CourseKey, Dict]:
+    """
+    get_course_info() of many courses, with one CourseOverview query and one
+    cache round trip. the modulestore is only read for courses that have
+    been published since their info was cached, or whose info has expired.
+    unpublished Studio edits show in has_changes and edited_on once the
+    info expires. courses that don't exist are left out.
+    """
+    course_overviews = CourseOverview.objects.in_bulk(course_keys)
+    cached = cache.get_many([course_info_cache_key(course_key) for course_key in course_overviews])
+
+    retval = {}
+    refreshed = {}
+    now = datetime.now(UTC)
+    for course_key, course_overview in course_overviews.items():
+        cache_key = course_info_cache_key(course_key)
+        version = course_info_version(course_overview)
+        entry = cached.get(cache_key)
+        if not entry or entry["version"] != version:
+            entry = {"version": version, "info": get_modulestore_course_info(course_key)}
+            refreshed[cache_key] = entry
+        info = entry["info"]
+
+        retval[course_key] = {
+            "id": info["id"],
+            "language": course_overview.language,
+            "display_name": course_overview.display_name_with_default,
+            "published": info["published"],
+            "published_on": info["published_on"],
+            "edited_on": info["edited_on"],
+            "released_to_students": bool(course_overview.start) and now > course_overview.start,
+            "has_explicit_staff_lock": info["has_explicit_staff_lock"],
+            "start": Date().to_json(course_overview.start),
+            "has_changes": info["has_changes"],
+            "group_access": info["group_access"],
+            "certificate_available_date": course_overview.certificate_available_date,
+        }
+
+    if refreshed:
+        cache.set_many(refreshed, COURSE_INFO_CACHE_TTL)
+    return retval
+
+
+def get_course_info(course_key: CourseKey):
+    """
+    Generate a verbose json object of course
+    descriptive and meta data.
+
+    editorial comment: you can create a course key in
+    Django shell as follows:
+    ----------------
+    from opaque_keys.edx.keys import CourseKey
+    course_key_str = "course-v1:edX+DemoX+Demo_Course"
+    course_key = CourseKey.from_string(course_key_str)
+
+    """
+    course_infos = get_course_infos([course_key])
+    if course_key not in course_infos:
+        raise CourseOverview.DoesNotExist("Course {course_key} does not exist.".format(course_key=course_key))
+    return course_infos[course_key]
+
+
+def invalidate_course_info(course_key: CourseKey) -> None:
+    cache.delete(course_info_cache_key(course_key))
 
 
 def grade_book_course_for_user(user):
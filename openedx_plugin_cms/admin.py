@@ -9,7 +9,7 @@ Admin registration for openedx_plugin_cms
 
 from django.contrib import admin
 
-from .models import CourseChangeLog, CourseAudit
+from .models import CourseChangeLog, CourseAudit, CourseAuditAsset, CourseAuditLink, CourseAuditSummary
 
 
 class CourseAuditAdmin(admin.ModelAdmin):
@@ -51,6 +51,79 @@ class CourseAuditAdmin(admin.ModelAdmin):
         return False
 
 
+class CourseAuditSummaryAdmin(admin.ModelAdmin):
+    """Admin for Audit Report summary rollups"""
+
+    ordering = ("course_id",)
+    search_fields = ["course_id", "org"]
+    list_filter = ("org",)
+    list_display = (
+        "course_id",
+        "org",
+        "row_count",
+        "modified",
+    )
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class CourseAuditLinkAdmin(admin.ModelAdmin):
+    """Admin for the external link inventory"""
+
+    ordering = ("-id",)
+    search_fields = ["course_id", "domain", "url"]
+    list_filter = ("active",)
+    list_display = (
+        "course_id",
+        "location",
+        "domain",
+        "url",
+        "first_seen",
+        "last_seen",
+        "active",
+    )
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class CourseAuditAssetAdmin(admin.ModelAdmin):
+    """Admin for course asset references"""
+
+    ordering = ("-id",)
+    search_fields = ["course_id", "asset_name", "reference"]
+    list_filter = ("kind",)
+    list_display = (
+        "course_id",
+        "location",
+        "kind",
+        "asset_name",
+        "reference",
+    )
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 class CourseChangeLogAdmin(admin.ModelAdmin):
     """Admin for course email."""
 
@@ -61,3 +134,6 @@ class CourseChangeLogAdmin(admin.ModelAdmin):
 
 admin.site.register(CourseChangeLog, CourseChangeLogAdmin)
 admin.site.register(CourseAudit, CourseAuditAdmin)
+admin.site.register(CourseAuditSummary, CourseAuditSummaryAdmin)
+admin.site.register(CourseAuditLink, CourseAuditLinkAdmin)
+admin.site.register(CourseAuditAsset, CourseAuditAssetAdmin)
@@ -69,8 +69,11 @@ class CustomPluginCMSConfig(AppConfig):
 
         from . import signals  # pylint: disable=unused-import
         from .__about__ import __version__
-        from .waffle import waffle_init
+        from .waffle import waffle_switches, WAFFLE_NAMESPACE
+        from django.core import checks
+        from openedx_plugin_common.switch_cache import connect_switch_invalidation, switch_check
 
         log.info("{label} {version} is ready.".format(label=self.label, version=__version__))
-        waffle_init()
+        connect_switch_invalidation()
+        checks.register(switch_check(waffle_switches, WAFFLE_NAMESPACE, "cms"))
         IS_READY = True
@@ -0,0 +1,117 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - course asset usage.
+
+CourseAuditAsset records every image, video source, pdf and /static/ or
+asset-v1: reference that the course audit finds in course content. The
+usage report compares the referenced asset names against the course's
+contentstore listing:
+    unused:  uploaded to the course, but not referenced by any block.
+    missing: referenced by a block, but not uploaded to the course.
+"""
+import logging
+from typing import Dict, Iterable
+
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_plugin_cms.links import normalized_location
+from openedx_plugin_cms.models import CourseAuditAsset
+from openedx_plugin_cms.utils import asset_name, modulestore
+
+log = logging.getLogger(__name__)
+
+# course settings that name an uploaded asset directly, rather than
+# referencing it from block content.
+COURSE_ASSET_FIELDS = ("course_image", "banner_image", "video_thumbnail_image")
+
+
+class AssetIndexWriter:
+    """
+    Rebuilds the CourseAuditAsset rows of one course while its audit
+    snapshot is being written. Call clear() once, then add_batch() with
+    each batch of AuditRows.
+    """
+
+    def __init__(self, course_key: CourseKey):
+        self.course_key = course_key
+
+    def clear(self) -> None:
+        CourseAuditAsset.objects.filter(course_id=self.course_key).delete()
+
+    def add_batch(self, rows: Iterable) -> None:
+        records = []
+        for row in rows:
+            if row.location is None:
+                continue
+            location = normalized_location(row.location)
+            for kind, reference in row.asset_references:
+                name = asset_name(reference)
+                records.append(
+                    CourseAuditAsset(
+                        course_id=self.course_key,
+                        location=location,
+                        kind=kind,
+                        reference=reference,
+                        asset_name=name[-255:] if name else None,
+                    )
+                )
+        CourseAuditAsset.objects.bulk_create(records)
+
+
+def uploaded_asset_names(course_key: CourseKey) -> set:
+    """
+    the names of all of the files uploaded to the course's Files & Uploads page.
+    """
+    try:
+        # for olive and later
+        from xmodule.contentstore.django import contentstore
+    except ImportError:
+        # for backward compatibility with nutmeg and earlier
+        from common.lib.xmodule.xmodule.contentstore.django import contentstore
+
+    assets, _ = contentstore().get_all_content_for_course(course_key)
+    retval = set()
+    for asset in assets:
+        asset_key = asset.get("asset_key")
+        retval.add(asset_key.block_id if asset_key else asset["_id"]["name"])
+    return retval
+
+
+def course_asset_names(course_key: CourseKey) -> set:
+    """
+    the asset names referenced by course settings, like the course card image.
+    """
+    course = modulestore().get_course(course_key, depth=0)
+    if not course:
+        return set()
+    return {getattr(course, field, None) for field in COURSE_ASSET_FIELDS} - {None, ""}
+
+
+def asset_usage_report(course_key: CourseKey) -> Dict:
+    """
+    set differences between the uploaded and the referenced assets of a course,
+    as of the most recent course audit.
+    """
+    references = {}
+    for name, location in (
+        CourseAuditAsset.objects.filter(course_id=course_key, asset_name__isnull=False)
+        .values_list("asset_name", "location")
+        .order_by("id")
+    ):
+        references.setdefault(name, []).append(str(location))
+
+    uploaded = uploaded_asset_names(course_key)
+    referenced = set(references) | course_asset_names(course_key)
+
+    missing = [{"asset_name": name, "locations": references.get(name, [])} for name in sorted(referenced - uploaded)]
+
+    return {
+        "course_id": str(course_key),
+        "uploaded_count": len(uploaded),
+        "referenced_count": len(referenced),
+        "unused": sorted(uploaded - referenced),
+        "missing": missing,
+    }
@@ -0,0 +1,119 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - external link inventory.
+
+CourseAuditLink normalizes the external links of each course block into
+one indexed row per block and url, so that questions like "which blocks
+link to domain X" are an index lookup on CourseAuditLink.domain rather
+than a LIKE '%...%' scan of CourseAudit.m_external_links.
+"""
+import logging
+from datetime import datetime
+from hashlib import md5
+from typing import Iterable
+
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from openedx_plugin_cms.models import CourseAuditLink
+from openedx_plugin_cms.utils import url_domain
+
+log = logging.getLogger(__name__)
+
+
+def url_hash(url: str) -> str:
+    return md5(url.encode("utf-8")).hexdigest()
+
+
+def normalized_location(location: UsageKey) -> UsageKey:
+    """
+    strip the branch and version of split modulestore locators so that
+    locations compare equal to the ones that we read back from the database.
+    """
+    if hasattr(location, "version_agnostic"):
+        location = location.version_agnostic()
+    if hasattr(location, "for_branch"):
+        location = location.for_branch(None)
+    return location
+
+
+class LinkIndexWriter:
+    """
+    Maintains the CourseAuditLink rows of one course while its audit
+    snapshot is being written. Call add_batch() with each batch of
+    AuditRows and finish() once all rows have been seen.
+    """
+
+    def __init__(self, course_key: CourseKey, seen_at: datetime):
+        self.course_key = course_key
+        self.seen_at = seen_at
+
+    def add_batch(self, rows: Iterable) -> None:
+        links = {}
+        for row in rows:
+            if row.location is None:
+                continue
+            location = normalized_location(row.location)
+            for url in row.external_links:
+                links[(location, url_hash(url))] = url
+        if not links:
+            return
+
+        # one query for the links that we already know about in this batch of blocks.
+        locations = {location for location, _ in links}
+        existing = CourseAuditLink.objects.filter(course_id=self.course_key, location__in=locations).values_list(
+            "id", "location", "url_hash"
+        )
+        seen_ids = []
+        for pk, location, hexdigest in existing:
+            if links.pop((location, hexdigest), None) is not None:
+                seen_ids.append(pk)
+
+        if seen_ids:
+            CourseAuditLink.objects.filter(id__in=seen_ids).update(last_seen=self.seen_at, active=True)
+
+        CourseAuditLink.objects.bulk_create(
+            [
+                CourseAuditLink(
+                    course_id=self.course_key,
+                    location=location,
+                    url=url,
+                    url_hash=hexdigest,
+                    domain=url_domain(url)[-255:],
+                    first_seen=self.seen_at,
+                    last_seen=self.seen_at,
+                )
+                for (location, hexdigest), url in links.items()
+            ]
+        )
+
+    def finish(self) -> None:
+        """
+        deactivate the links that this audit did not find.
+        """
+        retired = CourseAuditLink.objects.filter(
+            course_id=self.course_key, active=True, last_seen__lt=self.seen_at
+        ).update(active=False)
+        if retired:
+            log.info(
+                "Deactivated {retired} external links no longer found in course_key: {course_key}".format(
+                    retired=retired, course_key=self.course_key
+                )
+            )
+
+
+def link_dict(link: CourseAuditLink) -> dict:
+    """
+    JSON-serializable representation of a CourseAuditLink.
+    """
+    return {
+        "course_id": str(link.course_id),
+        "location": str(link.location),
+        "url": link.url,
+        "domain": link.domain,
+        "first_seen": link.first_seen.isoformat(),
+        "last_seen": link.last_seen.isoformat(),
+        "active": link.active,
+    }
@@ -0,0 +1,71 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+Management command to rebuild Course Audit summaries from the persisted
+Course Audit records, without re-analyzing course content. Intended as a
+one-time backfill for snapshots that predate CourseAuditSummary.
+"""
+# python
+import logging
+
+# django
+from django.core.management.base import BaseCommand, CommandError
+
+# open edx
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+# this repo
+from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_cms.summary import AuditSummaryCounter
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to rebuild Course Audit summaries.
+
+    Example usage:
+    ./manage.py cms course_audit_summary -c course-v1:edX+DemoX+Demo_Course
+    """
+
+    help = """
+    rebuild Course Audit summaries from persisted Course Audit records.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--course-key",
+            metavar="COURSE_KEY",
+            dest="course_key",
+            help="course run key. example: course-v1:edX+DemoX+Demo_Course",
+        )
+
+    def handle(self, *args, **options):
+        course_key = options.get("course_key")
+        if course_key:
+            try:
+                course_keys = [CourseKey.from_string(course_key)]
+            except InvalidKeyError as e:
+                raise CommandError("You must specify a valid course-key") from e
+        else:
+            course_keys = CourseAudit.objects.values_list("course_id", flat=True).distinct()
+
+        for course_key in course_keys:
+            summary = AuditSummaryCounter()
+            rows = CourseAudit.objects.filter(course_id=course_key).only(
+                "e2_block_type",
+                "g_section_weight",
+                "i_component_type",
+                "j_non_standard_element",
+                "m_iframe_external_url",
+                "m_external_links",
+            )
+            for row in rows.iterator():
+                summary.add(row)
+            summary.save(course_key)
+            log.info("Summarized course audit for {course_key}".format(course_key=course_key))
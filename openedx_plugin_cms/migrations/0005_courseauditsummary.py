@@ -0,0 +1,115 @@
+# coding=utf-8
+# Generated by Django 3.2.16 on 2022-10-19 14:02
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0004_auto_20211215_1645"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseAuditSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="modified",
+                    ),
+                ),
+                (
+                    "course_id",
+                    opaque_keys.edx.django.models.CourseKeyField(
+                        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+                        max_length=255,
+                        unique=True,
+                        verbose_name="course_id Course Key",
+                    ),
+                ),
+                (
+                    "org",
+                    models.CharField(
+                        db_index=True,
+                        help_text="The org of the course key. Example: edX",
+                        max_length=255,
+                        verbose_name="Organization",
+                    ),
+                ),
+                (
+                    "row_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="The number of CourseAudit rows in the snapshot.",
+                        verbose_name="Row Count",
+                    ),
+                ),
+                (
+                    "block_types",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Count of blocks by block type. Example: {'html': 12, 'problem': 4}",
+                        verbose_name="Block Types",
+                    ),
+                ),
+                (
+                    "external_domains",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Count of blocks linking to each external domain.",
+                        verbose_name="External Domains",
+                    ),
+                ),
+                (
+                    "iframe_domains",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Count of blocks embedding an iframe from each domain.",
+                        verbose_name="iFrame Domains",
+                    ),
+                ),
+                (
+                    "graded_weights",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Count of graded problems by section weight from the grading policy.",
+                        verbose_name="Graded Weights",
+                    ),
+                ),
+                (
+                    "non_standard_elements",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Count of non-standard elements by component type.",
+                        verbose_name="Non-standard Elements",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
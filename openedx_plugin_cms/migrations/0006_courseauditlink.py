@@ -0,0 +1,113 @@
+# coding=utf-8
+# Generated by Django 3.2.16 on 2022-10-20 09:37
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0005_courseauditsummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseAuditLink",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="modified",
+                    ),
+                ),
+                (
+                    "course_id",
+                    opaque_keys.edx.django.models.CourseKeyField(
+                        db_index=True,
+                        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+                        max_length=255,
+                        verbose_name="course_id Course Key",
+                    ),
+                ),
+                (
+                    "location",
+                    opaque_keys.edx.django.models.UsageKeyField(
+                        help_text="The block that contains the link.",
+                        max_length=255,
+                        verbose_name="Location Usage Key",
+                    ),
+                ),
+                (
+                    "url",
+                    models.TextField(
+                        help_text="The external url, as it appears in the block.",
+                        verbose_name="URL",
+                    ),
+                ),
+                (
+                    "url_hash",
+                    models.CharField(
+                        help_text="md5 hexdigest of url. urls can exceed the maximum length of an indexed column.",
+                        max_length=32,
+                        verbose_name="URL Hash",
+                    ),
+                ),
+                (
+                    "domain",
+                    models.CharField(
+                        db_index=True,
+                        help_text="The lower case hostname of url. Example: www.youtube.com",
+                        max_length=255,
+                        verbose_name="Domain",
+                    ),
+                ),
+                (
+                    "first_seen",
+                    models.DateTimeField(
+                        help_text="When a course audit first found this link.",
+                        verbose_name="First Seen",
+                    ),
+                ),
+                (
+                    "last_seen",
+                    models.DateTimeField(
+                        help_text="When a course audit most recently found this link.",
+                        verbose_name="Last Seen",
+                    ),
+                ),
+                (
+                    "active",
+                    models.BooleanField(
+                        db_index=True,
+                        default=True,
+                        help_text="False once the link no longer appears in the block.",
+                        verbose_name="Is Active",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("location", "url_hash")},
+            },
+        ),
+    ]
@@ -0,0 +1,95 @@
+# coding=utf-8
+# Generated by Django 3.2.16 on 2022-10-21 11:05
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0006_courseauditlink"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseAuditAsset",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="modified",
+                    ),
+                ),
+                (
+                    "course_id",
+                    opaque_keys.edx.django.models.CourseKeyField(
+                        db_index=True,
+                        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+                        max_length=255,
+                        verbose_name="course_id Course Key",
+                    ),
+                ),
+                (
+                    "location",
+                    opaque_keys.edx.django.models.UsageKeyField(
+                        help_text="The block that contains the reference.",
+                        max_length=255,
+                        verbose_name="Location Usage Key",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("image", "Image"), ("video", "Video"), ("pdf", "PDF"), ("other", "Other")],
+                        default="other",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "reference",
+                    models.TextField(
+                        help_text="The src or href, as it appears in the block. Example: /static/images/logo.png",
+                        verbose_name="Reference",
+                    ),
+                ),
+                (
+                    "asset_name",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text=(
+                            "The contentstore asset name that the reference points to, if it is a course asset."
+                            " Example: images_logo.png"
+                        ),
+                        max_length=255,
+                        null=True,
+                        verbose_name="Asset Name",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -190,6 +190,160 @@ class CourseAudit(TimeStampedModel):
     )
 
 
+class CourseAuditSummary(TimeStampedModel):
+    """
+    Aggregated counts of one course's most recent CourseAudit snapshot,
+    maintained by persist_analyzed_course(). Each count field is a JSON
+    dict of the form {"key": count}.
+    """
+
+    def __str__(self):
+        return f"{self.course_id}"
+
+    course_id = CourseKeyField(
+        max_length=255,
+        unique=True,
+        verbose_name="course_id Course Key",
+        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+    )
+    org = models.CharField(
+        max_length=255,
+        db_index=True,
+        verbose_name="Organization",
+        help_text="The org of the course key. Example: edX",
+    )
+    row_count = models.IntegerField(
+        default=0,
+        verbose_name="Row Count",
+        help_text="The number of CourseAudit rows in the snapshot.",
+    )
+    block_types = models.JSONField(
+        default=dict,
+        verbose_name="Block Types",
+        help_text="Count of blocks by block type. Example: {'html': 12, 'problem': 4}",
+    )
+    external_domains = models.JSONField(
+        default=dict,
+        verbose_name="External Domains",
+        help_text="Count of blocks linking to each external domain.",
+    )
+    iframe_domains = models.JSONField(
+        default=dict,
+        verbose_name="iFrame Domains",
+        help_text="Count of blocks embedding an iframe from each domain.",
+    )
+    graded_weights = models.JSONField(
+        default=dict,
+        verbose_name="Graded Weights",
+        help_text="Count of graded problems by section weight from the grading policy.",
+    )
+    non_standard_elements = models.JSONField(
+        default=dict,
+        verbose_name="Non-standard Elements",
+        help_text="Count of non-standard elements by component type.",
+    )
+
+
+class CourseAuditLink(TimeStampedModel):
+    """
+    Inventory of the external links found in course content, one row per
+    block and url. Maintained by persist_analyzed_course(): rows are
+    created the first time a link is seen, have last_seen refreshed on each
+    subsequent audit, and are marked inactive once the link disappears.
+    """
+
+    class Meta:
+        unique_together = ("location", "url_hash")
+
+    def __str__(self):
+        return f"{self.location}: {self.url}"
+
+    course_id = CourseKeyField(
+        max_length=255,
+        db_index=True,
+        verbose_name="course_id Course Key",
+        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+    )
+    location = UsageKeyField(
+        max_length=255,
+        verbose_name="Location Usage Key",
+        help_text="The block that contains the link.",
+    )
+    url = models.TextField(
+        verbose_name="URL",
+        help_text="The external url, as it appears in the block.",
+    )
+    url_hash = models.CharField(
+        max_length=32,
+        verbose_name="URL Hash",
+        help_text="md5 hexdigest of url. urls can exceed the maximum length of an indexed column.",
+    )
+    domain = models.CharField(
+        max_length=255,
+        db_index=True,
+        verbose_name="Domain",
+        help_text="The lower case hostname of url. Example: www.youtube.com",
+    )
+    first_seen = models.DateTimeField(
+        verbose_name="First Seen",
+        help_text="When a course audit first found this link.",
+    )
+    last_seen = models.DateTimeField(
+        verbose_name="Last Seen",
+        help_text="When a course audit most recently found this link.",
+    )
+    active = models.BooleanField(
+        default=True,
+        db_index=True,
+        verbose_name="Is Active",
+        help_text="False once the link no longer appears in the block.",
+    )
+
+
+class CourseAuditAsset(TimeStampedModel):
+    """
+    The asset references found in course content by the most recent course
+    audit, one row per block and reference. Rebuilt along with CourseAudit.
+    """
+
+    def __str__(self):
+        return f"{self.location}: {self.reference}"
+
+    KIND_IMAGE = "image"
+    KIND_VIDEO = "video"
+    KIND_PDF = "pdf"
+    KIND_OTHER = "other"
+    KINDS = [(KIND_IMAGE, "Image"), (KIND_VIDEO, "Video"), (KIND_PDF, "PDF"), (KIND_OTHER, "Other")]
+
+    course_id = CourseKeyField(
+        max_length=255,
+        db_index=True,
+        verbose_name="course_id Course Key",
+        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+    )
+    location = UsageKeyField(
+        max_length=255,
+        verbose_name="Location Usage Key",
+        help_text="The block that contains the reference.",
+    )
+    kind = models.CharField(max_length=16, choices=KINDS, default=KIND_OTHER)
+    reference = models.TextField(
+        verbose_name="Reference",
+        help_text="The src or href, as it appears in the block. Example: /static/images/logo.png",
+    )
+    asset_name = models.CharField(
+        max_length=255,
+        db_index=True,
+        verbose_name="Asset Name",
+        help_text=(  # noqa: B950
+            "The contentstore asset name that the reference points to, if it is a course asset."
+            " Example: images_logo.png"
+        ),
+        blank=True,
+        null=True,
+    )
+
+
 class CourseChangeLog(TimeStampedModel):
     class Meta:
         unique_together = ("location", "publication_date")
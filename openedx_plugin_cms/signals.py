@@ -25,23 +25,13 @@ try:
     # for olive and later
     # see: https://discuss.openedx.org/t/django-plugin-app-works-with-some-django-signals-but-not-others/5949/3
     from xmodule.modulestore.django import SignalHandler
-    from xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
 except ImportError:
     # for backward compatibility with nutmeg and earlier
     from common.lib.xmodule.xmodule.modulestore.django import SignalHandler
-    from common.lib.xmodule.xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-
-# this repo
-from .auditor import (
-    eval_course_block_changes,
-    write_log_delete_course,
-    write_log_delete_item,
-)
-from .utils import get_user
+
+# this repo: the auditor, and the contentstore and block_structure apis that
+# it depends on, are imported by the receivers on first use rather than
+# when this module is loaded from apps.ready().
 
 log = logging.getLogger(__name__)
 log.info("openedx_plugin_cms.signals loaded")
@@ -53,6 +43,8 @@ def _course_publisher_hander(course_key_str):
     """
     asynchronous task launcher
     """
+    from .auditor import eval_course_block_changes
+
     course_key = CourseKey.from_string(course_key_str)
     eval_course_block_changes(course_key)
 
@@ -62,6 +54,9 @@ def _plugin_listen_for_course_publish(sender, course_key, **kwargs):  # pylint:
     """
     Receives publishing signal and logs block meta data and the user
     """
+    from .auditor import eval_course_block_changes
+    from .utils import get_user
+
     user_id = kwargs.get("user_id")
     eval_course_block_changes(course_key, get_user(user_id))
     return
@@ -73,6 +68,9 @@ def _plugin_listen_for_course_delete(sender, course_key, **kwargs):  # pylint: d
     Catches the signal that a course has been deleted
     and logs the course_key and user
     """
+    from .auditor import write_log_delete_course
+    from .utils import get_user
+
     user_id = kwargs.get("user_id")
     write_log_delete_course(course_key, get_user(user_id))
     return
@@ -90,6 +88,9 @@ def _plugin_handle_item_deleted(**kwargs):
     Returns:
         None
     """
+    from .auditor import write_log_delete_item
+    from .utils import get_user
+
     usage_key = kwargs.get("usage_key")
     if usage_key:
         # Strip branch info
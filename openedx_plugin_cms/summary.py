@@ -0,0 +1,118 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - Course Audit summary rollups.
+
+A CourseAuditSummary row is maintained for each course whenever its audit
+snapshot is persisted. Org-level and platform-wide rollups are computed on
+read by adding up the per-course counts, which is a few thousand small rows
+at most, rather than scanning CourseAudit.
+"""
+import logging
+from collections import Counter
+from typing import Dict, Iterable
+
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_plugin_cms.models import CourseAuditSummary
+from openedx_plugin_cms.utils import url_domain
+
+log = logging.getLogger(__name__)
+
+# the Counter attributes of AuditSummaryCounter, which map 1:1 to the
+# JSONField columns of CourseAuditSummary.
+SUMMARY_COUNTERS = (
+    "block_types",
+    "external_domains",
+    "iframe_domains",
+    "graded_weights",
+    "non_standard_elements",
+)
+
+
+class AuditSummaryCounter:
+    """
+    Accumulates the summary counts of a course audit one row at a time, so
+    that the summary can be built while the snapshot is being written.
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        for attr in SUMMARY_COUNTERS:
+            setattr(self, attr, Counter())
+
+    def add(self, row) -> None:
+        """
+        row is an AuditRow or a CourseAudit record.
+        """
+        self.row_count += 1
+        self.block_types[row.e2_block_type] += 1
+
+        if row.m_external_links:
+            domains = {url_domain(url.strip()) for url in row.m_external_links.split(",\r\n")}
+            self.external_domains.update(domain for domain in domains if domain)
+
+        domain = url_domain(row.m_iframe_external_url or "")
+        if domain:
+            self.iframe_domains[domain] += 1
+
+        if row.g_section_weight is not None:
+            self.graded_weights[str(row.g_section_weight)] += 1
+
+        if row.j_non_standard_element:
+            self.non_standard_elements[row.i_component_type or row.e2_block_type] += 1
+
+    def save(self, course_key: CourseKey) -> CourseAuditSummary:
+        """
+        upsert the CourseAuditSummary for course_key.
+        """
+        defaults = {attr: dict(getattr(self, attr)) for attr in SUMMARY_COUNTERS}
+        defaults["org"] = course_key.org
+        defaults["row_count"] = self.row_count
+        summary, _ = CourseAuditSummary.objects.update_or_create(course_id=course_key, defaults=defaults)
+        return summary
+
+
+def summary_dict(summary: CourseAuditSummary) -> Dict:
+    """
+    JSON-serializable representation of one course summary.
+    """
+    retval = {
+        "course_id": str(summary.course_id),
+        "org": summary.org,
+        "row_count": summary.row_count,
+        "as_of": summary.modified.isoformat() if summary.modified else None,
+    }
+    for attr in SUMMARY_COUNTERS:
+        retval[attr] = getattr(summary, attr) or {}
+    return retval
+
+
+def rollup(summaries: Iterable[Dict]) -> Dict:
+    """
+    add up a collection of summary_dict() results, keyed by org, plus a
+    platform-wide total under the key "*".
+    """
+    totals = {}
+
+    def _add(key, summary):
+        if key not in totals:
+            totals[key] = {"course_count": 0, "row_count": 0}
+            totals[key].update({attr: Counter() for attr in SUMMARY_COUNTERS})
+        total = totals[key]
+        total["course_count"] += 1
+        total["row_count"] += summary["row_count"]
+        for attr in SUMMARY_COUNTERS:
+            total[attr].update(summary[attr])
+
+    for summary in summaries:
+        _add(summary["org"], summary)
+        _add("*", summary)
+
+    for total in totals.values():
+        for attr in SUMMARY_COUNTERS:
+            total[attr] = dict(total[attr].most_common())
+
+    return totals
@@ -0,0 +1,108 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Dec-2021
+
+CMS App - Celery tasks.
+
+Kept apart from the views so that celery and celery_utils are only
+imported by the workers, and by the views that actually launch a task.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.utils import DatabaseError
+
+try:
+    # mcdaniel aug-2022: deprecated sometime after Lilac.
+    # see: https://docs.celeryq.dev/en/stable/internals/deprecation.html
+    from celery.task import task
+except ImportError:
+    from celery import shared_task as task
+
+from celery.exceptions import SoftTimeLimitExceeded
+from celery_utils.persist_on_failure import LoggedPersistOnFailureTask
+from opaque_keys.edx.keys import CourseKey
+
+log = logging.getLogger(__name__)
+
+# Celery tasks constants
+LOCK_EXPIRE = 60 * 15
+KNOWN_RETRY_ERRORS = (  # Errors we expect occasionally, should be resolved on retry
+    DatabaseError,
+    ValidationError,
+    SoftTimeLimitExceeded,
+)
+RETRY_DELAY_SECONDS = 60
+TASK_TIME_LIMIT = LOCK_EXPIRE  # Task hard time limit in seconds. The worker
+# processing the task will be killed and
+# replaced with a new one when this is
+# exceeded.
+TASK_SOFT_TIME_LIMIT = (
+    None  # https://docs.celeryproject.org/en/stable/userguide/configuration.html#std-setting-task_soft_time_limit
+)
+MAX_RETRIES = 1
+
+
+@contextmanager
+def task_lock(oid, course_id):
+    """
+    mcdaniel dec-2021
+
+    Simple locking strategy to prevent the Course Audit refresh task
+    from being called repeatedly. This will limit invocations
+    of the refresh to once every LOCK_EXPIRE seconds.
+
+    See: https://docs.celeryproject.org/en/latest/tutorials/task-cookbook.html#cookbook-task-serial
+    """
+
+    course_id_hexdigest = md5(course_id.encode("utf-8")).hexdigest()
+    lock_id = "{0}-lock-{1}".format(course_id, course_id_hexdigest)
+    timeout_at = time.monotonic() + LOCK_EXPIRE - 3
+    # cache.add fails if the key already exists
+    status = cache.add(lock_id, oid, LOCK_EXPIRE)
+
+    try:
+        yield status
+    except Exception as e:  # noqa: B902
+        log.error("error while attempting lock: {err}".format(err=e))
+    finally:
+        if time.monotonic() < timeout_at and status:
+            # don't release the lock if we exceeded the timeout
+            # to lessen the chance of releasing an expired lock
+            # owned by someone else.
+            #
+            # also don't release the lock if we didn't acquire it
+            cache.delete(lock_id)
+
+
+@task(
+    bind=True,
+    base=LoggedPersistOnFailureTask,
+    # the task's name from when it was defined in views/course_audit.py, so
+    # that messages already queued under it are still consumed.
+    name="openedx_plugin_cms.views.course_audit._plugin_cms_course_audit_refresh",
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_DELAY_SECONDS,
+    routing_key=settings.DEFAULT_PRIORITY_QUEUE,  # 'edx.core.default'
+    acks_late=True,
+    task_time_limit=TASK_TIME_LIMIT,
+    task_soft_time_limit=TASK_SOFT_TIME_LIMIT,
+)
+def course_audit_refresh(self, course_id: str) -> None:
+    """
+    mcdaniel dec-2021.
+
+    launch a background task to refresh report data for course_key
+    """
+    from openedx_plugin_cms.views.course_audit import persist_analyzed_course
+
+    course_key = CourseKey.from_string(course_id)
+    if course_key:
+        log.info("refreshing report data for course_key: {course_id}".format(course_id=course_id))
+        persist_analyzed_course(course_key)
@@ -14,16 +14,30 @@ from .views.course_audit import (
     plugin_cms_course_audit_csv,
     plugin_cms_course_audit_refresh,
 )
+from .views.course_audit_assets import (
+    plugin_cms_course_audit_assets,
+    plugin_cms_course_audit_asset_usage,
+)
+from .views.course_audit_links import (
+    plugin_cms_course_audit_links,
+    plugin_cms_course_audit_links_course,
+)
+from .views.course_audit_summary import (
+    plugin_cms_course_audit_summary,
+    plugin_cms_course_audit_summary_course,
+)
 from .views.course_audit_html import (
     plugin_cms_course_audit_html,
     plugin_cms_course_audit_html_csv,
 )
+from openedx_plugin_common.switch_cache import gate_urlpatterns
+
 from .waffle import waffle_switches, AUDIT_REPORT
 
 urlpatterns = []
 
-if waffle_switches[AUDIT_REPORT]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         # Log paginated UI
         url(r"^log/$", plugin_cms_change_log, name="plugin_cms_change_log"),
         url(
@@ -54,6 +68,39 @@ if waffle_switches[AUDIT_REPORT]:
             plugin_cms_course_audit_refresh,
             name="plugin_cms_course_audit_refresh",
         ),
+        # Course Audit summary rollups (JSON)
+        url(
+            r"^audit/summary/$",
+            plugin_cms_course_audit_summary,
+            name="plugin_cms_course_audit_summary",
+        ),
+        url(
+            rf"^courses/{settings.COURSE_ID_PATTERN}/audit/summary/$",
+            plugin_cms_course_audit_summary_course,
+            name="plugin_cms_course_audit_summary_course",
+        ),
+        # Course Audit external link inventory (JSON)
+        url(
+            r"^audit/links/$",
+            plugin_cms_course_audit_links,
+            name="plugin_cms_course_audit_links",
+        ),
+        url(
+            rf"^courses/{settings.COURSE_ID_PATTERN}/audit/links/$",
+            plugin_cms_course_audit_links_course,
+            name="plugin_cms_course_audit_links_course",
+        ),
+        # Course Audit asset references and usage report (JSON)
+        url(
+            rf"^courses/{settings.COURSE_ID_PATTERN}/audit/assets/$",
+            plugin_cms_course_audit_assets,
+            name="plugin_cms_course_audit_assets",
+        ),
+        url(
+            rf"^courses/{settings.COURSE_ID_PATTERN}/audit/assets/usage/$",
+            plugin_cms_course_audit_asset_usage,
+            name="plugin_cms_course_audit_asset_usage",
+        ),
         # Course Audit paginated UI
         url(
             rf"^courses/{settings.COURSE_ID_PATTERN}/audit/$",
@@ -98,4 +145,7 @@ if waffle_switches[AUDIT_REPORT]:
             plugin_cms_course_audit_html_csv,
             name="plugin_cms_course_audit_html_csv",
         ),
-    ]
+    ],
+    waffle_switches,
+    AUDIT_REPORT,
+)
@@ -10,9 +10,10 @@ App Models
 import datetime as dt
 import logging
 from re import X
+from typing import TYPE_CHECKING, List, Tuple
 from lxml.html import fromstring
 from os.path import basename
-from urllib.parse import urlparse
+from urllib.parse import unquote, urlparse
 
 # django stuff
 from django.conf import settings
@@ -23,49 +24,80 @@ from xblock.fields import Boolean, String
 from xblock.core import XBlock
 from opaque_keys.edx.keys import UsageKey
 
-
-# open edx stuff
-from cms.djangoapps.contentstore.utils import get_lms_link_for_item
-
-try:
-    # for olive and later
-    from xmodule.modulestore.django import modulestore
-    from xmodule.course_module import (
-        CourseBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-except ImportError:
-    # for backward compatibility with nutmeg and earlier
-    from common.lib.xmodule.xmodule.modulestore.django import modulestore
-    from common.lib.xmodule.xmodule.course_module import (
-        CourseBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
+if TYPE_CHECKING:
+    from xmodule.course_module import CourseBlock
 
 # our stuff
-from .models import CourseChangeLog
+from .models import CourseAuditAsset, CourseChangeLog
 
 User = get_user_model()
 log = logging.getLogger(__name__)
 
 
-def link_extractor(html: str):
+def modulestore():
+    """
+    the platform modulestore. xmodule is imported on first use rather than
+    with this module, which is loaded with the CMS URLconf.
+    """
+    try:
+        # for olive and later
+        from xmodule.modulestore.django import modulestore as _modulestore
+    except ImportError:
+        # for backward compatibility with nutmeg and earlier
+        from common.lib.xmodule.xmodule.modulestore.django import modulestore as _modulestore
+
+    return _modulestore()
+
+
+def url_domain(url: str) -> str:
+    """
+    returns the lower case hostname of url, or "" if it doesn't have one.
+    """
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def extract_links(html: str) -> List[str]:
     """
     receives ´html´ from xblock.data
-    finds and returns a list of all external urls.
+    finds and returns a list of all external urls, in document order
+    and without duplicates.
     """
     try:
         doc = fromstring(html)
     except Exception:  # noqa: B902
-        return ""
+        return []
 
+    site_name = settings.SITE_NAME.lower()
     retval = []
     for _, _, link, _ in doc.iterlinks():
-        url = str(link).lower()
-        parsed_url = urlparse(url)
-        domain = str(parsed_url.netloc).lower()
-        if domain != "" and domain != settings.SITE_NAME.lower() and url not in retval:
+        url = str(link).strip()
+        try:
+            domain = str(urlparse(url).netloc).lower()
+        except ValueError:
+            continue
+        if domain != "" and domain != site_name and url not in retval:
             retval.append(url)
 
-    return ",\r\n".join(retval)
+    return retval
+
+
+def join_links(links: List[str]) -> str:
+    """
+    the legacy text representation of a list of links, as stored
+    in CourseAudit.m_external_links
+    """
+    return ",\r\n".join(dict.fromkeys(url.lower() for url in links))
+
+
+def link_extractor(html: str):
+    """
+    receives ´html´ from xblock.data
+    finds and returns a list of all external urls.
+    """
+    return join_links(extract_links(html))
 
 
 def asset_extractor(html: str):
@@ -80,13 +112,72 @@ def asset_extractor(html: str):
 
     retval = []
     for img in doc.xpath("//img"):
-        filename_and_path = img.attrib["src"]
-        filename = basename(filename_and_path)
-        retval.append(filename)
+        filename_and_path = img.attrib.get("src")
+        if filename_and_path:
+            retval.append(basename(filename_and_path))
     return ",\r\n".join(retval)
 
 
-def get_grade_weight(xblock: XBlock, course: CourseBlock):
+def asset_name(reference: str) -> str:
+    """
+    returns the contentstore asset name that reference points to, or None if
+    reference is not a course asset. Studio stores an uploaded file as a
+    single flat name, and rewrites the slashes of /static/ paths to
+    underscores. For example:
+        /static/images/logo.png -> images_logo.png
+        asset-v1:edX+DemoX+Demo_Course+type@asset+block@logo.png -> logo.png
+    """
+    absolute = "://" in reference
+    path = unquote(urlparse(reference).path if absolute else reference.split("?")[0].split("#")[0])
+    if "asset-v1:" in path and "block@" in path:
+        return path.rsplit("block@", 1)[-1] or None
+    if absolute:
+        # /static/ on another host is not a course asset.
+        return None
+    if path.startswith("/static/") or path.startswith("static/"):
+        return path.split("static/", 1)[-1].strip("/").replace("/", "_") or None
+    if path.startswith("/c4x/"):
+        # pre asset-v1 keys: /c4x/org/course/asset/name
+        return path.rsplit("/", 1)[-1] or None
+    return None
+
+
+def asset_kind(tag: str, reference: str) -> str:
+    if reference.split("?")[0].lower().endswith(".pdf"):
+        return CourseAuditAsset.KIND_PDF
+    if tag == "img":
+        return CourseAuditAsset.KIND_IMAGE
+    if tag in ("video", "source", "track"):
+        return CourseAuditAsset.KIND_VIDEO
+    return CourseAuditAsset.KIND_OTHER
+
+
+def extract_asset_references(html: str) -> List[Tuple[str, str]]:
+    """
+    receives ´html´ from xblock.data
+    finds and returns a list of (kind, reference) tuples, without duplicates,
+    for images, video sources and pdfs, plus any other link to a /static/
+    or asset-v1: course asset.
+    """
+    try:
+        doc = fromstring(html)
+    except Exception:  # noqa: B902
+        return []
+
+    retval = {}
+    for element, _, link, _ in doc.iterlinks():
+        reference = str(link).strip()
+        if not reference:
+            continue
+        kind = asset_kind(element.tag, reference)
+        if kind == CourseAuditAsset.KIND_OTHER and not asset_name(reference):
+            continue
+        retval.setdefault(reference, kind)
+
+    return [(kind, reference) for reference, kind in retval.items()]
+
+
+def get_grade_weight(xblock: XBlock, course: "CourseBlock"):
     """
     retrieve the problem weight from the grading policy
     based on Xblock type.
@@ -95,14 +186,17 @@ def get_grade_weight(xblock: XBlock, course: CourseBlock):
             {'min_count': 3, 'weight': 0.75, 'type': 'Homework', 'drop_count': 1, 'short_label': 'Ex'},
             {'short_label': '', 'min_count': 1, 'type': 'Exam', 'drop_count': 0, 'weight': 0.25}
         ]
+
+    returns a (weight, min_count) tuple, or (None, None) if the xblock is not graded.
     """
     if not hasattr(xblock, "format"):
-        return ""
+        return None, None
 
     grade_type = xblock.format
     for grade_type_dict in course.raw_grader:
         if grade_type_dict["type"] == grade_type:
-            return grade_type_dict["weight"], grade_type_dict["min_count"]
+            return float(grade_type_dict["weight"]), int(grade_type_dict["min_count"])
+    return None, None
 
 
 def get_ordinal_position(block_key: UsageKey, parent_key: UsageKey) -> int:
@@ -220,15 +314,19 @@ def get_xml_filename(xblock: XBlock) -> str:
     return ""
 
 
-def get_url(xblock: XBlock, app="cms") -> str:
+def get_url(xblock: XBlock, app="cms", parent: XBlock = None) -> str:
     """
     returns the application url to the corresponding
     page in the LMS/CMS for the xblock.
+
+    only cms urls need the parent xblock. callers that are already holding
+    it, like the course audit tree walk, can pass it in to save a
+    modulestore lookup.
     """
-    parent = modulestore().get_item(xblock.parent)
     host_url = get_host_url(app)
     course_key = str(xblock.location.course_key)
     if app == "cms":
+        parent = parent or modulestore().get_item(xblock.parent)
         if parent.category == "vertical":
             # https://cms.dev.engineplatform.co.uk/container/block-v1:edX+DemoX+Demo_Course+type@vertical+block@867dddb6f55d410caaa9c1eb9c6743ec
             return host_url + "/container/" + str(parent.location)
@@ -236,6 +334,8 @@ def get_url(xblock: XBlock, app="cms") -> str:
             # https://cms.dev.engineplatform.co.uk/course/course-v1:edX+DemoX+Demo_Course
             return host_url + "/course/" + course_key
     if app == "lms":
+        from cms.djangoapps.contentstore.utils import get_lms_link_for_item
+
         return "https:" + get_lms_link_for_item(xblock.location)
 
 
@@ -8,151 +8,87 @@ CMS App - Course Audit views
 also: https://docs.djangoproject.com/en/2.2/topics/pagination/
 """
 # Python stuff
-import time
+from __future__ import annotations
+
 import csv
 import logging
 from datetime import datetime
-from typing import Dict, List
-from contextlib import contextmanager
-from hashlib import md5
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from contextlib import closing
 
 # Django stuff
-from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.http import HttpResponse, JsonResponse
+from django.core.paginator import Page, Paginator
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth import get_user_model
-from django.db.utils import DatabaseError
-from django.core.exceptions import ValidationError
-from django.core.cache import cache
-
-# Celery
-try:
-    # mcdaniel aug-2022: deprecated sometime after Lilac.
-    # see: https://docs.celeryq.dev/en/stable/internals/deprecation.html
-    from celery.task import task
-except ImportError:
-    from celery import shared_task as task
-
-from celery.exceptions import SoftTimeLimitExceeded
-from celery_utils.persist_on_failure import LoggedPersistOnFailureTask
+from django.utils import timezone
 
 # Open edX stuff
 from common.djangoapps.util.views import ensure_valid_course_key
 from openedx.core.lib.cache_utils import request_cached
 from common.djangoapps.edxmako.shortcuts import render_to_response
-from cms.djangoapps.models.settings.course_grading import CourseGradingModel
-from opaque_keys.edx.keys import CourseKey
-from xblock.core import XBlock
-
-try:
-    # for olive and later
-    from xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.modulestore import (
-        ModuleStoreEnum,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.course_module import (
-        CourseBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.seq_module import (
-        SequenceBlock,
-        SectionBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.vertical_block import (
-        VerticalBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from xmodule.unit_block import UnitBlock  # Units are verticals.
-except ImportError:
-    # for backward compatibility with nutmeg and earlier
-    from common.lib.xmodule.xmodule.modulestore.django import (
-        modulestore,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.modulestore import (
-        ModuleStoreEnum,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.course_module import (
-        CourseBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.seq_module import (
-        SequenceBlock,
-        SectionBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.vertical_block import (
-        VerticalBlock,
-    )  # lint-amnesty, pylint: disable=wrong-import-order
-    from common.lib.xmodule.xmodule.unit_block import UnitBlock  # Units are verticals.
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+if TYPE_CHECKING:
+    # modulestore, xmodule and XBlock are imported on first use, in
+    # iter_analyzed_course(), so that they are not loaded with the CMS
+    # URLconf.
+    from xblock.core import XBlock
+    from xmodule.course_module import CourseBlock
+    from xmodule.seq_module import SequenceBlock, SectionBlock
+    from xmodule.vertical_block import VerticalBlock
 
 # This repo
-from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_cms.models import CourseAudit, CourseAuditAsset
+from openedx_plugin_cms.assets import AssetIndexWriter
+from openedx_plugin_cms.links import LinkIndexWriter
+from openedx_plugin_cms.summary import AuditSummaryCounter
 from openedx_plugin_cms.utils import (
-    get_user,
     xblock_edit_dates,
     get_url,
     get_problem_type,
     get_xml_filename,
     get_grade_weight,
     asset_extractor,
-    link_extractor,
+    asset_kind,
+    extract_asset_references,
+    extract_links,
+    join_links,
 )
 
 User = get_user_model()
 log = logging.getLogger(__name__)
 
 MAX_ROWS_PER_PAGE = 200
+PERSIST_BATCH_SIZE = 500
+CSV_COLUMNS = [
+    "a_order",
+    "b_course",
+    "c_module",
+    "d_section",
+    "e_unit",
+    "e2_block_type",
+    "f_graded",
+    "g_section_weight",
+    "h_number_graded_sections",
+    "i_component_type",
+    "j_non_standard_element",
+    "k_problem_weight",
+    "m_iframe_external_url",
+    "m_external_links",
+    "n_asset_type",
+    "o_unit_url",
+    "p_studio_url",
+    "q_xml_filename",
+    "r_publication_date",
+    "s_changed_by",
+    "t_change_made",
+]
 CACHE_NAMESPACE = "plugin.cms.CourseAudit.cache."
 
-# Celery tasks constants
-LOCK_EXPIRE = 60 * 15
-KNOWN_RETRY_ERRORS = (  # Errors we expect occasionally, should be resolved on retry
-    DatabaseError,
-    ValidationError,
-    SoftTimeLimitExceeded,
-)
-RETRY_DELAY_SECONDS = 60
-TASK_TIME_LIMIT = LOCK_EXPIRE  # Task hard time limit in seconds. The worker
-# processing the task will be killed and
-# replaced with a new one when this is
-# exceeded.
-TASK_SOFT_TIME_LIMIT = (
-    None  # https://docs.celeryproject.org/en/stable/userguide/configuration.html#std-setting-task_soft_time_limit
-)
-MAX_RETRIES = 1
-
-
-@contextmanager
-def task_lock(oid, course_id):
-    """
-    mcdaniel dec-2021
-
-    Simple locking strategy to prevent the Course Audit refresh task
-    from being called repeatedly. This will limit invocations
-    of the refresh to once every LOCK_EXPIRE seconds.
-
-    See: https://docs.celeryproject.org/en/latest/tutorials/task-cookbook.html#cookbook-task-serial
-    """
-
-    course_id_hexdigest = md5(course_id.encode("utf-8")).hexdigest()
-    lock_id = "{0}-lock-{1}".format(course_id, course_id_hexdigest)
-    timeout_at = time.monotonic() + LOCK_EXPIRE - 3
-    # cache.add fails if the key already exists
-    status = cache.add(lock_id, oid, LOCK_EXPIRE)
-
-    try:
-        yield status
-    except Exception as e:  # noqa: B902
-        log.error("error while attempting lock: {err}".format(err=e))
-    finally:
-        if time.monotonic() < timeout_at and status:
-            # don't release the lock if we exceeded the timeout
-            # to lessen the chance of releasing an expired lock
-            # owned by someone else.
-            #
-            # also don't release the lock if we didn't acquire it
-            cache.delete(lock_id)
-
 
 def get_csv_url(course_key, page_number=None):
     url = "/plugin/cms/courses/{course_id}/audit/csv/".format(course_id=str(course_key))
@@ -166,134 +102,184 @@ def get_refresh_url(course_key):
     return url
 
 
-def get_blank_dict() -> Dict:
+class AuditContext(NamedTuple):
     """
-    doing this as a means of documenting what the final output looks
-    like which we'll send to the Mako template.
+    The ancestor display names for a row of the course audit. One of these
+    is built per chapter, sequence and vertical, and is then shared by
+    reference by every row beneath it.
     """
-    row = {}
-    row["a_order"] = ""
-    row["b_course"] = ""
-    row["c_module"] = ""
-    row["d_section"] = ""
-    row["e_unit"] = ""
-    row["e2_block_type"] = ""
-    row["f_graded"] = "False"
-    row["g_section_weight"] = ""
-    row["h_number_graded_sections"] = ""
-    row["i_component_type"] = ""
-    row["j_non_standard_element"] = ""
-    row["k_problem_weight"] = ""
-    row["m_iframe_external_url"] = ""
-    row["m_external_links"] = ""
-    row["n_asset_type"] = ""
-    row["o_unit_url"] = ""
-    row["p_studio_url"] = ""
-    row["q_xml_filename"] = ""
-    row["r_publication_date"] = ""
-    row["s_changed_by"] = ""
-    row["t_change_made"] = ""
-
-    return row
-
-
-def get_chapter_dict(i: int, course: CourseBlock, chapter: SectionBlock) -> Dict:
-    row = get_blank_dict()
-    row["a_order"] = str(i)
-    row["b_course"] = course.display_name
-    row["c_module"] = chapter.display_name
-    row["e2_block_type"] = chapter.location.block_type
-    row["o_unit_url"] = get_url(chapter, "lms")
-    row["p_studio_url"] = get_url(chapter, "cms")
-    return row
-
-
-def get_sequence_dict(
-    i: int,
-    course: CourseBlock,
-    chapter: SectionBlock,
-    sequence: SequenceBlock,
-) -> Dict:
-    row = get_chapter_dict(i, course, chapter)
-    row["d_section"] = sequence.display_name
-    # e_unit -- skip. handled in get_vertical_dict()
-    row["e2_block_type"] = sequence.location.block_type
-    row["f_graded"] = sequence.graded if sequence.graded else ""
-    row["o_unit_url"] = get_url(sequence, "lms")
-    row["p_studio_url"] = get_url(sequence, "cms")
-    return row
-
-
-def get_vertical_dict(
-    i: int,
-    course: CourseBlock,
-    chapter: SectionBlock,
-    sequence: SequenceBlock,
-    vertical: VerticalBlock,
-) -> Dict:
-    row = get_sequence_dict(i, course, chapter, sequence)
-    row["e_unit"] = vertical.display_name
-    row["e2_block_type"] = vertical.location.block_type
-    row["f_graded"] = vertical.graded
-    # g_section_weight - skip. handled in parent loop, get_sequence_dict()
-    # h_number_graded_sections - skip. handled in parent loop, get_sequence_dict()
-    row["o_unit_url"] = get_url(vertical, "lms")
-    row["p_studio_url"] = get_url(vertical, "cms")
-    return row
-
-
-def get_vertical_child_dict(
+
+    b_course: str
+    c_module: str
+    d_section: str = ""
+    e_unit: str = ""
+
+
+class AuditRow(NamedTuple):
+    """
+    One row of the course audit, as we'll send it to the Mako template,
+    the csv export and CourseAudit. Attribute names match CourseAudit so
+    that the template and the csv writer work against either.
+
+    values are typed (int, bool, float, datetime, user id) all the way
+    through to persistence. formatting happens only at the edges: the
+    Mako template and the csv export.
+    """
+
+    a_order: int
+    context: AuditContext
+    e2_block_type: str
+    f_graded: bool = False
+    o_unit_url: str = ""
+    p_studio_url: str = ""
+    g_section_weight: Optional[float] = None
+    h_number_graded_sections: Optional[int] = None
+    i_component_type: str = ""
+    j_non_standard_element: bool = False
+    k_problem_weight: Optional[float] = None
+    m_iframe_external_url: str = ""
+    external_links: Tuple[str, ...] = ()
+    # (kind, reference) tuples. see extract_asset_references()
+    asset_references: Tuple[Tuple[str, str], ...] = ()
+    n_asset_type: str = ""
+    q_xml_filename: str = ""
+    r_publication_date: Optional[datetime] = None
+    s_changed_by_id: Optional[int] = None
+    t_change_made: Optional[datetime] = None
+    f_xblock_customized_html: Optional[str] = None
+    # resolved from s_changed_by_id at the rendering edge. see get_context()
+    s_changed_by: Optional[User] = None
+    location: Optional[UsageKey] = None
+
+    @property
+    def b_course(self) -> str:
+        return self.context.b_course
+
+    @property
+    def c_module(self) -> str:
+        return self.context.c_module
+
+    @property
+    def d_section(self) -> str:
+        return self.context.d_section
+
+    @property
+    def e_unit(self) -> str:
+        return self.context.e_unit
+
+    @property
+    def m_external_links(self) -> str:
+        return join_links(self.external_links)
+
+
+def get_chapter_row(i: int, context: AuditContext, course: CourseBlock, chapter: SectionBlock) -> AuditRow:
+    return AuditRow(
+        a_order=i,
+        context=context,
+        location=chapter.location,
+        e2_block_type=chapter.location.block_type,
+        o_unit_url=get_url(chapter, "lms"),
+        p_studio_url=get_url(chapter, "cms", parent=course),
+    )
+
+
+def get_sequence_row(i: int, context: AuditContext, chapter: SectionBlock, sequence: SequenceBlock) -> AuditRow:
+    return AuditRow(
+        a_order=i,
+        context=context,
+        location=sequence.location,
+        e2_block_type=sequence.location.block_type,
+        f_graded=bool(sequence.graded),
+        o_unit_url=get_url(sequence, "lms"),
+        p_studio_url=get_url(sequence, "cms", parent=chapter),
+    )
+
+
+def get_vertical_row(i: int, context: AuditContext, sequence: SequenceBlock, vertical: VerticalBlock) -> AuditRow:
+    # g_section_weight - skip. handled in the child rows, get_vertical_child_row()
+    # h_number_graded_sections - skip. handled in the child rows, get_vertical_child_row()
+    return AuditRow(
+        a_order=i,
+        context=context,
+        location=vertical.location,
+        e2_block_type=vertical.location.block_type,
+        f_graded=bool(vertical.graded),
+        o_unit_url=get_url(vertical, "lms"),
+        p_studio_url=get_url(vertical, "cms", parent=sequence),
+    )
+
+
+def get_vertical_child_row(
     i: int,
-    course: CourseBlock,
-    chapter: SectionBlock,
+    context: AuditContext,
     sequence: SequenceBlock,
     vertical: VerticalBlock,
     child: XBlock,
+    grade_weight: Tuple[Optional[float], Optional[int]],
     advanced_component_types: list,
-) -> Dict:
+) -> AuditRow:
     """
     Note that all of these parameters are descendants of XBlock, including child.
 
     child can be any of ProblemBlock, DiscussionXBlock, HtmlBlock (or some kind of specialized XBlock).
     Ideally we'd cast these after introspecting their type, but, we only need to extract a couple of pieces
     of data and so we'll defer that indefinitely until a real need arises.
+
+    grade_weight is the (weight, min_count) of the parent sequence, which is
+    looked up once per sequence rather than once per problem.
     """
     edited_on, published_on = xblock_edit_dates(child)
-    row = get_vertical_dict(i, course, chapter, sequence, vertical)
-    row["e2_block_type"] = child.location.block_type
+    block_type = child.location.block_type
+    fields = {}
 
     if hasattr(child, "data"):
-        row["f_xblock_customized_html"] = child.data
+        fields["f_xblock_customized_html"] = child.data
 
-    if child.location.block_type == "problem" and sequence.graded:
-        row["g_section_weight"], row["h_number_graded_sections"] = get_grade_weight(sequence, course)
-        row["k_problem_weight"] = str(child.weight or 1)
+    if block_type == "problem" and sequence.graded:
+        fields["g_section_weight"], fields["h_number_graded_sections"] = grade_weight
+        fields["k_problem_weight"] = float(child.weight or 1)
 
         component_type = get_problem_type(child)
-        row["i_component_type"] = component_type
-        row["j_non_standard_element"] = component_type if component_type in advanced_component_types else ""
-
-    if child.location.block_type == "html" and hasattr(child, "data"):
-        row["n_asset_type"] = asset_extractor(child.data)
-        row["m_external_links"] = link_extractor(child.data)
+        fields["i_component_type"] = component_type or ""
+        fields["j_non_standard_element"] = component_type in advanced_component_types
+
+    if block_type == "html" and hasattr(child, "data"):
+        fields["n_asset_type"] = asset_extractor(child.data)
+        fields["external_links"] = tuple(extract_links(child.data))
+
+    asset_references = []
+    if isinstance(getattr(child, "data", None), str):
+        asset_references += extract_asset_references(child.data)
+    if block_type == "video":
+        asset_references += [(CourseAuditAsset.KIND_VIDEO, src) for src in getattr(child, "html5_sources", None) or []]
+        if getattr(child, "handout", None):
+            asset_references.append((asset_kind("a", child.handout), child.handout))
+    fields["asset_references"] = tuple(asset_references)
 
     if hasattr(child, "html_file"):
-        row["m_iframe_external_url"] = child.html_file
-
-    row["o_unit_url"] = get_url(child, "lms")
-    row["p_studio_url"] = get_url(child, "cms")
-    row["q_xml_filename"] = get_xml_filename(child)
-    row["r_publication_date"] = published_on.strftime("%d-%b-%Y, %H:%M")
-    row["s_changed_by"] = get_user(child.edited_by) if child.edited_by > 0 else ""
-    row["t_change_made"] = edited_on.strftime("%d-%b-%Y, %H:%M")
-
-    return row
+        fields["m_iframe_external_url"] = child.html_file
+
+    return AuditRow(
+        a_order=i,
+        context=context,
+        location=child.location,
+        e2_block_type=block_type,
+        f_graded=bool(vertical.graded),
+        o_unit_url=get_url(child, "lms"),
+        p_studio_url=get_url(child, "cms", parent=vertical),
+        q_xml_filename=get_xml_filename(child),
+        r_publication_date=published_on,
+        # edited_by is a user id, or one of the negative ModuleStoreEnum.UserID sentinels
+        s_changed_by_id=child.edited_by if child.edited_by and child.edited_by > 0 else None,
+        t_change_made=edited_on,
+        **fields,
+    )
 
 
-def get_analyzed_course(course_key: CourseKey) -> List:
+def iter_analyzed_course(course_key: CourseKey) -> Iterator[AuditRow]:
     """
     Iterate the course blocks, in order of presentation, as you'd see in the
-    Course Outline page in CMS.
+    Course Outline page in CMS, yielding one AuditRow per block.
 
     The get_children() iterators in this def each return instantiated
     XBlock-derivative objects that vary in type depending on which level
@@ -303,11 +289,25 @@ def get_analyzed_course(course_key: CourseKey) -> List:
     objects returns any of a wide variety of XBlock derivatives. A common
     authoring pattern for graded problems is to create a
     series of html, problem, and discussion objects.
+
+    Rows are produced lazily so that callers only pay for what they consume.
+    Callers that stop early should close() the generator (see
+    contextlib.closing) so that the modulestore branch setting is restored.
     """
-    log.debug("get_context - Start: {course_key}".format(course_key=course_key))
+    from xblock.core import XBlock
+
+    try:
+        # for olive and later
+        from xmodule.modulestore.django import modulestore
+        from xmodule.modulestore import ModuleStoreEnum
+    except ImportError:
+        # for backward compatibility with nutmeg and earlier
+        from common.lib.xmodule.xmodule.modulestore.django import modulestore
+        from common.lib.xmodule.xmodule.modulestore import ModuleStoreEnum
+
+    log.debug("iter_analyzed_course - Start: {course_key}".format(course_key=course_key))
 
     store = modulestore()
-    retval = []
     i = 0
 
     # since we're auditing changes to published course content, we can
@@ -346,87 +346,168 @@ def get_analyzed_course(course_key: CourseKey) -> List:
         for chapter in course.get_children():
             # chapter is a SectionBlock
             i += 1
-            row = get_chapter_dict(i, course, chapter)
-            retval.append(row)
+            chapter_context = AuditContext(b_course=course.display_name, c_module=chapter.display_name)
+            yield get_chapter_row(i, chapter_context, course, chapter)
             for sequence in chapter.get_children():
                 # sequence is a SequenceBlock
                 i += 1
-                row = get_sequence_dict(i, course, chapter, sequence)
-                retval.append(row)
+                sequence_context = chapter_context._replace(d_section=sequence.display_name)
+                grade_weight = get_grade_weight(sequence, course) if sequence.graded else (None, None)
+                yield get_sequence_row(i, sequence_context, chapter, sequence)
                 for vertical in sequence.get_children():
                     # vertical is a VerticalBlock
                     i += 1
-                    row = get_vertical_dict(i, course, chapter, sequence, vertical)
-                    retval.append(row)
+                    vertical_context = sequence_context._replace(e_unit=vertical.display_name)
+                    yield get_vertical_row(i, vertical_context, sequence, vertical)
                     for child in vertical.get_children():
                         # child is any of ProblemBlock, DiscussionXBlock, HtmlBlock
                         # or an object that descends from one of these.
                         #
                         # it might also be something more esoteric like AnnotatableBlock, etc.
                         i += 1
-                        print("Analyzing content block: {course_key} - {i}".format(course_key=course_key, i=i))
-                        row = get_vertical_child_dict(
+                        log.debug("Analyzing content block: {course_key} - {i}".format(course_key=course_key, i=i))
+                        yield get_vertical_child_row(
                             i,
-                            course,
-                            chapter,
+                            vertical_context,
                             sequence,
                             vertical,
                             child,
+                            grade_weight,
                             ADVANCED_COMPONENT_TYPES,
                         )
-                        retval.append(row)
 
-    log.debug("get_context - End: {course_key}".format(course_key=course_key))
+    log.debug("iter_analyzed_course - End: {course_key}".format(course_key=course_key))
 
-    return retval
+
+def get_analyzed_course(course_key: CourseKey) -> List[AuditRow]:
+    """
+    returns the entire analyzed course as a list. prefer iter_analyzed_course()
+    unless you really need all of the rows at once.
+    """
+    return list(iter_analyzed_course(course_key))
+
+
+def _course_audit_record(course_key: CourseKey, row: AuditRow, known_user_ids) -> CourseAudit:
+    """
+    map an AuditRow to an unsaved CourseAudit record.
+    """
+    return CourseAudit(
+        course_id=course_key,
+        a_order=row.a_order,
+        b_course=row.b_course[-255:] if row.b_course is not None else None,
+        c_module=row.c_module[-255:] if row.c_module is not None else None,
+        d_section=row.d_section[-255:] if row.d_section is not None else None,
+        e_unit=row.e_unit[-255:] if row.e_unit is not None else None,
+        e2_block_type=row.e2_block_type[-255:] if row.e2_block_type is not None else None,
+        f_xblock_customized_html=row.f_xblock_customized_html,
+        f_graded=row.f_graded,
+        g_section_weight=row.g_section_weight,
+        h_number_graded_sections=row.h_number_graded_sections,
+        i_component_type=row.i_component_type[-255:] if row.i_component_type is not None else None,
+        j_non_standard_element=row.j_non_standard_element,
+        k_problem_weight=row.k_problem_weight,
+        m_iframe_external_url=row.m_iframe_external_url,
+        m_external_links=row.m_external_links,
+        n_asset_type=row.n_asset_type,
+        o_unit_url=row.o_unit_url,
+        p_studio_url=row.p_studio_url,
+        q_xml_filename=row.q_xml_filename[-255:] if row.q_xml_filename is not None else None,
+        r_publication_date=row.r_publication_date,
+        s_changed_by_id=row.s_changed_by_id if row.s_changed_by_id in known_user_ids else None,
+        t_change_made=row.t_change_made,
+    )
+
+
+def _persist_batch(course_key: CourseKey, batch: List[AuditRow]) -> None:
+    # edited_by might reference a user that has since been deleted. verify
+    # the distinct user ids of the batch in one query rather than one lookup per row.
+    user_ids = {row.s_changed_by_id for row in batch if row.s_changed_by_id}
+    known_user_ids = set(User.objects.filter(id__in=user_ids).values_list("id", flat=True))
+    CourseAudit.objects.bulk_create([_course_audit_record(course_key, row, known_user_ids) for row in batch])
+    log.debug("persisted rows: {first} - {last}".format(first=batch[0].a_order, last=batch[-1].a_order))
 
 
 def persist_analyzed_course(course_key: CourseKey) -> None:
     """
     write all records of an analyzed course to the database.
+
+    rows are consumed from iter_analyzed_course() and written in batches of
+    PERSIST_BATCH_SIZE, so memory use does not grow with the size of the course.
+    The delete and the inserts share a transaction so that the report never
+    shows a partially refreshed course. The course's CourseAuditSummary,
+    CourseAuditLink inventory and CourseAuditAsset references are maintained
+    in the same transaction.
     """
-    try:
+    summary = AuditSummaryCounter()
+    links = LinkIndexWriter(course_key, seen_at=timezone.now())
+    assets = AssetIndexWriter(course_key)
+
+    def flush(batch: List[AuditRow]) -> None:
+        _persist_batch(course_key, batch)
+        links.add_batch(batch)
+        assets.add_batch(batch)
+
+    with transaction.atomic():
         CourseAudit.objects.filter(course_id=course_key).delete()
-    except ObjectDoesNotExist:
-        log.info("No persisted records to replace for course_key: {course_key}".format(course_key=course_key))
-
-    course_audit = get_analyzed_course(course_key)
-    for row in course_audit:
-        user = User.objects.get(username=row["s_changed_by"]) if row["s_changed_by"] != "" else None
-
-        rec = CourseAudit.objects.create(
-            course_id=course_key,
-            a_order=int(row["a_order"]),
-            b_course=row["b_course"][-255:] if row["b_course"] is not None else None,
-            c_module=row["c_module"][-255:] if row["c_module"] is not None else None,
-            d_section=row["d_section"][-255:] if row["d_section"] is not None else None,
-            e_unit=row["e_unit"][-255:] if row["e_unit"] is not None else None,
-            e2_block_type=row["e2_block_type"][-255:] if row["e2_block_type"] is not None else None,
-            f_graded=row["f_graded"],
-            g_section_weight=float(row["g_section_weight"]) if row["g_section_weight"] != "" else None,
-            h_number_graded_sections=int(row["h_number_graded_sections"])
-            if row["h_number_graded_sections"] != ""
-            else None,
-            i_component_type=row["i_component_type"][-255:] if row["i_component_type"] is not None else None,
-            j_non_standard_element=row["j_non_standard_element"][-255:]
-            if row["j_non_standard_element"] is not None
-            else None,
-            k_problem_weight=float(row["k_problem_weight"]) if row["k_problem_weight"] != "" else None,
-            m_iframe_external_url=row["m_iframe_external_url"],
-            n_asset_type=row["n_asset_type"],
-            o_unit_url=row["o_unit_url"],
-            p_studio_url=row["p_studio_url"],
-            q_xml_filename=row["q_xml_filename"][-255:] if row["q_xml_filename"] is not None else None,
-            r_publication_date=datetime.strptime(row["r_publication_date"], "%d-%b-%Y, %H:%M")
-            if row["r_publication_date"] != ""
-            else None,
-            s_changed_by=user,
-            t_change_made=datetime.strptime(row["t_change_made"], "%d-%b-%Y, %H:%M")
-            if row["t_change_made"] != ""
-            else None,
-        )
-        rec.save()
-        print("persisted row: {i}".format(i=rec.a_order))
+        assets.clear()
+
+        batch = []
+        for row in iter_analyzed_course(course_key):
+            summary.add(row)
+            batch.append(row)
+            if len(batch) >= PERSIST_BATCH_SIZE:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+        summary.save(course_key)
+        links.finish()
+
+    log.info("persisted course audit for course_key: {course_key}".format(course_key=course_key))
+
+
+def get_live_page(course_key: CourseKey, page_number=None) -> Page:
+    """
+    analyze just enough of the course to render one page of the live report.
+
+    The tree walk stops one row past the end of the requested page; that
+    lookahead row tells the paginator whether there is a next page without
+    analyzing the remainder of the course. Consequently the paginator's
+    count and num_pages are lower bounds.
+    """
+    page_number = max(int(page_number or 1), 1)
+    bottom = (page_number - 1) * MAX_ROWS_PER_PAGE
+    with closing(iter_analyzed_course(course_key)) as rows:
+        object_list = list(islice(rows, bottom, bottom + MAX_ROWS_PER_PAGE + 1))
+
+    paginator = Paginator(range(bottom + len(object_list)), MAX_ROWS_PER_PAGE)
+    object_list = object_list[:MAX_ROWS_PER_PAGE]
+
+    # resolve the editors for this page only, in a single query.
+    users = User.objects.in_bulk({row.s_changed_by_id for row in object_list if row.s_changed_by_id})
+    object_list = [row._replace(s_changed_by=users.get(row.s_changed_by_id)) for row in object_list]
+    return Page(object_list, page_number, paginator)
+
+
+class Echo:
+    """
+    An object that implements just the write method of the file-like
+    interface, so that csv.writer hands each formatted row straight back.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv_rows(rows: Iterable) -> Iterator[str]:
+    """
+    lazily format course audit rows as csv text. rows may be either
+    CourseAudit records or AuditRow tuples.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        yield writer.writerow([getattr(row, column) for column in CSV_COLUMNS])
 
 
 def get_context(course_key: CourseKey, page_number=None, cached=True, report_message="") -> Dict:
@@ -436,16 +517,16 @@ def get_context(course_key: CourseKey, page_number=None, cached=True, report_mes
 
     report_as_of = ""
     if cached:
-        course_audit = CourseAudit.objects.filter(course_id=course_key).order_by("id")
+        course_audit = CourseAudit.objects.filter(course_id=course_key).select_related("s_changed_by").order_by("id")
         try:
             report_as_of = course_audit[0].created.strftime("%d-%b-%Y, %H:%M")
-        except ObjectDoesNotExist:
+        except (IndexError, ObjectDoesNotExist):
             pass
+        paginator = Paginator(course_audit, MAX_ROWS_PER_PAGE)
+        page = paginator.get_page(page_number)
     else:
-        course_audit = get_analyzed_course(course_key)
+        page = get_live_page(course_key, page_number)
         report_as_of = datetime.today().strftime("%d-%b-%Y, %H:%M")
-    paginator = Paginator(course_audit, MAX_ROWS_PER_PAGE)
-    page = paginator.get_page(page_number)
 
     # mcdaniel nov-2021
     # this is a workaround to buggy behavior with the paginator object.
@@ -494,65 +575,17 @@ def plugin_cms_course_audit_csv(request, course_id: str, **kwargs):
     Generate a csv download of CMS change log data
     """
     course_key = CourseKey.from_string(course_id)
-    output = CourseAudit.objects.filter(course_id=course_key).order_by("id")
+    output = (
+        CourseAudit.objects.filter(course_id=course_key)
+        .select_related("s_changed_by")
+        .order_by("id")
+        .iterator(chunk_size=PERSIST_BATCH_SIZE)
+    )
     filename = "openedx_plugin_cms_course_audit-{course_id}.csv".format(course_id=course_id)
 
-    response = HttpResponse(content_type="text/csv")
+    response = StreamingHttpResponse(iter_csv_rows(output), content_type="text/csv")
     response["Content-Disposition"] = "attachment; filename={filename}".format(filename=filename)
 
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "a_order",
-            "b_course",
-            "c_module",
-            "d_section",
-            "e_unit",
-            "e2_block_type",
-            "f_graded",
-            "g_section_weight",
-            "h_number_graded_sections",
-            "i_component_type",
-            "j_non_standard_element",
-            "k_problem_weight",
-            "m_iframe_external_url",
-            "m_external_links",
-            "n_asset_type",
-            "o_unit_url",
-            "p_studio_url",
-            "q_xml_filename",
-            "r_publication_date",
-            "s_changed_by",
-            "t_change_made",
-        ]
-    )
-    for row in output:
-        writer.writerow(
-            [
-                row.a_order,
-                row.b_course,
-                row.c_module,
-                row.d_section,
-                row.e_unit,
-                row.e2_block_type,
-                row.f_graded,
-                row.g_section_weight,
-                row.h_number_graded_sections,
-                row.i_component_type,
-                row.j_non_standard_element,
-                row.k_problem_weight,
-                row.m_iframe_external_url,
-                row.m_external_links,
-                row.n_asset_type,
-                row.o_unit_url,
-                row.p_studio_url,
-                row.q_xml_filename,
-                row.r_publication_date,
-                row.s_changed_by,
-                row.t_change_made,
-            ]
-        )
-
     return response
 
 
@@ -566,9 +599,11 @@ def plugin_cms_course_audit_refresh(request, course_id: str, **kwargs):
     """
     message = "An unknown error occurred."
     status = 500
+    from openedx_plugin_cms.tasks import course_audit_refresh, task_lock
+
     with task_lock(oid="plugin_cms_course_audit_refresh", course_id=course_id) as acquired:
         if acquired:
-            _plugin_cms_course_audit_refresh(course_id=course_id)
+            course_audit_refresh(course_id=course_id)
             message = "Report data refresh process was successfully initiated for course_key:" " {course_id}".format(
                 course_id=course_id
             )
@@ -579,25 +614,3 @@ def plugin_cms_course_audit_refresh(request, course_id: str, **kwargs):
 
     content = {"description": message}
     return JsonResponse(data=content, status=status)
-
-
-@task(
-    bind=True,
-    base=LoggedPersistOnFailureTask,
-    max_retries=MAX_RETRIES,
-    default_retry_delay=RETRY_DELAY_SECONDS,
-    routing_key=settings.DEFAULT_PRIORITY_QUEUE,  # 'edx.core.default'
-    acks_late=True,
-    task_time_limit=TASK_TIME_LIMIT,
-    task_soft_time_limit=TASK_SOFT_TIME_LIMIT,
-)
-def _plugin_cms_course_audit_refresh(self, course_id: str) -> None:
-    """
-    mcdaniel dec-2021.
-
-    launch a background task to refresh report data for course_key
-    """
-    course_key = CourseKey.from_string(course_id)
-    if course_key:
-        log.info("refreshing report data for course_key: {course_id}".format(course_id=course_id))
-        persist_analyzed_course(course_key)
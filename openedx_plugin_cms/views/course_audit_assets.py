@@ -0,0 +1,73 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - Course Audit asset usage views (JSON).
+
+Examples:
+    /plugin/cms/courses/course-v1:edX+DemoX+Demo_Course/audit/assets/
+    /plugin/cms/courses/course-v1:edX+DemoX+Demo_Course/audit/assets/usage/
+"""
+# Python stuff
+import logging
+
+# Django stuff
+from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.http import JsonResponse
+
+# Open edX stuff
+from common.djangoapps.util.views import ensure_valid_course_key
+from opaque_keys.edx.keys import CourseKey
+
+# This repo
+from openedx_plugin_cms.assets import asset_usage_report
+from openedx_plugin_cms.models import CourseAuditAsset
+
+log = logging.getLogger(__name__)
+
+MAX_ROWS_PER_PAGE = 200
+
+
+@login_required
+@ensure_valid_course_key
+def plugin_cms_course_audit_assets(request, course_id: str, **kwargs):
+    """
+    the asset references of a course, optionally filtered by ?kind= or ?asset_name=
+    """
+    course_key = CourseKey.from_string(course_id)
+    assets = CourseAuditAsset.objects.filter(course_id=course_key)
+    if request.GET.get("kind"):
+        assets = assets.filter(kind=request.GET["kind"])
+    if request.GET.get("asset_name"):
+        assets = assets.filter(asset_name=request.GET["asset_name"])
+
+    paginator = Paginator(assets.order_by("id"), MAX_ROWS_PER_PAGE)
+    page = paginator.get_page(request.GET.get("page"))
+    content = {
+        "course_id": course_id,
+        "count": paginator.count,
+        "page": page.number,
+        "num_pages": paginator.num_pages,
+        "results": [
+            {
+                "location": str(asset.location),
+                "kind": asset.kind,
+                "reference": asset.reference,
+                "asset_name": asset.asset_name,
+            }
+            for asset in page
+        ],
+    }
+    return JsonResponse(data=content)
+
+
+@login_required
+@ensure_valid_course_key
+def plugin_cms_course_audit_asset_usage(request, course_id: str, **kwargs):
+    """
+    unused and missing assets of a course, as of its most recent course audit.
+    """
+    course_key = CourseKey.from_string(course_id)
+    return JsonResponse(data=asset_usage_report(course_key))
@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - Course Audit external link inventory views (JSON).
+
+Examples:
+    /plugin/cms/audit/links/?domain=www.youtube.com
+    /plugin/cms/audit/links/?domain=youtube.com&subdomains=true&page=2
+    /plugin/cms/courses/course-v1:edX+DemoX+Demo_Course/audit/links/
+"""
+# Python stuff
+import logging
+
+# Django stuff
+from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.http import JsonResponse
+
+# Open edX stuff
+from common.djangoapps.util.views import ensure_valid_course_key
+from opaque_keys.edx.keys import CourseKey
+
+# This repo
+from openedx_plugin_cms.links import link_dict
+from openedx_plugin_cms.models import CourseAuditLink
+
+log = logging.getLogger(__name__)
+
+MAX_ROWS_PER_PAGE = 200
+
+
+def is_true(value) -> bool:
+    return str(value or "").lower() in ("1", "true")
+
+
+def get_context(links, request) -> dict:
+    """
+    one page of links, filtered by the common query parameters.
+    """
+    if not is_true(request.GET.get("include_inactive")):
+        links = links.filter(active=True)
+
+    paginator = Paginator(links.order_by("id"), MAX_ROWS_PER_PAGE)
+    page = paginator.get_page(request.GET.get("page"))
+    return {
+        "count": paginator.count,
+        "page": page.number,
+        "num_pages": paginator.num_pages,
+        "results": [link_dict(link) for link in page],
+    }
+
+
+@login_required
+def plugin_cms_course_audit_links(request, **kwargs):
+    """
+    every block, across all courses, that links to ?domain=. pass
+    subdomains=true to also match subdomains of domain, and
+    include_inactive=true to include links that have since been removed.
+    """
+    domain = (request.GET.get("domain") or "").strip().lower()
+    if not domain:
+        return JsonResponse(data={"description": "The domain parameter is required."}, status=400)
+
+    domain_filter = Q(domain=domain)
+    if is_true(request.GET.get("subdomains")):
+        domain_filter |= Q(domain__endswith="." + domain)
+
+    context = get_context(CourseAuditLink.objects.filter(domain_filter), request)
+    context["domain"] = domain
+    return JsonResponse(data=context)
+
+
+@login_required
+@ensure_valid_course_key
+def plugin_cms_course_audit_links_course(request, course_id: str, **kwargs):
+    """
+    the external link inventory of a single course, optionally filtered by ?domain=
+    """
+    course_key = CourseKey.from_string(course_id)
+    links = CourseAuditLink.objects.filter(course_id=course_key)
+    domain = (request.GET.get("domain") or "").strip().lower()
+    if domain:
+        links = links.filter(domain=domain)
+
+    context = get_context(links, request)
+    context["course_id"] = course_id
+    return JsonResponse(data=context)
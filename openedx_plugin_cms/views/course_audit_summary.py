@@ -0,0 +1,86 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2022
+
+CMS App - Course Audit summary views. JSON rollups of the most recent
+course audit snapshots, by course, by org and platform-wide.
+
+Examples:
+    /plugin/cms/audit/summary/
+    /plugin/cms/audit/summary/?org=edX
+    /plugin/cms/audit/summary/?domain=www.youtube.com&detail=true
+    /plugin/cms/audit/summary/?block_type=lti_consumer
+    /plugin/cms/courses/course-v1:edX+DemoX+Demo_Course/audit/summary/
+"""
+# Python stuff
+import logging
+
+# Django stuff
+from django.contrib.auth.decorators import login_required
+from django.db.models import Q
+from django.http import JsonResponse
+
+# Open edX stuff
+from common.djangoapps.util.views import ensure_valid_course_key
+from opaque_keys.edx.keys import CourseKey
+
+# This repo
+from openedx_plugin_cms.models import CourseAuditSummary
+from openedx_plugin_cms.summary import rollup, summary_dict
+
+log = logging.getLogger(__name__)
+
+
+@login_required
+def plugin_cms_course_audit_summary(request, **kwargs):
+    """
+    Org and platform-wide rollups of CourseAuditSummary, optionally filtered
+    to the courses that contain an org, an external or iframe domain, or a
+    block type. The matching course ids are always included; pass
+    detail=true for the per-course summaries as well.
+    """
+    org = request.GET.get("org")
+    domain = (request.GET.get("domain") or "").lower()
+    block_type = request.GET.get("block_type")
+    detail = request.GET.get("detail", "").lower() in ("1", "true")
+
+    summaries = CourseAuditSummary.objects.all().order_by("course_id")
+    if org:
+        summaries = summaries.filter(org=org)
+    if domain:
+        summaries = summaries.filter(Q(external_domains__has_key=domain) | Q(iframe_domains__has_key=domain))
+    if block_type:
+        summaries = summaries.filter(block_types__has_key=block_type)
+
+    courses = [summary_dict(summary) for summary in summaries]
+    content = {
+        "filters": {"org": org, "domain": domain or None, "block_type": block_type},
+        "course_count": len(courses),
+        "course_ids": [course["course_id"] for course in courses],
+        "orgs": rollup(courses),
+    }
+    if detail:
+        content["courses"] = courses
+
+    return JsonResponse(data=content)
+
+
+@login_required
+@ensure_valid_course_key
+def plugin_cms_course_audit_summary_course(request, course_id: str, **kwargs):
+    """
+    The CourseAuditSummary of a single course.
+    """
+    course_key = CourseKey.from_string(course_id)
+    try:
+        summary = CourseAuditSummary.objects.get(course_id=course_key)
+    except CourseAuditSummary.DoesNotExist:
+        content = {
+            "description": "No audit summary exists for course_key: {course_id}. Refresh the course audit.".format(
+                course_id=course_id
+            )
+        }
+        return JsonResponse(data=content, status=404)
+
+    return JsonResponse(data=summary_dict(summary))
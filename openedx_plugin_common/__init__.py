@@ -0,0 +1,12 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          plain python helpers shared by every plugin package. This
+                is not a Django app: it has no models and no AppConfig, so
+                that the LMS and CMS plugins can each use it without the
+                other being installed.
+"""
@@ -0,0 +1,185 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           jul-2023
+
+usage:          a short-lived, process-local cache of WaffleSwitch states,
+                shared by the waffle.py module of each plugin package.
+
+                Each package exposes its switches as
+
+                    waffle_switches = CachedSwitchStates({NAME: WaffleSwitch, ...})
+
+                which reads like the dict it replaces. States are read
+                lazily, so nothing touches the db at import time, and are
+                then served from memory for OPENEDX_PLUGIN_SWITCH_CACHE_TTL
+                seconds. Saving or deleting a waffle Switch invalidates the
+                cache of the process that made the change; every other
+                process picks the change up when its TTL expires.
+
+                Feature urls are always registered, and gated per request
+                with gate_urlpatterns(), so that toggling a switch does not
+                require a restart.
+"""
+import logging
+import time
+from collections.abc import Mapping
+from functools import wraps
+from typing import Dict, List
+
+from django.conf import settings
+from django.core import checks
+from django.http import Http404
+from django.urls import URLResolver
+from edx_toggles.toggles import WaffleSwitch
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SWITCH_CACHE_TTL = 5
+_instances = []
+
+
+def switch_cache_ttl() -> float:
+    return getattr(settings, "OPENEDX_PLUGIN_SWITCH_CACHE_TTL", DEFAULT_SWITCH_CACHE_TTL)
+
+
+def is_enabled(switch: WaffleSwitch) -> bool:
+    """
+    To resolve a race condition during application launch. The waffle_switches
+    are inspected before the db service has initialized.
+    """
+    try:
+        return switch.is_enabled()
+    except Exception:  # noqa: B902
+        return False
+
+
+class CachedSwitchStates(Mapping):
+    """
+    A read-only mapping of switch name to its current state (a bool).
+    """
+
+    def __init__(self, switches: Dict[str, WaffleSwitch]):
+        self._switches = dict(switches)
+        self._states = {}
+        self._expires_at = 0.0
+        _instances.append(self)
+
+    def __getitem__(self, name: str) -> bool:
+        if time.monotonic() >= self._expires_at:
+            self.refresh()
+        return self._states[name]
+
+    def __iter__(self):
+        return iter(self._switches)
+
+    def __len__(self) -> int:
+        return len(self._switches)
+
+    def refresh(self) -> None:
+        self._states = {name: is_enabled(switch) for name, switch in self._switches.items()}
+        self._expires_at = time.monotonic() + switch_cache_ttl()
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+
+def invalidate_switch_states(**kwargs) -> None:
+    """
+    post_save and post_delete receiver for the waffle Switch model.
+    """
+    for instance in _instances:
+        instance.invalidate()
+
+
+def switch_model():
+    """
+    the django-waffle Switch model.
+    """
+    try:
+        # django_waffle 3.x and later
+        from waffle import get_waffle_model
+
+        return get_waffle_model("SWITCH_MODEL")
+    except ImportError:
+        # for older versions of django-waffle
+        from waffle.models import Switch
+
+        return Switch
+
+
+def connect_switch_invalidation() -> None:
+    """
+    connect invalidate_switch_states() to the waffle Switch model. Called from
+    the ready() method of each plugin app; the dispatch_uid makes repeated
+    calls harmless.
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    Switch = switch_model()
+    post_save.connect(invalidate_switch_states, sender=Switch, dispatch_uid="openedx_plugin_switch_cache_save")
+    post_delete.connect(invalidate_switch_states, sender=Switch, dispatch_uid="openedx_plugin_switch_cache_delete")
+
+
+def switch_required(switches: Mapping, name: str):
+    """
+    view decorator that raises Http404 unless the switch is on.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped_view(request, *args, **kwargs):
+            if not switches[name]:
+                raise Http404
+            return view(request, *args, **kwargs)
+
+        return wrapped_view
+
+    return decorator
+
+
+def gate_urlpatterns(urlpatterns: List, switches: Mapping, name: str) -> List:
+    """
+    wrap the view of each url pattern, including those of nested includes,
+    with switch_required(). returns urlpatterns.
+    """
+    gate = switch_required(switches, name)
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            gate_urlpatterns(pattern.url_patterns, switches, name)
+        else:
+            pattern.callback = gate(pattern.callback)
+    return urlpatterns
+
+
+def switch_check(switches: Mapping, namespace: str, service: str = "lms"):
+    """
+    returns a Django system check that warns about switches of this plugin
+    that have no waffle Switch record, and which therefore cannot be toggled
+    from Django Admin. Register it from AppConfig.ready(). service is the
+    edxapp service that runs the plugin, "lms" or "cms", for the hint.
+    """
+
+    def check_waffle_switches(app_configs, **kwargs):
+        from django.db import DatabaseError
+
+        try:
+            existing = set(switch_model().objects.filter(name__in=list(switches)).values_list("name", flat=True))
+        except DatabaseError:
+            # the db is not available, for example during a docker build.
+            return []
+
+        return [
+            checks.Warning(
+                "WaffleSwitch {name} has not been initialized.".format(name=name),
+                hint="Run ./manage.py {service} {namespace}_init".format(service=service, namespace=namespace),
+                id="{namespace}.W001".format(namespace=namespace),
+            )
+            for name in switches
+            if name not in existing
+        ]
+
+    check_waffle_switches.__name__ = "check_{namespace}_waffle_switches".format(namespace=namespace)
+    return check_waffle_switches
@@ -80,8 +80,11 @@ class MobileApiConfig(AppConfig):
             return
 
         from .__about__ import __version__
-        from .waffle import waffle_init
+        from .waffle import waffle_switches, WAFFLE_NAMESPACE
+        from django.core import checks
+        from openedx_plugin_common.switch_cache import connect_switch_invalidation, switch_check
 
         log.info("{label} {version} is ready.".format(label=self.label, version=__version__))
-        waffle_init()
+        connect_switch_invalidation()
+        checks.register(switch_check(waffle_switches, WAFFLE_NAMESPACE, "lms"))
         IS_READY = True
@@ -1,7 +1,6 @@
 # encoding: UTF-8
 # python stuff
 import re
-from secure_logger.decorators import secure_logger
 
 # django stuff
 from django.shortcuts import redirect
@@ -12,10 +11,15 @@ from django.utils.deprecation import MiddlewareMixin
 from .waffle import waffle_switches, OVERRIDE_MOBILE_USER_API_URL
 from .const import PLUGIN_URL_PREFIX
 
+# every request passes through this middleware, so we reject anything outside
+# of the mobile api with a string prefix check before doing any other work.
+MOBILE_API_PATH_PREFIX = "/api/mobile/"
+
 # r'^/api/mobile/(?P<api_version>v(1|0.5))/users/(?P<username>[\\w .@_+-]+)(.+)$'
 MOBILE_API_USER_DETAIL_PATTERN = (
     r"^/api/mobile/(?P<api_version>v(1|0.5))/" + "users/" + settings.USERNAME_PATTERN + "(.+)$"
 )
+MOBILE_API_USER_DETAIL_REGEX = re.compile(MOBILE_API_USER_DETAIL_PATTERN)
 
 
 class MobileApiRedirectMiddleware(MiddlewareMixin):
@@ -27,19 +31,16 @@ class MobileApiRedirectMiddleware(MiddlewareMixin):
         redirect a request from edx-platform to this app
         see: https://stackoverflow.com/questions/42614172/how-to-redirect-from-a-view-to-another-view-in-django
         """
-        request_path = request.get_full_path()
-
-        if re.match(MOBILE_API_USER_DETAIL_PATTERN, request_path) and waffle_switches[OVERRIDE_MOBILE_USER_API_URL]:
-            # original path:                 /api/mobile/v1/users/admin?custom_param='foo'
-            # redirect path:  /openedx_plugin/api/mobile/v1/users/admin?custom_param='foo'
-            redirect_path = "/" + PLUGIN_URL_PREFIX + request_path
-            response = self.redirector(request_path=request_path, redirect_path=redirect_path)
-            return response
+        if request.path.startswith(MOBILE_API_PATH_PREFIX) and waffle_switches[OVERRIDE_MOBILE_USER_API_URL]:
+            request_path = request.get_full_path()
+            if MOBILE_API_USER_DETAIL_REGEX.match(request_path):
+                # original path:                 /api/mobile/v1/users/admin?custom_param='foo'
+                # redirect path:  /openedx_plugin/api/mobile/v1/users/admin?custom_param='foo'
+                redirect_path = "/" + PLUGIN_URL_PREFIX + request_path
+                return self.redirector(request_path=request_path, redirect_path=redirect_path)
 
-        response = self.get_response(request)
-        return response
+        return self.get_response(request)
 
-    @secure_logger()
     def redirector(self, request_path, redirect_path):
         """
         Notes: creating a 'permanent' redirect so that we return a 301 response which
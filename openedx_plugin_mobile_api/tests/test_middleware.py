@@ -0,0 +1,86 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Jul-2023
+
+Tests of openedx_plugin_mobile_api.middleware
+"""
+# python stuff
+import os
+import time
+from unittest import mock, skipUnless
+
+# django stuff
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+# our stuff
+from openedx_plugin_mobile_api.middleware import MobileApiRedirectMiddleware
+from openedx_plugin_mobile_api.waffle import OVERRIDE_MOBILE_USER_API_URL
+
+MIDDLEWARE_SWITCHES = "openedx_plugin_mobile_api.middleware.waffle_switches"
+
+
+class UnreadableSwitches(dict):
+    """
+    fails the test if the middleware reads a switch.
+    """
+
+    def __getitem__(self, name):
+        raise AssertionError("the middleware read waffle switch {name}".format(name=name))
+
+
+class TestMobileApiRedirectMiddleware(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.middleware = MobileApiRedirectMiddleware(lambda request: HttpResponse("passed through"))
+
+    def test_redirects_user_detail(self):
+        request = self.factory.get("/api/mobile/v1/users/admin", {"custom_param": "foo"})
+        with mock.patch(MIDDLEWARE_SWITCHES, {OVERRIDE_MOBILE_USER_API_URL: True}):
+            response = self.middleware(request)
+
+        assert response.status_code == 301
+        assert response["Location"] == "/openedx_plugin/api/mobile/v1/users/admin?custom_param=foo"
+
+    def test_switch_off_passes_through(self):
+        request = self.factory.get("/api/mobile/v1/users/admin")
+        with mock.patch(MIDDLEWARE_SWITCHES, {OVERRIDE_MOBILE_USER_API_URL: False}):
+            response = self.middleware(request)
+
+        assert response.status_code == 200
+
+    def test_other_mobile_paths_pass_through(self):
+        request = self.factory.get("/api/mobile/v1/course_info/course-v1:edX+DemoX+Demo_Course/updates")
+        with mock.patch(MIDDLEWARE_SWITCHES, {OVERRIDE_MOBILE_USER_API_URL: True}):
+            response = self.middleware(request)
+
+        assert response.status_code == 200
+
+    def test_non_mobile_paths_do_not_read_the_switch(self):
+        request = self.factory.get("/courses/course-v1:edX+DemoX+Demo_Course/courseware")
+        with mock.patch(MIDDLEWARE_SWITCHES, UnreadableSwitches()):
+            response = self.middleware(request)
+
+        assert response.status_code == 200
+
+    @skipUnless(os.environ.get("OPENEDX_PLUGIN_BENCHMARKS"), "set OPENEDX_PLUGIN_BENCHMARKS=1 to run benchmarks")
+    def test_fast_reject_benchmark(self):
+        """
+        micro-benchmark of the common case: a request that is not for the
+        mobile api. wall clock timings are unreliable on shared CI runners,
+        so this only runs on request.
+        """
+        iterations = 20000
+        request = self.factory.get("/dashboard", {"tab": "courses"})
+        middleware = MobileApiRedirectMiddleware(lambda request: None)
+
+        with mock.patch(MIDDLEWARE_SWITCHES, UnreadableSwitches()):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                middleware(request)
+            elapsed = time.perf_counter() - start
+
+        per_request = elapsed / iterations * 1000000
+        assert per_request < 50, "{per_request:.2f} usec/request".format(per_request=per_request)
@@ -5,11 +5,17 @@ URLs for mobile API
 
 
 from django.urls import include, path
+
+from openedx_plugin_common.switch_cache import gate_urlpatterns
+
 from .waffle import waffle_switches, OVERRIDE_MOBILE_USER_API_URL
 
 urlpatterns = []
 
-if waffle_switches[OVERRIDE_MOBILE_USER_API_URL]:
-    urlpatterns += [
+urlpatterns += gate_urlpatterns(
+    [
         path("users/", include("openedx_plugin_mobile_api.users.urls")),
-    ]
+    ],
+    waffle_switches,
+    OVERRIDE_MOBILE_USER_API_URL,
+)
@@ -13,6 +13,8 @@ import logging
 
 from edx_toggles.toggles import WaffleSwitch
 
+from openedx_plugin_common.switch_cache import CachedSwitchStates
+
 log = logging.getLogger(__name__)
 WAFFLE_NAMESPACE = "openedx_plugin_mobile_api"
 
@@ -43,28 +45,23 @@ def is_ready():
         return False
 
 
-def is_enabled(switch: WaffleSwitch) -> bool:
-    """
-    To resolve a race condition during application launch. The waffle_switches
-    are inspected before the db service has initialized.
-    """
-    try:
-        return switch.is_enabled()
-    except Exception:  # noqa: B902
-        return False
-
-
-waffle_switches = {
-    OVERRIDE_MOBILE_USER_API_URL: is_enabled(OVERRIDE_MOBILE_USER_API_URL_WAFFLE),
-}
+# switch states are read lazily and cached briefly. see openedx_plugin_common.switch_cache
+waffle_switches = CachedSwitchStates(
+    {
+        OVERRIDE_MOBILE_USER_API_URL: OVERRIDE_MOBILE_USER_API_URL_WAFFLE,
+    }
+)
 
 
 def waffle_init():
     """
     Bootstrapper for the WaffleSwitch objects defined in this module. Iterate
-    all WaffleSwitch objects, create any that are missing. This is called once
-    from apps.CustomPluginConfig.ready() during application launch to ensure
-    that WaffleSwitch objects exist in Django Admin for all switches.
+    all WaffleSwitch objects, create any that are missing, so that
+    WaffleSwitch objects exist in Django Admin for all switches. This is called
+    from the <namespace>_init management command rather than from
+    apps.CustomPluginConfig.ready(), so that application launch does not query
+    the database. The <namespace>.W001 system check reports switches that have
+    not been initialized.
 
     Note that django-waffle actually includes a handy setting,
     WAFFLE_CREATE_MISSING_FLAGS, that **could** do this for us automatically.